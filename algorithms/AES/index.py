@@ -1,5 +1,8 @@
+from array import array
+
 from .constants import SBOX, INV_SBOX, RCON
-from algorithms.utils.index import string_a_bytes
+from algorithms.utils.index import a_bytes, vista_bytes, dividir_bloques
+from algorithms.utils.cache import CACHE_CLAVES, borrar_material_clave
 
 
 def agregar_clave_ronda(estado, clave_ronda):
@@ -184,38 +187,327 @@ def mezclar_columnas(estado):
     return resultado
 
 
-# Funciones main
+# Motor de tablas T
+# Cada ronda fusiona SubBytes, ShiftRows y MixColumns en 16 consultas a tablas
+# de 32 bits; el estado se mantiene como cuatro palabras (una por columna).
+
+
+def rotar_palabra(palabra, bits):
+    return ((palabra >> bits) | (palabra << (32 - bits))) & 0xFFFFFFFF
+
+
+def generar_tablas_columna(caja, coeficientes):
+    tabla_base = []
+    for byte in caja:
+        palabra = 0
+        for coeficiente in coeficientes:
+            palabra = (palabra << 8) | multiplicar_galois(coeficiente, byte)
+        tabla_base.append(palabra)
+    return [[rotar_palabra(p, 8 * k) for p in tabla_base] if k else tabla_base for k in range(4)]
 
 
-def AES_cifrar(texto_plano, clave):
-    bytes_texto_plano = string_a_bytes(texto_plano)
-    bytes_clave = string_a_bytes(clave)
-    relleno_necesario = (16 - (len(bytes_texto_plano) % 16)) % 16
-    bytes_texto_plano = bytes_texto_plano + [0] * relleno_necesario
+# T0[x] = (02·S[x], S[x], S[x], 03·S[x]); T1..T3 son rotaciones de T0
+T0, T1, T2, T3 = generar_tablas_columna(SBOX, (0x02, 0x01, 0x01, 0x03))
+# TMI0[x] = (0E·x, 09·x, 0D·x, 0B·x): columna de InvMixColumns por byte de entrada
+TMI0, TMI1, TMI2, TMI3 = generar_tablas_columna(range(256), (0x0E, 0x09, 0x0D, 0x0B))
+# TD0[x] = (0E·IS[x], 09·IS[x], 0D·IS[x], 0B·IS[x]); TD1..TD3 son rotaciones de TD0
+TD0, TD1, TD2, TD3 = generar_tablas_columna(INV_SBOX, (0x0E, 0x09, 0x0D, 0x0B))
 
-    claves_ronda = expansion_clave(bytes_clave)
 
-    bytes_texto_cifrado = []
-    for i in range(0, len(bytes_texto_plano), 16):
-        bloque = bytes_texto_plano[i: i + 16]
-        bloque_cifrado = aes_cifrar_bloque(bloque, claves_ronda)
-        bytes_texto_cifrado.extend(bloque_cifrado)
+def claves_ronda_a_palabras(claves_ronda):
+    return [
+        (clave[0][j] << 24) | (clave[1][j] << 16) | (clave[2][j] << 8) | clave[3][j]
+        for clave in claves_ronda
+        for j in range(4)
+    ]
+
 
-    return bytes_texto_cifrado
+def palabras_a_bytes(s0, s1, s2, s3):
+    return list(((s0 << 96) | (s1 << 64) | (s2 << 32) | s3).to_bytes(16, "big"))
 
 
-def AES_descifrar(bytes_texto_cifrado, clave):
-    bytes_clave = string_a_bytes(clave)
+def aes_cifrar_bloque_tablas(bloque, palabras_ronda):
+    entero = int.from_bytes(bytes(bloque), "big")
+    s0 = (entero >> 96) ^ palabras_ronda[0]
+    s1 = ((entero >> 64) & 0xFFFFFFFF) ^ palabras_ronda[1]
+    s2 = ((entero >> 32) & 0xFFFFFFFF) ^ palabras_ronda[2]
+    s3 = (entero & 0xFFFFFFFF) ^ palabras_ronda[3]
+
+    for k in range(4, 40, 4):
+        s0, s1, s2, s3 = (
+            T0[s0 >> 24] ^ T1[(s1 >> 16) & 0xFF] ^ T2[(s2 >> 8) & 0xFF] ^ T3[s3 & 0xFF] ^ palabras_ronda[k],
+            T0[s1 >> 24] ^ T1[(s2 >> 16) & 0xFF] ^ T2[(s3 >> 8) & 0xFF] ^ T3[s0 & 0xFF] ^ palabras_ronda[k + 1],
+            T0[s2 >> 24] ^ T1[(s3 >> 16) & 0xFF] ^ T2[(s0 >> 8) & 0xFF] ^ T3[s1 & 0xFF] ^ palabras_ronda[k + 2],
+            T0[s3 >> 24] ^ T1[(s0 >> 16) & 0xFF] ^ T2[(s1 >> 8) & 0xFF] ^ T3[s2 & 0xFF] ^ palabras_ronda[k + 3],
+        )
+
+    return palabras_a_bytes(
+        ((SBOX[s0 >> 24] << 24) | (SBOX[(s1 >> 16) & 0xFF] << 16) | (SBOX[(s2 >> 8) & 0xFF] << 8) | SBOX[s3 & 0xFF])
+        ^ palabras_ronda[40],
+        ((SBOX[s1 >> 24] << 24) | (SBOX[(s2 >> 16) & 0xFF] << 16) | (SBOX[(s3 >> 8) & 0xFF] << 8) | SBOX[s0 & 0xFF])
+        ^ palabras_ronda[41],
+        ((SBOX[s2 >> 24] << 24) | (SBOX[(s3 >> 16) & 0xFF] << 16) | (SBOX[(s0 >> 8) & 0xFF] << 8) | SBOX[s1 & 0xFF])
+        ^ palabras_ronda[42],
+        ((SBOX[s3 >> 24] << 24) | (SBOX[(s0 >> 16) & 0xFF] << 16) | (SBOX[(s1 >> 8) & 0xFF] << 8) | SBOX[s2 & 0xFF])
+        ^ palabras_ronda[43],
+    )
+
+
+def desplazar_sustituir_inverso(s0, s1, s2, s3):
+    return (
+        (INV_SBOX[s0 >> 24] << 24) | (INV_SBOX[(s3 >> 16) & 0xFF] << 16) | (INV_SBOX[(s2 >> 8) & 0xFF] << 8) | INV_SBOX[s1 & 0xFF],
+        (INV_SBOX[s1 >> 24] << 24) | (INV_SBOX[(s0 >> 16) & 0xFF] << 16) | (INV_SBOX[(s3 >> 8) & 0xFF] << 8) | INV_SBOX[s2 & 0xFF],
+        (INV_SBOX[s2 >> 24] << 24) | (INV_SBOX[(s1 >> 16) & 0xFF] << 16) | (INV_SBOX[(s0 >> 8) & 0xFF] << 8) | INV_SBOX[s3 & 0xFF],
+        (INV_SBOX[s3 >> 24] << 24) | (INV_SBOX[(s2 >> 16) & 0xFF] << 16) | (INV_SBOX[(s1 >> 8) & 0xFF] << 8) | INV_SBOX[s0 & 0xFF],
+    )
+
+
+def mezclar_palabra_inversa(palabra):
+    return TMI0[palabra >> 24] ^ TMI1[(palabra >> 16) & 0xFF] ^ TMI2[(palabra >> 8) & 0xFF] ^ TMI3[palabra & 0xFF]
+
+
+# Descifrado equivalente (FIPS-197, 5.3.5): con InvMixColumns aplicada de antemano a
+# las claves de las rondas 1..9, cada ronda inversa es una ronda de tablas como el cifrado
+def aes_descifrar_bloque_tablas(bloque, palabras_ronda):
+    entero = int.from_bytes(bytes(bloque), "big")
+    s0 = (entero >> 96) ^ palabras_ronda[44]
+    s1 = ((entero >> 64) & 0xFFFFFFFF) ^ palabras_ronda[45]
+    s2 = ((entero >> 32) & 0xFFFFFFFF) ^ palabras_ronda[46]
+    s3 = (entero & 0xFFFFFFFF) ^ palabras_ronda[47]
+
+    for k in range(48, 84, 4):
+        s0, s1, s2, s3 = (
+            TD0[s0 >> 24] ^ TD1[(s3 >> 16) & 0xFF] ^ TD2[(s2 >> 8) & 0xFF] ^ TD3[s1 & 0xFF] ^ palabras_ronda[k],
+            TD0[s1 >> 24] ^ TD1[(s0 >> 16) & 0xFF] ^ TD2[(s3 >> 8) & 0xFF] ^ TD3[s2 & 0xFF] ^ palabras_ronda[k + 1],
+            TD0[s2 >> 24] ^ TD1[(s1 >> 16) & 0xFF] ^ TD2[(s0 >> 8) & 0xFF] ^ TD3[s3 & 0xFF] ^ palabras_ronda[k + 2],
+            TD0[s3 >> 24] ^ TD1[(s2 >> 16) & 0xFF] ^ TD2[(s1 >> 8) & 0xFF] ^ TD3[s0 & 0xFF] ^ palabras_ronda[k + 3],
+        )
+
+    s0, s1, s2, s3 = desplazar_sustituir_inverso(s0, s1, s2, s3)
+    return palabras_a_bytes(
+        s0 ^ palabras_ronda[84], s1 ^ palabras_ronda[85], s2 ^ palabras_ronda[86], s3 ^ palabras_ronda[87]
+    )
+
+
+def palabras_descifrado_equivalente(palabras):
+    # Claves en orden inverso de rondas; las intermedias pasan por InvMixColumns
+    resultado = list(palabras[40:44])
+    for k in range(36, 0, -4):
+        resultado.extend(mezclar_palabra_inversa(palabra) for palabra in palabras[k: k + 4])
+    resultado.extend(palabras[0:4])
+    return resultado
+
+
+# Motor de claves al vuelo
+# Solo guarda la clave y la última clave de ronda (8 palabras): el cifrado avanza la
+# expansión ronda a ronda y el descifrado la recorre hacia atrás desde la ronda 10.
+# Las rondas son las del motor de tablas; el descifrado aplica InvMixColumns a cada
+# clave en el momento, en lugar de tenerlas transformadas de antemano.
+
+RCON_PALABRAS = [rcon << 24 for rcon in RCON]
+
+
+def sub_rot_palabra(palabra):
+    # SubWord(RotWord(palabra))
+    return (
+        (SBOX[(palabra >> 16) & 0xFF] << 24) | (SBOX[(palabra >> 8) & 0xFF] << 16)
+        | (SBOX[palabra & 0xFF] << 8) | SBOX[palabra >> 24]
+    )
+
+
+def sustituir_desplazar(s0, s1, s2, s3):
+    return (
+        (SBOX[s0 >> 24] << 24) | (SBOX[(s1 >> 16) & 0xFF] << 16) | (SBOX[(s2 >> 8) & 0xFF] << 8) | SBOX[s3 & 0xFF],
+        (SBOX[s1 >> 24] << 24) | (SBOX[(s2 >> 16) & 0xFF] << 16) | (SBOX[(s3 >> 8) & 0xFF] << 8) | SBOX[s0 & 0xFF],
+        (SBOX[s2 >> 24] << 24) | (SBOX[(s3 >> 16) & 0xFF] << 16) | (SBOX[(s0 >> 8) & 0xFF] << 8) | SBOX[s1 & 0xFF],
+        (SBOX[s3 >> 24] << 24) | (SBOX[(s0 >> 16) & 0xFF] << 16) | (SBOX[(s1 >> 8) & 0xFF] << 8) | SBOX[s2 & 0xFF],
+    )
+
+
+def aes_cifrar_bloque_al_vuelo(bloque, claves):
+    k0, k1, k2, k3 = claves[0], claves[1], claves[2], claves[3]
+    entero = int.from_bytes(bytes(bloque), "big")
+    s0 = (entero >> 96) ^ k0
+    s1 = ((entero >> 64) & 0xFFFFFFFF) ^ k1
+    s2 = ((entero >> 32) & 0xFFFFFFFF) ^ k2
+    s3 = (entero & 0xFFFFFFFF) ^ k3
+
+    for ronda in range(1, 10):
+        k0 ^= sub_rot_palabra(k3) ^ RCON_PALABRAS[ronda]
+        k1 ^= k0
+        k2 ^= k1
+        k3 ^= k2
+        s0, s1, s2, s3 = (
+            T0[s0 >> 24] ^ T1[(s1 >> 16) & 0xFF] ^ T2[(s2 >> 8) & 0xFF] ^ T3[s3 & 0xFF] ^ k0,
+            T0[s1 >> 24] ^ T1[(s2 >> 16) & 0xFF] ^ T2[(s3 >> 8) & 0xFF] ^ T3[s0 & 0xFF] ^ k1,
+            T0[s2 >> 24] ^ T1[(s3 >> 16) & 0xFF] ^ T2[(s0 >> 8) & 0xFF] ^ T3[s1 & 0xFF] ^ k2,
+            T0[s3 >> 24] ^ T1[(s0 >> 16) & 0xFF] ^ T2[(s1 >> 8) & 0xFF] ^ T3[s2 & 0xFF] ^ k3,
+        )
+
+    k0 ^= sub_rot_palabra(k3) ^ RCON_PALABRAS[10]
+    k1 ^= k0
+    k2 ^= k1
+    k3 ^= k2
+    s0, s1, s2, s3 = sustituir_desplazar(s0, s1, s2, s3)
+    return palabras_a_bytes(s0 ^ k0, s1 ^ k1, s2 ^ k2, s3 ^ k3)
+
+
+def aes_descifrar_bloque_al_vuelo(bloque, claves):
+    k0, k1, k2, k3 = claves[4], claves[5], claves[6], claves[7]
+    entero = int.from_bytes(bytes(bloque), "big")
+    s0 = (entero >> 96) ^ k0
+    s1 = ((entero >> 64) & 0xFFFFFFFF) ^ k1
+    s2 = ((entero >> 32) & 0xFFFFFFFF) ^ k2
+    s3 = (entero & 0xFFFFFFFF) ^ k3
+
+    for ronda in range(10, 1, -1):
+        # Paso inverso de la expansión: de la clave de la ronda `ronda` a la anterior
+        k3 ^= k2
+        k2 ^= k1
+        k1 ^= k0
+        k0 ^= sub_rot_palabra(k3) ^ RCON_PALABRAS[ronda]
+        s0, s1, s2, s3 = (
+            TD0[s0 >> 24] ^ TD1[(s3 >> 16) & 0xFF] ^ TD2[(s2 >> 8) & 0xFF] ^ TD3[s1 & 0xFF] ^ mezclar_palabra_inversa(k0),
+            TD0[s1 >> 24] ^ TD1[(s0 >> 16) & 0xFF] ^ TD2[(s3 >> 8) & 0xFF] ^ TD3[s2 & 0xFF] ^ mezclar_palabra_inversa(k1),
+            TD0[s2 >> 24] ^ TD1[(s1 >> 16) & 0xFF] ^ TD2[(s0 >> 8) & 0xFF] ^ TD3[s3 & 0xFF] ^ mezclar_palabra_inversa(k2),
+            TD0[s3 >> 24] ^ TD1[(s2 >> 16) & 0xFF] ^ TD2[(s1 >> 8) & 0xFF] ^ TD3[s0 & 0xFF] ^ mezclar_palabra_inversa(k3),
+        )
+
+    k3 ^= k2
+    k2 ^= k1
+    k1 ^= k0
+    k0 ^= sub_rot_palabra(k3) ^ RCON_PALABRAS[1]
+    s0, s1, s2, s3 = desplazar_sustituir_inverso(s0, s1, s2, s3)
+    return palabras_a_bytes(s0 ^ k0, s1 ^ k1, s2 ^ k2, s3 ^ k3)
 
+
+# Funciones main
+
+
+def compactar_claves_estado(claves_ronda):
+    return [[bytearray(fila) for fila in clave] for clave in claves_ronda]
+
+
+def compactar_claves_palabras(claves_ronda):
+    # 44 palabras para cifrar seguidas de las 44 del descifrado equivalente
+    palabras = claves_ronda_a_palabras(claves_ronda)
+    return array("I", palabras + palabras_descifrado_equivalente(palabras))
+
+
+def claves_extremas_palabras(bytes_clave):
+    # Palabras de la clave y de la ronda 10, sin guardar las intermedias
+    palabras = [int.from_bytes(bytes_clave[i: i + 4], "big") for i in range(0, 16, 4)]
+    k0, k1, k2, k3 = palabras
+    for ronda in range(1, 11):
+        k0 ^= sub_rot_palabra(k3) ^ RCON_PALABRAS[ronda]
+        k1 ^= k0
+        k2 ^= k1
+        k3 ^= k2
+    return array("I", palabras + [k0, k1, k2, k3])
+
+
+# motor: "referencia" (estado 4x4, operaciones FIPS-197 paso a paso), "tablas" o
+# "al_vuelo" (rondas de tablas con claves derivadas durante el bloque, poca memoria).
+# Cada motor da (cifrar bloque, descifrar bloque, preparar claves desde los 16 bytes)
+MOTORES = {
+    "referencia": (
+        aes_cifrar_bloque, aes_descifrar_bloque,
+        lambda bytes_clave: compactar_claves_estado(expansion_clave(bytes_clave)),
+    ),
+    "tablas": (
+        aes_cifrar_bloque_tablas, aes_descifrar_bloque_tablas,
+        lambda bytes_clave: compactar_claves_palabras(expansion_clave(bytes_clave)),
+    ),
+    "al_vuelo": (aes_cifrar_bloque_al_vuelo, aes_descifrar_bloque_al_vuelo, claves_extremas_palabras),
+}
+
+# Tablas a nivel de módulo que usa cada motor, expansión de clave incluida
+TABLAS_MOTORES = {
+    "referencia": ("SBOX", "INV_SBOX", "RCON"),
+    "tablas": (
+        "T0", "T1", "T2", "T3", "TD0", "TD1", "TD2", "TD3", "TMI0", "TMI1", "TMI2", "TMI3",
+        "SBOX", "INV_SBOX", "RCON",
+    ),
+    "al_vuelo": (
+        "T0", "T1", "T2", "T3", "TD0", "TD1", "TD2", "TD3", "TMI0", "TMI1", "TMI2", "TMI3",
+        "SBOX", "INV_SBOX", "RCON_PALABRAS",
+    ),
+}
+
+
+def seleccionar_motor(motor):
+    if motor not in MOTORES:
+        raise ValueError(f"Motor AES desconocido: {motor!r} (opciones: {', '.join(MOTORES)})")
+    return MOTORES[motor]
+
+
+def preparar_clave(clave):
+    bytes_clave = a_bytes(clave)
     if len(bytes_clave) != 16:
         raise ValueError("AES-128 requiere una clave de 16 bytes (128 bits)")
+    return bytes_clave
+
+
+class AES128:
+    """AES-128 context: the key is prepared once, in the layout of the chosen engine"""
+
+    TAMANIO_BLOQUE = 16
+
+    __slots__ = ("motor", "claves_ronda", "funcion_cifrado", "funcion_descifrado")
+
+    def __init__(self, clave, motor="referencia"):
+        self.funcion_cifrado, self.funcion_descifrado, preparar_claves = seleccionar_motor(motor)
+        self.motor = motor
+        self.claves_ronda = preparar_claves(preparar_clave(clave))
+
+    def cifrar_bloque(self, bloque):
+        if len(bloque) != 16:
+            raise ValueError("AES-128 opera sobre bloques de 16 bytes")
+        return bytes(self.funcion_cifrado(bloque, self.claves_ronda))
+
+    def descifrar_bloque(self, bloque):
+        if len(bloque) != 16:
+            raise ValueError("AES-128 opera sobre bloques de 16 bytes")
+        return bytes(self.funcion_descifrado(bloque, self.claves_ronda))
+
+    def cifrar(self, datos):
+        funcion_cifrado, claves_ronda = self.funcion_cifrado, self.claves_ronda
+        texto_cifrado = bytearray()
+        for bloque in dividir_bloques(datos, 16):
+            texto_cifrado.extend(funcion_cifrado(bloque, claves_ronda))
+        return bytes(texto_cifrado)
+
+    def descifrar(self, datos):
+        vista = vista_bytes(datos)
+        if len(vista) % 16:
+            raise ValueError("El texto cifrado AES debe tener una longitud múltiplo de 16 bytes")
+
+        funcion_descifrado, claves_ronda = self.funcion_descifrado, self.claves_ronda
+        texto_plano = bytearray()
+        for i in range(0, len(vista), 16):
+            texto_plano.extend(funcion_descifrado(vista[i: i + 16], claves_ronda))
+        return bytes(texto_plano)
+
+    def borrar(self):
+        borrar_material_clave(self.claves_ronda)
+
+
+def obtener_contexto(clave, motor="referencia"):
+    bytes_clave = preparar_clave(clave)
+    return CACHE_CLAVES.obtener(f"AES-128/{motor}", bytes_clave, lambda: AES128(bytes_clave, motor))
+
+
+def AES_cifrar_bytes(datos, clave, motor="referencia"):
+    return obtener_contexto(clave, motor).cifrar(datos)
+
+
+def AES_descifrar_bytes(datos, clave, motor="referencia"):
+    return obtener_contexto(clave, motor).descifrar(datos)
+
 
-    claves_ronda = expansion_clave(bytes_clave)
+def AES_cifrar(texto_plano, clave, motor="referencia"):
+    return list(AES_cifrar_bytes(texto_plano, clave, motor))
 
-    bytes_texto_plano = []
-    for i in range(0, len(bytes_texto_cifrado), 16):
-        bloque = bytes_texto_cifrado[i: i + 16]
-        bloque_descifrado = aes_descifrar_bloque(bloque, claves_ronda)
-        bytes_texto_plano.extend(bloque_descifrado)
 
-    return bytes_texto_plano
+def AES_descifrar(bytes_texto_cifrado, clave, motor="referencia"):
+    return list(AES_descifrar_bytes(bytes(bytes_texto_cifrado), clave, motor))
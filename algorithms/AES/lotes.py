@@ -0,0 +1,200 @@
+# Motor AES-128 vectorizado con NumPy: N bloques se guardan como una matriz (N, 16)
+# de uint8 en el orden de bytes de FIPS-197 (columna a columna) y cada ronda se
+# aplica a todos los bloques a la vez.
+import numpy as np
+
+from .constants import SBOX, INV_SBOX, RCON
+from .index import expansion_clave, estado_a_bytes, multiplicar_galois, preparar_clave
+from algorithms.utils.cache import CACHE_CLAVES
+from algorithms.utils.index import vista_bytes
+
+SBOX_NP = np.array(SBOX, dtype=np.uint8)
+INV_SBOX_NP = np.array(INV_SBOX, dtype=np.uint8)
+MUL2, MUL3, MUL9, MUL11, MUL13, MUL14 = (
+    np.array([multiplicar_galois(factor, x) for x in range(256)], dtype=np.uint8)
+    for factor in (0x02, 0x03, 0x09, 0x0B, 0x0D, 0x0E)
+)
+
+# El byte (fila r, columna c) está en la posición 4c + r
+DESPLAZAR_FILAS = np.array([4 * ((c + r) % 4) + r for c in range(4) for r in range(4)])
+DESPLAZAR_FILAS_INVERSO = np.array([4 * ((c - r) % 4) + r for c in range(4) for r in range(4)])
+
+# Tablas a nivel de módulo que usa el motor, con SBOX y RCON de expansion_clave
+TABLAS_LOTES = (
+    "SBOX_NP", "INV_SBOX_NP", "MUL2", "MUL3", "MUL9", "MUL11", "MUL13", "MUL14",
+    "DESPLAZAR_FILAS", "DESPLAZAR_FILAS_INVERSO", "SBOX", "RCON",
+)
+
+
+def claves_ronda_a_matriz(claves_ronda):
+    return np.array([estado_a_bytes(clave) for clave in claves_ronda], dtype=np.uint8)
+
+
+def mezclar_columnas_numpy(estados):
+    a0, a1, a2, a3 = (estados[:, r::4] for r in range(4))
+    resultado = np.empty_like(estados)
+    resultado[:, 0::4] = MUL2[a0] ^ MUL3[a1] ^ a2 ^ a3
+    resultado[:, 1::4] = a0 ^ MUL2[a1] ^ MUL3[a2] ^ a3
+    resultado[:, 2::4] = a0 ^ a1 ^ MUL2[a2] ^ MUL3[a3]
+    resultado[:, 3::4] = MUL3[a0] ^ a1 ^ a2 ^ MUL2[a3]
+    return resultado
+
+
+def mezclar_columnas_inverso_numpy(estados):
+    a0, a1, a2, a3 = (estados[:, r::4] for r in range(4))
+    resultado = np.empty_like(estados)
+    resultado[:, 0::4] = MUL14[a0] ^ MUL11[a1] ^ MUL13[a2] ^ MUL9[a3]
+    resultado[:, 1::4] = MUL9[a0] ^ MUL14[a1] ^ MUL11[a2] ^ MUL13[a3]
+    resultado[:, 2::4] = MUL13[a0] ^ MUL9[a1] ^ MUL14[a2] ^ MUL11[a3]
+    resultado[:, 3::4] = MUL11[a0] ^ MUL13[a1] ^ MUL9[a2] ^ MUL14[a3]
+    return resultado
+
+
+def aes_cifrar_bloques_numpy(estados, claves_ronda):
+    estados = estados ^ claves_ronda[0]
+
+    for num_ronda in range(1, 10):
+        estados = SBOX_NP[estados][:, DESPLAZAR_FILAS]
+        estados = mezclar_columnas_numpy(estados)
+        estados ^= claves_ronda[num_ronda]
+
+    return SBOX_NP[estados][:, DESPLAZAR_FILAS] ^ claves_ronda[10]
+
+
+def aes_descifrar_bloques_numpy(estados, claves_ronda):
+    estados = estados ^ claves_ronda[10]
+
+    for num_ronda in range(9, 0, -1):
+        estados = INV_SBOX_NP[estados[:, DESPLAZAR_FILAS_INVERSO]]
+        estados ^= claves_ronda[num_ronda]
+        estados = mezclar_columnas_inverso_numpy(estados)
+
+    return INV_SBOX_NP[estados[:, DESPLAZAR_FILAS_INVERSO]] ^ claves_ronda[0]
+
+
+def bytes_a_estados(datos):
+    vista = vista_bytes(datos)
+    relleno = -len(vista) % 16
+    if relleno:
+        vista = bytes(vista) + b"\x00" * relleno
+    return np.frombuffer(vista, dtype=np.uint8).reshape(-1, 16)
+
+
+class AES128Lotes:
+    """AES-128 context backed by the NumPy batch engine (same interface as AES128)"""
+
+    TAMANIO_BLOQUE = 16
+
+    __slots__ = ("claves_ronda",)
+
+    def __init__(self, clave):
+        self.claves_ronda = claves_ronda_a_matriz(expansion_clave(preparar_clave(clave)))
+
+    def cifrar_bloque(self, bloque):
+        if len(bloque) != 16:
+            raise ValueError("AES-128 opera sobre bloques de 16 bytes")
+        return self.cifrar(bloque)
+
+    def descifrar_bloque(self, bloque):
+        if len(bloque) != 16:
+            raise ValueError("AES-128 opera sobre bloques de 16 bytes")
+        return self.descifrar(bloque)
+
+    def cifrar(self, datos):
+        return aes_cifrar_bloques_numpy(bytes_a_estados(datos), self.claves_ronda).tobytes()
+
+    def descifrar(self, datos):
+        if len(datos) % 16:
+            raise ValueError("El texto cifrado AES debe tener una longitud múltiplo de 16 bytes")
+        return aes_descifrar_bloques_numpy(bytes_a_estados(datos), self.claves_ronda).tobytes()
+
+    def borrar(self):
+        self.claves_ronda.fill(0)
+
+
+def obtener_contexto(clave):
+    bytes_clave = preparar_clave(clave)
+    return CACHE_CLAVES.obtener("AES-128/lotes", bytes_clave, lambda: AES128Lotes(bytes_clave))
+
+
+def AES_cifrar_lotes(texto_plano, clave):
+    return list(obtener_contexto(clave).cifrar(texto_plano))
+
+
+def AES_descifrar_lotes(bytes_texto_cifrado, clave):
+    return list(obtener_contexto(clave).descifrar(bytes(bytes_texto_cifrado)))
+
+
+# Varias claves en un mismo lote
+# Cada bloque lleva su propia matriz de claves de ronda (11, 16); apiladas como
+# (11, N, 16), las mismas rondas vectorizadas las aplican carril a carril por broadcasting.
+
+
+def aes_procesar_multiclave(funcion, mensajes, descifrar):
+    claves_por_bloque = []
+    datos = bytearray()
+    longitudes = []
+    for claves_ronda, mensaje in mensajes:
+        vista = vista_bytes(mensaje)
+        if descifrar and len(vista) % 16:
+            raise ValueError("El texto cifrado AES debe tener una longitud múltiplo de 16 bytes")
+        longitud = len(vista) + (-len(vista) % 16)
+        datos += vista
+        datos += b"\x00" * (longitud - len(vista))
+        claves_por_bloque.extend([claves_ronda] * (longitud // 16))
+        longitudes.append(longitud)
+
+    if not claves_por_bloque:
+        return [b"" for _ in longitudes]
+    estados = np.frombuffer(bytes(datos), dtype=np.uint8).reshape(-1, 16)
+    salida = funcion(estados, np.stack(claves_por_bloque, axis=1)).tobytes()
+
+    resultados = []
+    desplazamiento = 0
+    for longitud in longitudes:
+        resultados.append(salida[desplazamiento: desplazamiento + longitud])
+        desplazamiento += longitud
+    return resultados
+
+
+def aes_cifrar_multiclave(mensajes):
+    """Encrypt (claves_ronda, datos) pairs, each under its own key, in one vectorized pass.
+
+    claves_ronda is the (11, 16) matrix of claves_ronda_a_matriz(expansion_clave(clave)),
+    e.g. AES128Lotes(clave).claves_ronda. Same zero-padded ECB output as AES128.cifrar.
+    """
+    return aes_procesar_multiclave(aes_cifrar_bloques_numpy, mensajes, descifrar=False)
+
+
+def aes_descifrar_multiclave(mensajes):
+    return aes_procesar_multiclave(aes_descifrar_bloques_numpy, mensajes, descifrar=True)
+
+
+# Expansión de claves en bloque
+# N claves (N, 16) se expanden a la vez: cada paso de la recurrencia de FIPS-197 se
+# aplica a la palabra i de todas las claves.
+
+RCON_NP = np.array(RCON, dtype=np.uint8)
+
+
+def expandir_claves_lote(claves):
+    """Expand an (N, 16) uint8 array of AES-128 keys into (N, 11, 16) round-key matrices.
+
+    Row k of each matrix matches claves_ronda_a_matriz(expansion_clave(clave))[k], so
+    the result feeds aes_cifrar_multiclave and AES128Lotes-style code directly.
+    """
+    claves = np.asarray(claves, dtype=np.uint8)
+    if claves.ndim != 2 or claves.shape[1] != 16:
+        raise ValueError("AES-128 requiere claves de 16 bytes (128 bits): se esperaba un arreglo (N, 16)")
+
+    palabras = np.empty((len(claves), 44, 4), dtype=np.uint8)
+    palabras[:, :4] = claves.reshape(-1, 4, 4)
+    for i in range(4, 44):
+        temporal = palabras[:, i - 1]
+        if i % 4 == 0:
+            # RotWord, SubWord y RCON
+            temporal = SBOX_NP[temporal[:, [1, 2, 3, 0]]]
+            temporal[:, 0] ^= RCON_NP[i // 4]
+        palabras[:, i] = palabras[:, i - 4] ^ temporal
+    # La clave de ronda k son las palabras 4k..4k+3, columna a columna como los estados
+    return palabras.reshape(-1, 11, 16)
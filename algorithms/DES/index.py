@@ -1,9 +1,17 @@
 from .constants import IP, IP_INV, E, P, S_BOXES, PC1, PC2, SHIFT_SCHEDULE
 from algorithms.utils.index import (
-    string_a_bits,
     xor_bits,
     rotacion_izquierda,
+    bits_a_entero,
+    entero_a_bits,
+    a_bytes,
+    vista_bytes,
+    dividir_bloques,
+    enteros_a_bytes,
+    bits_a_bytes,
+    bytes_a_bits,
 )
+from algorithms.utils.cache import CACHE_CLAVES, borrar_material_clave
 
 
 def permutar(bloque, tabla):
@@ -69,38 +77,267 @@ def des_cifrar_bloque(texto_plano_64, claves_ronda):
     return texto_cifrado
 
 
-def DES_cifrar(texto_plano, clave):
-    bits_texto_plano = string_a_bits(texto_plano)
-    bits_clave = string_a_bits(clave)
+# Motor de enteros
+# El bloque se maneja como entero de 64 bits; IP/IP_INV se aplican con 8 tablas
+# indexadas por byte y cada S-box va fusionada con P en una tabla SP de 64 entradas.
 
-    if len(bits_clave) < 64:
-        bits_clave = bits_clave + [0] * (64 - len(bits_clave))
 
-    relleno_necesario = (64 - (len(bits_texto_plano) % 64)) % 64
-    bits_texto_plano = bits_texto_plano + [0] * relleno_necesario
-    claves_ronda = generar_claves_ronda(bits_clave)
-    bits_texto_cifrado = []
+# Ejemplo: permutar_entero(0b10, [2, 1], 2) -> 0b01 (posiciones 1-indexadas, MSB primero)
+def permutar_entero(valor, tabla, bits_entrada):
+    resultado = 0
+    for posicion in tabla:
+        resultado = (resultado << 1) | ((valor >> (bits_entrada - posicion)) & 1)
+    return resultado
+
+
+def generar_tablas_permutacion(tabla, bits_entrada):
+    # Contribución de cada bit de entrada a la salida, luego combinada por byte
+    mascaras = [0] * (bits_entrada + 1)
+    for j, posicion in enumerate(tabla):
+        mascaras[posicion] |= 1 << (len(tabla) - 1 - j)
+
+    tablas = []
+    for k in range(bits_entrada // 8):
+        tabla_byte = [0] * 256
+        for valor in range(1, 256):
+            posicion = 8 * k + 9 - (valor & -valor).bit_length()
+            tabla_byte[valor] = tabla_byte[valor & (valor - 1)] | mascaras[posicion]
+        tablas.append(tabla_byte)
+    return tablas
+
+
+def generar_tablas_sp():
+    tablas = []
+    for i in range(8):
+        tabla_sp = []
+        for entrada in range(64):
+            fila = ((entrada >> 4) & 0b10) | (entrada & 1)
+            columna = (entrada >> 1) & 0xF
+            salida = S_BOXES[i][fila][columna] << (28 - 4 * i)
+            tabla_sp.append(permutar_entero(salida, P, 32))
+        tablas.append(tabla_sp)
+    return tablas
+
+
+IP_TABLAS = generar_tablas_permutacion(IP, 64)
+IP_INV_TABLAS = generar_tablas_permutacion(IP_INV, 64)
+SP0, SP1, SP2, SP3, SP4, SP5, SP6, SP7 = generar_tablas_sp()
+
+
+def aplicar_tablas_permutacion(valor, tablas):
+    resultado = 0
+    for k in range(8):
+        resultado |= tablas[k][(valor >> (56 - 8 * k)) & 0xFF]
+    return resultado
+
+
+# Cada clave de ronda de 48 bits se guarda como 8 fragmentos de 6 bits (uno por S-box)
+def claves_ronda_a_fragmentos(claves_ronda):
+    return bytearray(
+        bits_a_entero(clave_ronda[6 * i: 6 * i + 6]) for clave_ronda in claves_ronda for i in range(8)
+    )
+
+
+def invertir_fragmentos(fragmentos):
+    return bytearray(b"".join(fragmentos[k: k + 8] for k in range(len(fragmentos) - 8, -1, -8)))
+
+
+def des_cifrar_bloque_enteros(bloque, fragmentos):
+    permutado = aplicar_tablas_permutacion(bloque, IP_TABLAS)
+    L = permutado >> 32
+    R = permutado & 0xFFFFFFFF
+
+    for k in range(0, 128, 8):
+        # Expansión E: ventanas de 6 bits sobre R extendido circularmente a 34 bits
+        x = ((R & 1) << 33) | (R << 1) | (R >> 31)
+        L, R = R, L ^ (
+            SP0[((x >> 28) & 0x3F) ^ fragmentos[k]]
+            ^ SP1[((x >> 24) & 0x3F) ^ fragmentos[k + 1]]
+            ^ SP2[((x >> 20) & 0x3F) ^ fragmentos[k + 2]]
+            ^ SP3[((x >> 16) & 0x3F) ^ fragmentos[k + 3]]
+            ^ SP4[((x >> 12) & 0x3F) ^ fragmentos[k + 4]]
+            ^ SP5[((x >> 8) & 0x3F) ^ fragmentos[k + 5]]
+            ^ SP6[((x >> 4) & 0x3F) ^ fragmentos[k + 6]]
+            ^ SP7[(x & 0x3F) ^ fragmentos[k + 7]]
+        )
+
+    return aplicar_tablas_permutacion((R << 32) | L, IP_INV_TABLAS)
+
+
+# Motor de claves al vuelo
+# Solo guarda el registro C||D de 56 bits tras PC1 y deriva cada clave de ronda durante
+# el bloque (rotaciones + PC2 por tablas). Las rondas son las del motor de enteros.
+
+PC2_0, PC2_1, PC2_2, PC2_3, PC2_4, PC2_5, PC2_6 = generar_tablas_permutacion(PC2, 56)
+MASCARA_28 = (1 << 28) - 1
+DESPLAZAMIENTOS_CIFRADO = bytes(SHIFT_SCHEDULE)
+# Las 16 rotaciones suman 28 posiciones, así que C||D vuelve a su valor inicial y el
+# descifrado parte del mismo registro rotando hacia atrás (28 - s a la izquierda)
+DESPLAZAMIENTOS_DESCIFRADO = bytes([0] + [28 - desplazamiento for desplazamiento in reversed(SHIFT_SCHEDULE[1:])])
+
+
+def rotar_registro(registro, desplazamiento):
+    C = registro >> 28
+    D = registro & MASCARA_28
+    C = ((C << desplazamiento) | (C >> (28 - desplazamiento))) & MASCARA_28
+    D = ((D << desplazamiento) | (D >> (28 - desplazamiento))) & MASCARA_28
+    return (C << 28) | D
+
+
+def des_cifrar_bloque_al_vuelo(bloque, registro, desplazamientos):
+    permutado = aplicar_tablas_permutacion(bloque, IP_TABLAS)
+    L = permutado >> 32
+    R = permutado & 0xFFFFFFFF
+
+    for desplazamiento in desplazamientos:
+        registro = rotar_registro(registro, desplazamiento)
+        clave = (
+            PC2_0[registro >> 48] | PC2_1[(registro >> 40) & 0xFF] | PC2_2[(registro >> 32) & 0xFF]
+            | PC2_3[(registro >> 24) & 0xFF] | PC2_4[(registro >> 16) & 0xFF] | PC2_5[(registro >> 8) & 0xFF]
+            | PC2_6[registro & 0xFF]
+        )
+        x = ((R & 1) << 33) | (R << 1) | (R >> 31)
+        L, R = R, L ^ (
+            SP0[((x >> 28) & 0x3F) ^ (clave >> 42)]
+            ^ SP1[((x >> 24) & 0x3F) ^ ((clave >> 36) & 0x3F)]
+            ^ SP2[((x >> 20) & 0x3F) ^ ((clave >> 30) & 0x3F)]
+            ^ SP3[((x >> 16) & 0x3F) ^ ((clave >> 24) & 0x3F)]
+            ^ SP4[((x >> 12) & 0x3F) ^ ((clave >> 18) & 0x3F)]
+            ^ SP5[((x >> 8) & 0x3F) ^ ((clave >> 12) & 0x3F)]
+            ^ SP6[((x >> 4) & 0x3F) ^ ((clave >> 6) & 0x3F)]
+            ^ SP7[(x & 0x3F) ^ (clave & 0x3F)]
+        )
+
+    return aplicar_tablas_permutacion((R << 32) | L, IP_INV_TABLAS)
+
+
+# Funciones main
+
+
+def preparar_clave(clave):
+    # Claves cortas se rellenan con ceros; de las largas solo PC1 usa los primeros 64 bits
+    return a_bytes(clave)[:8].ljust(8, b"\x00")
+
+
+def des_procesar_bloques(bloques, claves_ronda):
+    return enteros_a_bytes(
+        (
+            bits_a_entero(des_cifrar_bloque(entero_a_bits(int.from_bytes(bloque, "big"), 64), claves_ronda))
+            for bloque in bloques
+        ),
+        8,
+    )
+
+
+def des_procesar_bloques_enteros(bloques, fragmentos):
+    return enteros_a_bytes((des_cifrar_bloque_enteros(int.from_bytes(bloque, "big"), fragmentos) for bloque in bloques), 8)
+
+
+def des_procesar_bloques_al_vuelo(bloques, claves):
+    registro, desplazamientos = claves
+    return enteros_a_bytes(
+        (des_cifrar_bloque_al_vuelo(int.from_bytes(bloque, "big"), registro, desplazamientos) for bloque in bloques), 8
+    )
+
+
+# motor: "referencia" (listas de bits), "enteros" (bloques de 64 bits y tablas SP) o
+# "al_vuelo" (rondas de enteros con claves derivadas durante el bloque, poca memoria).
+# Cada motor da (procesar bloques, preparar claves desde los 64 bits de la clave,
+# claves de descifrado a partir de las de cifrado)
+MOTORES = {
+    "referencia": (
+        des_procesar_bloques,
+        lambda bits_clave: [bytearray(clave_ronda) for clave_ronda in generar_claves_ronda(bits_clave)],
+        lambda claves_ronda: claves_ronda[::-1],
+    ),
+    "enteros": (
+        des_procesar_bloques_enteros,
+        lambda bits_clave: claves_ronda_a_fragmentos(generar_claves_ronda(bits_clave)),
+        invertir_fragmentos,
+    ),
+    "al_vuelo": (
+        des_procesar_bloques_al_vuelo,
+        lambda bits_clave: [permutar_entero(bits_a_entero(bits_clave), PC1, 64), DESPLAZAMIENTOS_CIFRADO],
+        lambda claves: [claves[0], DESPLAZAMIENTOS_DESCIFRADO],
+    ),
+}
+
+# Tablas a nivel de módulo que usa cada motor, preparación de claves incluida
+TABLAS_MOTORES = {
+    "referencia": ("IP", "IP_INV", "E", "P", "S_BOXES", "PC1", "PC2", "SHIFT_SCHEDULE"),
+    "enteros": (
+        "IP_TABLAS", "IP_INV_TABLAS", "SP0", "SP1", "SP2", "SP3", "SP4", "SP5", "SP6", "SP7",
+        "PC1", "PC2", "SHIFT_SCHEDULE",
+    ),
+    "al_vuelo": (
+        "IP_TABLAS", "IP_INV_TABLAS", "SP0", "SP1", "SP2", "SP3", "SP4", "SP5", "SP6", "SP7",
+        "PC1", "PC2_0", "PC2_1", "PC2_2", "PC2_3", "PC2_4", "PC2_5", "PC2_6",
+        "DESPLAZAMIENTOS_CIFRADO", "DESPLAZAMIENTOS_DESCIFRADO",
+    ),
+}
+
+
+def seleccionar_motor(motor):
+    if motor not in MOTORES:
+        raise ValueError(f"Motor DES desconocido: {motor!r} (opciones: {', '.join(MOTORES)})")
+    return MOTORES[motor]
+
+
+class DES:
+    """DES context: the round keys are prepared once, in the layout of the chosen engine"""
+
+    TAMANIO_BLOQUE = 8
+
+    __slots__ = ("motor", "claves_ronda", "claves_ronda_inversas", "funcion_bloques")
+
+    def __init__(self, clave, motor="referencia"):
+        self.funcion_bloques, preparar_claves, invertir_claves = seleccionar_motor(motor)
+        self.motor = motor
+        bits_clave = entero_a_bits(int.from_bytes(preparar_clave(clave), "big"), 64)
+        self.claves_ronda = preparar_claves(bits_clave)
+        # El descifrado recorre estas mismas claves en orden inverso, sin segunda expansión
+        self.claves_ronda_inversas = invertir_claves(self.claves_ronda)
+
+    def cifrar_bloque(self, bloque):
+        if len(bloque) != 8:
+            raise ValueError("DES opera sobre bloques de 8 bytes")
+        return self.funcion_bloques([bloque], self.claves_ronda)
+
+    def descifrar_bloque(self, bloque):
+        if len(bloque) != 8:
+            raise ValueError("DES opera sobre bloques de 8 bytes")
+        return self.funcion_bloques([bloque], self.claves_ronda_inversas)
+
+    def cifrar(self, datos):
+        return self.funcion_bloques(dividir_bloques(datos, 8), self.claves_ronda)
+
+    def descifrar(self, datos):
+        vista = vista_bytes(datos)
+        if len(vista) % 8:
+            raise ValueError("El texto cifrado DES debe tener una longitud múltiplo de 8 bytes")
+        return self.funcion_bloques((vista[i: i + 8] for i in range(0, len(vista), 8)), self.claves_ronda_inversas)
+
+    def borrar(self):
+        borrar_material_clave(self.claves_ronda)
+        borrar_material_clave(self.claves_ronda_inversas)
+
+
+def obtener_contexto(clave, motor="referencia"):
+    bytes_clave = preparar_clave(clave)
+    return CACHE_CLAVES.obtener(f"DES/{motor}", bytes_clave, lambda: DES(bytes_clave, motor))
+
 
-    for i in range(0, len(bits_texto_plano), 64):
-        bloque = bits_texto_plano[i : i + 64]
-        bloque_cifrado = des_cifrar_bloque(bloque, claves_ronda)
-        bits_texto_cifrado.extend(bloque_cifrado)
+def DES_cifrar_bytes(datos, clave, motor="referencia"):
+    return obtener_contexto(clave, motor).cifrar(datos)
 
-    return bits_texto_cifrado
 
+def DES_descifrar_bytes(datos, clave, motor="referencia"):
+    return obtener_contexto(clave, motor).descifrar(datos)
 
-def DES_descifrar(bits_texto_cifrado, clave):
-    bits_clave = string_a_bits(clave)
 
-    if len(bits_clave) < 64:
-        bits_clave = bits_clave + [0] * (64 - len(bits_clave))
+def DES_cifrar(texto_plano, clave, motor="referencia"):
+    return bytes_a_bits(DES_cifrar_bytes(texto_plano, clave, motor))
 
-    claves_ronda = generar_claves_ronda(bits_clave)
-    claves_ronda = claves_ronda[::-1]
-    bits_texto_plano = []
-    for i in range(0, len(bits_texto_cifrado), 64):
-        bloque = bits_texto_cifrado[i : i + 64]
-        bloque_descifrado = des_cifrar_bloque(bloque, claves_ronda)
-        bits_texto_plano.extend(bloque_descifrado)
 
-    return bits_texto_plano
+def DES_descifrar(bits_texto_cifrado, clave, motor="referencia"):
+    return bytes_a_bits(DES_descifrar_bytes(bits_a_bytes(bits_texto_cifrado), clave, motor))
@@ -0,0 +1,42 @@
+# Expansión de claves DES en bloque con NumPy. PC1, las 16 rotaciones de C y D y PC2
+# son selecciones de bits de la clave original, así que se componen en una sola tabla
+# de índices (16, 48) y las claves de ronda de N claves salen de una indexación.
+import numpy as np
+
+from .constants import PC1, PC2, SHIFT_SCHEDULE
+
+
+def generar_indices_ronda():
+    # Posición en la clave de 64 bits de cada bit de cada clave de ronda
+    C = [posicion - 1 for posicion in PC1[:28]]
+    D = [posicion - 1 for posicion in PC1[28:]]
+    indices = []
+    for desplazamiento in SHIFT_SCHEDULE:
+        C = C[desplazamiento:] + C[:desplazamiento]
+        D = D[desplazamiento:] + D[:desplazamiento]
+        CD = C + D
+        indices.append([CD[posicion - 1] for posicion in PC2])
+    return np.array(indices, dtype=np.intp)
+
+
+INDICES_RONDA = generar_indices_ronda()
+PESOS_FRAGMENTO = np.array([32, 16, 8, 4, 2, 1], dtype=np.uint8)
+
+
+def expandir_claves_lote(claves):
+    """Expand an (N, L) uint8 array of DES keys into (N, 128) uint8 round-key fragments.
+
+    Keys are zero-padded or truncated to 8 bytes as in preparar_clave. Each row is the
+    6-bit-per-S-box layout of claves_ronda_a_fragmentos, so bytearray(fila) is the
+    claves_ronda of a DES context with motor="enteros".
+    """
+    claves = np.asarray(claves, dtype=np.uint8)
+    if claves.ndim != 2:
+        raise ValueError("Se esperaba un arreglo (N, L) de claves DES")
+
+    bytes_clave = np.zeros((len(claves), 8), dtype=np.uint8)
+    bytes_clave[:, :min(claves.shape[1], 8)] = claves[:, :8]
+    bits = np.unpackbits(bytes_clave, axis=1)
+    # (N, 16 rondas, 8 S-boxes, 6 bits) -> un fragmento de 6 bits por S-box
+    fragmentos = bits[:, INDICES_RONDA].reshape(len(claves), 128, 6) @ PESOS_FRAGMENTO
+    return fragmentos.astype(np.uint8)
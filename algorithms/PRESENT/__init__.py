@@ -1,4 +1,4 @@
 # PRESENT-80 Block Cipher
-from .index import PRESENT_cifrar, PRESENT_descifrar
+from .index import PRESENT80, PRESENT_cifrar, PRESENT_descifrar
 
-__all__ = ['PRESENT_cifrar', 'PRESENT_descifrar']
+__all__ = ['PRESENT80', 'PRESENT_cifrar', 'PRESENT_descifrar']
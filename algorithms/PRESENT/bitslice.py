@@ -0,0 +1,139 @@
+# Motor bitslice de PRESENT-80: N bloques se empaquetan en 64 enteros (uno por
+# posición de bit), donde el bit j de cada entero pertenece al bloque j. La
+# S-box se evalúa como circuito booleano sobre los 64 enteros y la capa pLayer
+# se reduce a reordenar la lista, así que cada ronda procesa todos los bloques.
+from .constants import P_LAYER, INV_P_LAYER
+
+
+# Ejemplo: empaquetar_bloques([0b01, 0b11]) -> rebanadas[0] = 0b11, rebanadas[1] = 0b01
+def empaquetar_bloques(bloques):
+    cadenas = [format(bloque, "064b") for bloque in bloques]
+    # zip(*cadenas) recorre las columnas de bit 63 a 0; el bloque 0 queda en el bit más alto
+    columnas = [int("".join(columna), 2) for columna in zip(*cadenas)]
+    return columnas[::-1]
+
+
+def desempaquetar_bloques(rebanadas, numero_bloques):
+    formato = f"0{numero_bloques}b"
+    cadenas = [format(rebanada, formato) for rebanada in reversed(rebanadas)]
+    return [int("".join(columna), 2) for columna in zip(*cadenas)]
+
+
+def agregar_clave_rebanadas(rebanadas, clave_ronda, mascara):
+    for i in range(64):
+        if (clave_ronda >> i) & 1:
+            rebanadas[i] ^= mascara
+
+
+# Forma normal algebraica de la S-box, x0 es el bit menos significativo del nibble
+def aplicar_sbox_rebanadas(rebanadas, mascara):
+    for n in range(0, 64, 4):
+        x0, x1, x2, x3 = rebanadas[n: n + 4]
+        x1x2 = x1 & x2
+        x1x3 = x1 & x3
+        x2x3 = x2 & x3
+        x0x1x2 = x0 & x1x2
+        comun = x3 ^ (x0 & x1x3) ^ (x0 & x2x3)
+
+        rebanadas[n] = x0 ^ x2 ^ x1x2 ^ x3
+        rebanadas[n + 1] = x1 ^ x0x1x2 ^ x1x3 ^ x2x3 ^ comun
+        rebanadas[n + 2] = mascara ^ (x0 & x1) ^ x2 ^ (x0 & x3) ^ x1x3 ^ comun
+        rebanadas[n + 3] = mascara ^ x0 ^ x1 ^ x1x2 ^ x0x1x2 ^ comun
+
+
+def aplicar_sbox_inversa_rebanadas(rebanadas, mascara):
+    for n in range(0, 64, 4):
+        x0, x1, x2, x3 = rebanadas[n: n + 4]
+        x0x1 = x0 & x1
+        x0x2 = x0 & x2
+        x1x2 = x1 & x2
+        x1x3 = x1 & x3
+        x0x1x2 = x0 & x1x2
+        x0x1x3 = x0 & x1x3
+        x0x2x3 = x0x2 & x3
+
+        rebanadas[n] = mascara ^ x0 ^ x2 ^ x1x3
+        rebanadas[n + 1] = x0 ^ x1 ^ x0x2 ^ x0x1x2 ^ x3 ^ x1x3 ^ x0x1x3 ^ (x2 & x3) ^ x0x2x3
+        rebanadas[n + 2] = mascara ^ x0x1 ^ x0x2 ^ x1x2 ^ x0x1x2 ^ x3 ^ (x0 & x3) ^ x1x3 ^ x0x1x3 ^ x0x2x3
+        rebanadas[n + 3] = x0 ^ x1 ^ x0x1 ^ x2 ^ x0x1x2 ^ x3 ^ x0x2x3
+
+
+# Reordenamiento de cables: la rebanada i pasa a la posición P_LAYER[i]
+def aplicar_permutacion_rebanadas(rebanadas, tabla):
+    resultado = [0] * 64
+    for i in range(64):
+        resultado[tabla[i]] = rebanadas[i]
+    return resultado
+
+
+def present_cifrar_bloques_bitslice(bloques, claves_ronda):
+    if not bloques:
+        return []
+    mascara = (1 << len(bloques)) - 1
+    rebanadas = empaquetar_bloques(bloques)
+
+    for i in range(31):
+        agregar_clave_rebanadas(rebanadas, claves_ronda[i], mascara)
+        aplicar_sbox_rebanadas(rebanadas, mascara)
+        rebanadas = aplicar_permutacion_rebanadas(rebanadas, P_LAYER)
+
+    agregar_clave_rebanadas(rebanadas, claves_ronda[31], mascara)
+
+    return desempaquetar_bloques(rebanadas, len(bloques))
+
+
+def present_descifrar_bloques_bitslice(bloques, claves_ronda):
+    if not bloques:
+        return []
+    mascara = (1 << len(bloques)) - 1
+    rebanadas = empaquetar_bloques(bloques)
+
+    agregar_clave_rebanadas(rebanadas, claves_ronda[31], mascara)
+
+    for i in range(30, -1, -1):
+        rebanadas = aplicar_permutacion_rebanadas(rebanadas, INV_P_LAYER)
+        aplicar_sbox_inversa_rebanadas(rebanadas, mascara)
+        agregar_clave_rebanadas(rebanadas, claves_ronda[i], mascara)
+
+    return desempaquetar_bloques(rebanadas, len(bloques))
+
+
+# Varias claves en un mismo lote: rebanadas_claves[r] son las 64 rebanadas de las claves
+# de la ronda r de todos los carriles, y añadir la clave es un XOR rebanada a rebanada
+
+
+def agregar_clave_rebanadas_carriles(rebanadas, rebanadas_clave):
+    for i in range(64):
+        rebanadas[i] ^= rebanadas_clave[i]
+
+
+def present_cifrar_bloques_bitslice_multiclave(bloques, rebanadas_claves):
+    if not bloques:
+        return []
+    mascara = (1 << len(bloques)) - 1
+    rebanadas = empaquetar_bloques(bloques)
+
+    for i in range(31):
+        agregar_clave_rebanadas_carriles(rebanadas, rebanadas_claves[i])
+        aplicar_sbox_rebanadas(rebanadas, mascara)
+        rebanadas = aplicar_permutacion_rebanadas(rebanadas, P_LAYER)
+
+    agregar_clave_rebanadas_carriles(rebanadas, rebanadas_claves[31])
+
+    return desempaquetar_bloques(rebanadas, len(bloques))
+
+
+def present_descifrar_bloques_bitslice_multiclave(bloques, rebanadas_claves):
+    if not bloques:
+        return []
+    mascara = (1 << len(bloques)) - 1
+    rebanadas = empaquetar_bloques(bloques)
+
+    agregar_clave_rebanadas_carriles(rebanadas, rebanadas_claves[31])
+
+    for i in range(30, -1, -1):
+        rebanadas = aplicar_permutacion_rebanadas(rebanadas, INV_P_LAYER)
+        aplicar_sbox_inversa_rebanadas(rebanadas, mascara)
+        agregar_clave_rebanadas_carriles(rebanadas, rebanadas_claves[i])
+
+    return desempaquetar_bloques(rebanadas, len(bloques))
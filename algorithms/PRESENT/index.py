@@ -1,9 +1,25 @@
+from array import array
+
 from .constants import SBOX, INV_SBOX, P_LAYER, INV_P_LAYER
-from algorithms.utils.index import string_a_bits, bits_a_entero, entero_a_bits
+from .bitslice import present_cifrar_bloques_bitslice, present_descifrar_bloques_bitslice
+from algorithms.utils.index import (
+    bits_a_entero,
+    entero_a_bits,
+    a_bytes,
+    vista_bytes,
+    dividir_bloques,
+    enteros_a_bytes,
+    bits_a_bytes,
+    bytes_a_bits,
+)
+from algorithms.utils.cache import CACHE_CLAVES, borrar_material_clave
 
 
 def generar_claves_ronda(clave_80):
-    registro_clave = bits_a_entero(clave_80)
+    return expandir_registro_clave(bits_a_entero(clave_80))
+
+
+def expandir_registro_clave(registro_clave):
     claves_ronda = []
 
     for i in range(1, 33):
@@ -56,9 +72,7 @@ def aplicar_permutacion_inversa(estado):
     return resultado
 
 
-def present_cifrar_bloque(bloque_64, claves_ronda):
-    estado = bits_a_entero(bloque_64)
-
+def present_cifrar_entero(estado, claves_ronda):
     for i in range(31):
         estado ^= claves_ronda[i]
         estado = aplicar_sbox(estado)
@@ -66,12 +80,10 @@ def present_cifrar_bloque(bloque_64, claves_ronda):
 
     estado ^= claves_ronda[31]
 
-    return entero_a_bits(estado, 64)
+    return estado
 
 
-def present_descifrar_bloque(bloque_64, claves_ronda):
-    estado = bits_a_entero(bloque_64)
-
+def present_descifrar_entero(estado, claves_ronda):
     estado ^= claves_ronda[31]
 
     for i in range(30, -1, -1):
@@ -79,41 +91,260 @@ def present_descifrar_bloque(bloque_64, claves_ronda):
         estado = aplicar_sbox_inversa(estado)
         estado ^= claves_ronda[i]
 
-    return entero_a_bits(estado, 64)
+    return estado
+
+
+def present_cifrar_bloque(bloque_64, claves_ronda):
+    return entero_a_bits(present_cifrar_entero(bits_a_entero(bloque_64), claves_ronda), 64)
+
+
+def present_descifrar_bloque(bloque_64, claves_ronda):
+    return entero_a_bits(present_descifrar_entero(bits_a_entero(bloque_64), claves_ronda), 64)
+
+
+def present_cifrar_bloques(bloques, claves_ronda):
+    return [present_cifrar_entero(bloque, claves_ronda) for bloque in bloques]
+
+
+def present_descifrar_bloques(bloques, claves_ronda):
+    return [present_descifrar_entero(bloque, claves_ronda) for bloque in bloques]
+
+
+# Motor de tablas
+# sLayer actúa por nibbles y pLayer es lineal, así que una ronda es el OR de lo que
+# aporta cada byte del estado: 8 consultas a tablas de 256 enteros de 64 bits.
+
+
+def generar_tablas_ronda(caja, permutacion):
+    return [
+        [permutacion((caja[byte & 0xF] | (caja[byte >> 4] << 4)) << (8 * j)) for byte in range(256)]
+        for j in range(8)
+    ]
+
+
+# TR_j[b] = pLayer(sLayer(b << 8j)); TRI_j[b] = pLayer⁻¹(sLayer⁻¹(b << 8j))
+TR0, TR1, TR2, TR3, TR4, TR5, TR6, TR7 = generar_tablas_ronda(SBOX, aplicar_permutacion)
+TRI0, TRI1, TRI2, TRI3, TRI4, TRI5, TRI6, TRI7 = generar_tablas_ronda(INV_SBOX, aplicar_permutacion_inversa)
+# TPI_j[b] = pLayer⁻¹(b << 8j), solo para entrar al descifrado
+TPI0, TPI1, TPI2, TPI3, TPI4, TPI5, TPI6, TPI7 = generar_tablas_ronda(range(16), aplicar_permutacion_inversa)
+SBOX_INVERSA_BYTES = bytes(INV_SBOX[byte & 0xF] | (INV_SBOX[byte >> 4] << 4) for byte in range(256))
+
+
+def permutar_inversa_tablas(estado):
+    return (
+        TPI0[estado & 0xFF] | TPI1[(estado >> 8) & 0xFF] | TPI2[(estado >> 16) & 0xFF] | TPI3[(estado >> 24) & 0xFF]
+        | TPI4[(estado >> 32) & 0xFF] | TPI5[(estado >> 40) & 0xFF] | TPI6[(estado >> 48) & 0xFF] | TPI7[estado >> 56]
+    )
+
+
+def present_cifrar_entero_tablas(estado, claves_ronda):
+    for i in range(31):
+        estado ^= claves_ronda[i]
+        estado = (
+            TR0[estado & 0xFF] | TR1[(estado >> 8) & 0xFF] | TR2[(estado >> 16) & 0xFF] | TR3[(estado >> 24) & 0xFF]
+            | TR4[(estado >> 32) & 0xFF] | TR5[(estado >> 40) & 0xFF] | TR6[(estado >> 48) & 0xFF] | TR7[estado >> 56]
+        )
+
+    return estado ^ claves_ronda[31]
+
+
+def present_descifrar_entero_tablas(estado, claves_ronda):
+    # Se trabaja tras pLayer⁻¹: pLayer⁻¹(sLayer⁻¹(x) ^ k) = TRI(x) ^ pLayer⁻¹(k), y las
+    # claves pLayer⁻¹(k) están precalculadas en claves_ronda[32:]
+    estado = permutar_inversa_tablas(estado ^ claves_ronda[31])
+
+    for i in range(62, 32, -1):
+        estado = (
+            TRI0[estado & 0xFF] | TRI1[(estado >> 8) & 0xFF] | TRI2[(estado >> 16) & 0xFF] | TRI3[(estado >> 24) & 0xFF]
+            | TRI4[(estado >> 32) & 0xFF] | TRI5[(estado >> 40) & 0xFF] | TRI6[(estado >> 48) & 0xFF] | TRI7[estado >> 56]
+        ) ^ claves_ronda[i]
+
+    # La última ronda solo deshace sLayer, byte a byte
+    return int.from_bytes(estado.to_bytes(8, "big").translate(SBOX_INVERSA_BYTES), "big") ^ claves_ronda[0]
+
+
+def present_cifrar_bloques_tablas(bloques, claves_ronda):
+    return [present_cifrar_entero_tablas(bloque, claves_ronda) for bloque in bloques]
+
+
+def present_descifrar_bloques_tablas(bloques, claves_ronda):
+    return [present_descifrar_entero_tablas(bloque, claves_ronda) for bloque in bloques]
+
+
+# Motor de claves al vuelo
+# Solo guarda el registro de clave de 80 bits y el cifrado lo actualiza ronda a ronda.
+# Este registro no se puede recorrer hacia atrás (actualizar_registro combina la S-box
+# con OR sobre el nibble superior, como expandir_registro_clave), así que el descifrado
+# deriva las claves una vez por llamada y las descarta al terminar. Con pocos bloques
+# basta con las 32 claves y rondas pLayer⁻¹ + sLayer⁻¹ separadas; con más compensa
+# precalcular también sus imágenes por pLayer⁻¹ y usar las rondas del motor de tablas.
+
+MASCARA_64 = (1 << 64) - 1
+MASCARA_80 = (1 << 80) - 1
+MAXIMO_BLOQUES_SIN_TABLAS = 2
+
+
+def actualizar_registro(registro_clave, contador):
+    registro_clave = ((registro_clave << 61) | (registro_clave >> 19)) & MASCARA_80
+    registro_clave = (registro_clave & 0x0FFFFFFFFFFFFFFFFFFFF) | (SBOX[registro_clave >> 76] << 76)
+    return registro_clave ^ (contador << 15)
+
+
+def present_cifrar_entero_al_vuelo(estado, registros):
+    # Las claves de más de 80 bits entran completas al registro, como en expandir_registro_clave
+    registro_clave = registros[0]
+    for i in range(1, 32):
+        estado ^= (registro_clave >> 16) & MASCARA_64
+        estado = (
+            TR0[estado & 0xFF] | TR1[(estado >> 8) & 0xFF] | TR2[(estado >> 16) & 0xFF] | TR3[(estado >> 24) & 0xFF]
+            | TR4[(estado >> 32) & 0xFF] | TR5[(estado >> 40) & 0xFF] | TR6[(estado >> 48) & 0xFF] | TR7[estado >> 56]
+        )
+        registro_clave = actualizar_registro(registro_clave, i)
+
+    return estado ^ ((registro_clave >> 16) & MASCARA_64)
+
+
+def present_descifrar_entero_claves(estado, claves_ronda):
+    # Sin claves pLayer⁻¹ precalculadas: cada ronda aplica pLayer⁻¹ por tablas y sLayer⁻¹ por bytes
+    estado ^= claves_ronda[31]
+    for i in range(30, -1, -1):
+        estado = int.from_bytes(
+            permutar_inversa_tablas(estado).to_bytes(8, "big").translate(SBOX_INVERSA_BYTES), "big"
+        ) ^ claves_ronda[i]
+    return estado
+
+
+def present_descifrar_entero_al_vuelo(estado, registros):
+    return present_descifrar_entero_claves(estado, expandir_registro_clave(registros[0]))
+
+
+def present_cifrar_bloques_al_vuelo(bloques, registros):
+    return [present_cifrar_entero_al_vuelo(bloque, registros) for bloque in bloques]
+
+
+def present_descifrar_bloques_al_vuelo(bloques, registros):
+    if len(bloques) <= MAXIMO_BLOQUES_SIN_TABLAS:
+        claves_ronda = expandir_registro_clave(registros[0])
+        return [present_descifrar_entero_claves(bloque, claves_ronda) for bloque in bloques]
+    return present_descifrar_bloques_tablas(bloques, expandir_claves_tablas(registros[0]))
+
+
+# Funciones main
+
+
+def expandir_claves(registro_clave):
+    return array("Q", expandir_registro_clave(registro_clave))
+
+
+def expandir_claves_tablas(registro_clave):
+    # 32 claves de ronda seguidas de sus imágenes por pLayer⁻¹ para el descifrado
+    claves_ronda = expandir_registro_clave(registro_clave)
+    return array("Q", claves_ronda + [permutar_inversa_tablas(clave) for clave in claves_ronda])
+
+
+# motor: "referencia" (bloque a bloque), "bitslice" (todos los bloques por ronda),
+# "tablas" (bloque a bloque, sLayer y pLayer fusionadas en 8 consultas por ronda) o
+# "al_vuelo" (rondas de tablas con claves derivadas durante el bloque, poca memoria).
+# Cada motor da (cifrar bloques, descifrar bloques, cifrar un bloque, descifrar un
+# bloque, preparar claves desde el registro de 80 bits); bitslice no compensa con un
+# solo bloque y usa las tablas.
+MOTORES = {
+    "referencia": (
+        present_cifrar_bloques, present_descifrar_bloques,
+        present_cifrar_entero, present_descifrar_entero, expandir_claves,
+    ),
+    "bitslice": (
+        present_cifrar_bloques_bitslice, present_descifrar_bloques_bitslice,
+        present_cifrar_entero_tablas, present_descifrar_entero_tablas, expandir_claves_tablas,
+    ),
+    "tablas": (
+        present_cifrar_bloques_tablas, present_descifrar_bloques_tablas,
+        present_cifrar_entero_tablas, present_descifrar_entero_tablas, expandir_claves_tablas,
+    ),
+    "al_vuelo": (
+        present_cifrar_bloques_al_vuelo, present_descifrar_bloques_al_vuelo,
+        present_cifrar_entero_al_vuelo, present_descifrar_entero_al_vuelo, lambda registro_clave: [registro_clave],
+    ),
+}
+
+# Tablas a nivel de módulo que usa cada motor, expansión de clave incluida; bitslice
+# solo necesita pLayer y pLayer⁻¹ más las tablas de su camino de un bloque
+NOMBRES_TABLAS_RONDA = tuple(f"{prefijo}{i}" for prefijo in ("TR", "TRI", "TPI") for i in range(8))
+TABLAS_MOTORES = {
+    "referencia": ("SBOX", "INV_SBOX", "P_LAYER", "INV_P_LAYER"),
+    "bitslice": ("P_LAYER", "INV_P_LAYER", *NOMBRES_TABLAS_RONDA, "SBOX_INVERSA_BYTES", "SBOX"),
+    "tablas": (*NOMBRES_TABLAS_RONDA, "SBOX_INVERSA_BYTES", "SBOX"),
+    "al_vuelo": (*NOMBRES_TABLAS_RONDA, "SBOX_INVERSA_BYTES", "SBOX"),
+}
+
+
+def seleccionar_motor(motor):
+    if motor not in MOTORES:
+        raise ValueError(f"Motor PRESENT desconocido: {motor!r} (opciones: {', '.join(MOTORES)})")
+    return MOTORES[motor]
+
+
+def preparar_clave(clave):
+    # Claves cortas se rellenan con ceros hasta 80 bits; las largas entran completas al registro
+    return a_bytes(clave).ljust(10, b"\x00")
+
+
+class PRESENT80:
+    """PRESENT-80 context: the round keys are prepared once, in the layout of the chosen engine"""
+
+    TAMANIO_BLOQUE = 8
+
+    __slots__ = ("motor", "claves_ronda", "funcion_cifrado", "funcion_descifrado", "cifrar_entero", "descifrar_entero")
+
+    def __init__(self, clave, motor="referencia"):
+        (
+            self.funcion_cifrado, self.funcion_descifrado, self.cifrar_entero, self.descifrar_entero, preparar_claves
+        ) = seleccionar_motor(motor)
+        self.motor = motor
+        self.claves_ronda = preparar_claves(int.from_bytes(preparar_clave(clave), "big"))
+
+    def cifrar_bloque(self, bloque):
+        if len(bloque) != 8:
+            raise ValueError("PRESENT-80 opera sobre bloques de 8 bytes")
+        return self.cifrar_entero(int.from_bytes(bloque, "big"), self.claves_ronda).to_bytes(8, "big")
+
+    def descifrar_bloque(self, bloque):
+        if len(bloque) != 8:
+            raise ValueError("PRESENT-80 opera sobre bloques de 8 bytes")
+        return self.descifrar_entero(int.from_bytes(bloque, "big"), self.claves_ronda).to_bytes(8, "big")
+
+    def cifrar(self, datos):
+        bloques = [int.from_bytes(bloque, "big") for bloque in dividir_bloques(datos, 8)]
+        return enteros_a_bytes(self.funcion_cifrado(bloques, self.claves_ronda), 8)
+
+    def descifrar(self, datos):
+        vista = vista_bytes(datos)
+        if len(vista) % 8:
+            raise ValueError("El texto cifrado PRESENT debe tener una longitud múltiplo de 8 bytes")
 
+        bloques = [int.from_bytes(vista[i: i + 8], "big") for i in range(0, len(vista), 8)]
+        return enteros_a_bytes(self.funcion_descifrado(bloques, self.claves_ronda), 8)
 
-def PRESENT_cifrar(texto_plano, clave):
-    bits_texto_plano = string_a_bits(texto_plano)
+    def borrar(self):
+        borrar_material_clave(self.claves_ronda)
 
-    bits_clave = string_a_bits(clave)
-    if len(bits_clave) < 80:
-        bits_clave = bits_clave + [0] * (80 - len(bits_clave))
 
-    relleno_necesario = (64 - (len(bits_texto_plano) % 64)) % 64
-    bits_texto_plano = bits_texto_plano + [0] * relleno_necesario
+def obtener_contexto(clave, motor="referencia"):
+    bytes_clave = preparar_clave(clave)
+    return CACHE_CLAVES.obtener(f"PRESENT-80/{motor}", bytes_clave, lambda: PRESENT80(bytes_clave, motor))
 
-    claves_ronda = generar_claves_ronda(bits_clave)
 
-    bits_texto_cifrado = []
-    for i in range(0, len(bits_texto_plano), 64):
-        bloque = bits_texto_plano[i: i + 64]
-        bloque_cifrado = present_cifrar_bloque(bloque, claves_ronda)
-        bits_texto_cifrado.extend(bloque_cifrado)
+def PRESENT_cifrar_bytes(datos, clave, motor="referencia"):
+    return obtener_contexto(clave, motor).cifrar(datos)
 
-    return bits_texto_cifrado
 
+def PRESENT_descifrar_bytes(datos, clave, motor="referencia"):
+    return obtener_contexto(clave, motor).descifrar(datos)
 
-def PRESENT_descifrar(bits_texto_cifrado, clave):
-    bits_clave = string_a_bits(clave)
-    if len(bits_clave) < 80:
-        bits_clave = bits_clave + [0] * (80 - len(bits_clave))
 
-    claves_ronda = generar_claves_ronda(bits_clave)
+def PRESENT_cifrar(texto_plano, clave, motor="referencia"):
+    return bytes_a_bits(PRESENT_cifrar_bytes(texto_plano, clave, motor))
 
-    bits_texto_plano = []
-    for i in range(0, len(bits_texto_cifrado), 64):
-        bloque = bits_texto_cifrado[i: i + 64]
-        bloque_descifrado = present_descifrar_bloque(bloque, claves_ronda)
-        bits_texto_plano.extend(bloque_descifrado)
 
-    return bits_texto_plano
+def PRESENT_descifrar(bits_texto_cifrado, clave, motor="referencia"):
+    return bytes_a_bits(PRESENT_descifrar_bytes(bits_a_bytes(bits_texto_cifrado), clave, motor))
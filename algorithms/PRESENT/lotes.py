@@ -0,0 +1,110 @@
+# Motor PRESENT-80 multiclave: bloques cifrados con claves distintas en una sola pasada
+# bitslice. Cada carril lleva 32 claves de ronda de 64 bits, 32 veces más bits que su
+# bloque, así que esas claves se empaquetan en rebanadas con NumPy (packbits por bit
+# de clave) y las rondas son las del motor bitslice.
+import numpy as np
+
+from .bitslice import present_cifrar_bloques_bitslice_multiclave, present_descifrar_bloques_bitslice_multiclave
+from .constants import SBOX
+from .index import MASCARA_64
+from algorithms.utils.index import dividir_bloques, enteros_a_bytes, vista_bytes
+
+
+def empaquetar_claves_carriles(claves_carriles):
+    # Como empaquetar_bloques: el carril 0 queda en el bit más alto de cada rebanada
+    claves = np.array([claves_ronda[:32] for claves_ronda in claves_carriles], dtype=np.uint64).T.copy()
+    # (ronda, bit, bytes de carriles): el bit i de cada clave de todos los carriles, en bytes
+    empaquetados = np.stack(
+        [np.packbits(((claves >> np.uint64(i)) & np.uint64(1)).astype(np.uint8), axis=1) for i in range(64)], axis=1
+    )
+    tamanio_rebanada = empaquetados.shape[2]
+    contenido = empaquetados.tobytes()
+    relleno = -len(claves_carriles) % 8
+    return [
+        [
+            int.from_bytes(contenido[inicio: inicio + tamanio_rebanada], "big") >> relleno
+            for inicio in range(64 * ronda * tamanio_rebanada, 64 * (ronda + 1) * tamanio_rebanada, tamanio_rebanada)
+        ]
+        for ronda in range(32)
+    ]
+
+
+def validar_claves_ronda(claves_ronda):
+    # El motor al_vuelo solo guarda el registro de la clave, sin claves de ronda
+    if len(claves_ronda) < 32 or not all(0 <= clave_ronda <= MASCARA_64 for clave_ronda in claves_ronda[:32]):
+        raise ValueError(
+            "Se esperaban 32 claves de ronda de 64 bits (claves_ronda de los motores referencia, bitslice o tablas)"
+        )
+
+
+def present_procesar_multiclave(funcion, mensajes, descifrar):
+    bloques = []
+    claves_carriles = []
+    numeros_bloques = []
+    for claves_ronda, mensaje in mensajes:
+        if descifrar and len(vista_bytes(mensaje)) % 8:
+            raise ValueError("El texto cifrado PRESENT debe tener una longitud múltiplo de 8 bytes")
+        validar_claves_ronda(claves_ronda)
+        bloques_mensaje = [int.from_bytes(bloque, "big") for bloque in dividir_bloques(mensaje, 8)]
+        bloques.extend(bloques_mensaje)
+        claves_carriles.extend([claves_ronda] * len(bloques_mensaje))
+        numeros_bloques.append(len(bloques_mensaje))
+
+    salida = funcion(bloques, empaquetar_claves_carriles(claves_carriles)) if bloques else []
+    resultados = []
+    inicio = 0
+    for numero_bloques in numeros_bloques:
+        resultados.append(enteros_a_bytes(salida[inicio: inicio + numero_bloques], 8))
+        inicio += numero_bloques
+    return resultados
+
+
+def present_cifrar_multiclave(mensajes):
+    """Encrypt (claves_ronda, datos) pairs, each under its own key, in one bitsliced pass.
+
+    claves_ronda starts with the 32 round keys of generar_claves_ronda or expandir_registro_clave,
+    e.g. PRESENT80(clave, motor).claves_ronda for the referencia, bitslice and tablas engines;
+    al_vuelo keeps only the key register and raises ValueError. Same zero-padded ECB output
+    as PRESENT80.cifrar.
+    """
+    return present_procesar_multiclave(present_cifrar_bloques_bitslice_multiclave, mensajes, descifrar=False)
+
+
+def present_descifrar_multiclave(mensajes):
+    return present_procesar_multiclave(present_descifrar_bloques_bitslice_multiclave, mensajes, descifrar=True)
+
+
+# Expansión de claves en bloque
+# El registro de 80 bits de cada clave se guarda como dos uint64: los 16 bits altos y
+# los 64 bajos. Cada paso de expandir_registro_clave se aplica a todas las claves.
+
+SBOX_NP = np.array(SBOX, dtype=np.uint64)
+
+
+def expandir_claves_lote(claves):
+    """Expand an (N, L) uint8 array of PRESENT keys (L <= 10) into (N, 32) uint64 round keys.
+
+    Shorter keys are zero-padded to 80 bits as in preparar_clave; row i matches
+    expandir_registro_clave for key i (and PRESENT80(clave).claves_ronda[:32]).
+    """
+    claves = np.asarray(claves, dtype=np.uint8)
+    if claves.ndim != 2 or claves.shape[1] > 10:
+        raise ValueError("Se esperaba un arreglo (N, L) de claves PRESENT con L <= 10 bytes")
+
+    registro = np.zeros((len(claves), 10), dtype=np.uint8)
+    registro[:, :claves.shape[1]] = claves
+    alto = registro[:, :2].copy().view(">u2")[:, 0].astype(np.uint64)
+    bajo = registro[:, 2:].copy().view(">u8")[:, 0].astype(np.uint64)
+
+    claves_ronda = np.empty((len(claves), 32), dtype=np.uint64)
+    for i in range(1, 33):
+        claves_ronda[:, i - 1] = (alto << np.uint64(48)) | (bajo >> np.uint64(16))
+        # Rotación de 61 bits a la izquierda sobre 80 bits, repartida entre las dos mitades
+        alto, bajo = (
+            (bajo >> np.uint64(3)) & np.uint64(0xFFFF),
+            (bajo << np.uint64(61)) | (alto << np.uint64(45)) | (bajo >> np.uint64(19)),
+        )
+        # Como expandir_registro_clave, la S-box se combina con OR sobre el nibble superior
+        alto |= SBOX_NP[alto >> np.uint64(12)] << np.uint64(12)
+        bajo ^= np.uint64(i << 15)
+    return claves_ronda
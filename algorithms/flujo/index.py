@@ -0,0 +1,150 @@
+# Cifrado y descifrado incremental (actualizar/finalizar) para archivos y sockets.
+# Solo se retiene el bloque parcial entre trozos, así que la memoria no crece con la entrada.
+import os
+from contextlib import nullcontext
+
+from algorithms.modos.index import (
+    CifradorCTR,
+    aplicar_relleno,
+    quitar_relleno,
+    cifrar_cbc,
+    descifrar_cbc,
+    validar_bloque_inicial,
+)
+
+MODOS = ("ecb", "cbc", "ctr")
+TAMANIO_TROZO = 64 * 1024
+
+
+class ProcesadorFlujo:
+    """Common chunk buffering for CifradorFlujo and DescifradorFlujo"""
+
+    __slots__ = ("contexto", "modo", "relleno", "encadenamiento", "ctr", "pendiente", "finalizado")
+
+    def __init__(self, contexto, modo="ctr", vector_inicial=None, relleno="pkcs7"):
+        if modo not in MODOS:
+            raise ValueError(f"Modo desconocido: {modo!r} (opciones: {', '.join(MODOS)})")
+        if modo != "ecb":
+            if vector_inicial is None:
+                raise ValueError(f"El modo {modo.upper()} requiere un vector inicial")
+            validar_bloque_inicial(contexto, vector_inicial, "vector inicial")
+
+        self.contexto = contexto
+        self.modo = modo
+        self.relleno = relleno
+        self.encadenamiento = bytes(vector_inicial) if modo == "cbc" else None
+        self.ctr = CifradorCTR(contexto, vector_inicial) if modo == "ctr" else None
+        self.pendiente = bytearray()
+        self.finalizado = False
+
+    def actualizar(self, trozo):
+        if self.finalizado:
+            raise ValueError("El flujo ya fue finalizado")
+        if self.ctr is not None:
+            return self.ctr.procesar(trozo)
+
+        self.pendiente += trozo
+        listos = self.bytes_listos(len(self.pendiente))
+        if not listos:
+            return b""
+        bloques = bytes(self.pendiente[:listos])
+        del self.pendiente[:listos]
+        return self.procesar_bloques(bloques)
+
+    def finalizar(self):
+        if self.finalizado:
+            raise ValueError("El flujo ya fue finalizado")
+        self.finalizado = True
+        if self.ctr is not None:
+            return b""
+        resto = bytes(self.pendiente)
+        self.pendiente.clear()
+        return self.cerrar(resto)
+
+
+class CifradorFlujo(ProcesadorFlujo):
+    __slots__ = ()
+
+    def bytes_listos(self, disponibles):
+        return disponibles - disponibles % self.contexto.TAMANIO_BLOQUE
+
+    def procesar_bloques(self, bloques):
+        if self.modo == "ecb":
+            return self.contexto.cifrar(bloques)
+        salida = cifrar_cbc(self.contexto, self.encadenamiento, bloques, "ninguno")
+        if salida:
+            self.encadenamiento = salida[-self.contexto.TAMANIO_BLOQUE:]
+        return salida
+
+    def cerrar(self, resto):
+        return self.procesar_bloques(aplicar_relleno(resto, self.contexto.TAMANIO_BLOQUE, self.relleno))
+
+
+class DescifradorFlujo(ProcesadorFlujo):
+    __slots__ = ()
+
+    def bytes_listos(self, disponibles):
+        tamanio_bloque = self.contexto.TAMANIO_BLOQUE
+        if self.relleno == "pkcs7":
+            # El último bloque completo se retiene hasta finalizar() porque lleva el relleno
+            return max(disponibles - 1, 0) // tamanio_bloque * tamanio_bloque
+        return disponibles - disponibles % tamanio_bloque
+
+    def procesar_bloques(self, bloques):
+        if self.modo == "ecb":
+            return self.contexto.descifrar(bloques)
+        salida = descifrar_cbc(self.contexto, self.encadenamiento, bloques, "ninguno")
+        self.encadenamiento = bloques[-self.contexto.TAMANIO_BLOQUE:]
+        return salida
+
+    def cerrar(self, resto):
+        if len(resto) % self.contexto.TAMANIO_BLOQUE:
+            raise ValueError(f"El texto cifrado debe ser múltiplo de {self.contexto.TAMANIO_BLOQUE} bytes")
+        if not resto:
+            if self.relleno == "pkcs7":
+                raise ValueError("Relleno PKCS#7 inválido")
+            return b""
+        return quitar_relleno(self.procesar_bloques(resto), self.contexto.TAMANIO_BLOQUE, self.relleno)
+
+
+# Funciones para archivos
+
+
+def abrir(origen, modo):
+    if isinstance(origen, (str, os.PathLike)):
+        return open(origen, modo)
+    return nullcontext(origen)
+
+
+def leer_trozos(origen, tamanio_trozo=TAMANIO_TROZO):
+    with abrir(origen, "rb") as archivo:
+        while True:
+            trozo = archivo.read(tamanio_trozo)
+            if not trozo:
+                return
+            yield trozo
+
+
+def procesar_archivo(procesador, origen, destino, tamanio_trozo):
+    bytes_escritos = 0
+    with abrir(destino, "wb") as archivo_destino:
+        for trozo in leer_trozos(origen, tamanio_trozo):
+            salida = procesador.actualizar(trozo)
+            archivo_destino.write(salida)
+            bytes_escritos += len(salida)
+        salida = procesador.finalizar()
+        archivo_destino.write(salida)
+        bytes_escritos += len(salida)
+    return bytes_escritos
+
+
+def cifrar_archivo(contexto, origen, destino, modo="ctr", vector_inicial=None, relleno="pkcs7",
+                   tamanio_trozo=TAMANIO_TROZO):
+    procesador = CifradorFlujo(contexto, modo, vector_inicial, relleno)
+    return procesar_archivo(procesador, origen, destino, tamanio_trozo)
+
+
+def descifrar_archivo(contexto, origen, destino, modo="ctr", vector_inicial=None, relleno="pkcs7",
+                      tamanio_trozo=TAMANIO_TROZO):
+    procesador = DescifradorFlujo(contexto, modo, vector_inicial, relleno)
+    return procesar_archivo(procesador, origen, destino, tamanio_trozo)
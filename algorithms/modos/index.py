@@ -0,0 +1,140 @@
+# Modos de operación (ECB, CBC, CTR) sobre los contextos AES128, DES y PRESENT80.
+# Cualquier objeto con TAMANIO_BLOQUE, cifrar_bloque, cifrar y descifrar sirve.
+from algorithms.utils.index import vista_bytes, xor_bytes, rellenar_pkcs7, quitar_relleno_pkcs7
+
+RELLENOS = ("pkcs7", "ceros", "ninguno")
+
+
+def aplicar_relleno(datos, tamanio_bloque, relleno):
+    if relleno not in RELLENOS:
+        raise ValueError(f"Relleno desconocido: {relleno!r} (opciones: {', '.join(RELLENOS)})")
+    if relleno == "pkcs7":
+        return rellenar_pkcs7(datos, tamanio_bloque)
+    if relleno == "ceros":
+        return bytes(datos) + b"\x00" * (-len(datos) % tamanio_bloque)
+    if len(datos) % tamanio_bloque:
+        raise ValueError(f"Sin relleno los datos deben ser múltiplo de {tamanio_bloque} bytes")
+    return bytes(datos)
+
+
+def quitar_relleno(datos, tamanio_bloque, relleno):
+    if relleno == "pkcs7":
+        return quitar_relleno_pkcs7(datos, tamanio_bloque)
+    return datos
+
+
+def validar_bloque_inicial(contexto, valor, nombre):
+    if len(valor) != contexto.TAMANIO_BLOQUE:
+        raise ValueError(f"El {nombre} debe tener {contexto.TAMANIO_BLOQUE} bytes")
+
+
+def validar_texto_cifrado(contexto, datos):
+    if len(datos) % contexto.TAMANIO_BLOQUE:
+        raise ValueError(f"El texto cifrado debe ser múltiplo de {contexto.TAMANIO_BLOQUE} bytes")
+
+
+# ECB
+
+
+def cifrar_ecb(contexto, datos, relleno="pkcs7"):
+    return contexto.cifrar(aplicar_relleno(vista_bytes(datos), contexto.TAMANIO_BLOQUE, relleno))
+
+
+def descifrar_ecb(contexto, datos, relleno="pkcs7"):
+    validar_texto_cifrado(contexto, datos)
+    return quitar_relleno(contexto.descifrar(datos), contexto.TAMANIO_BLOQUE, relleno)
+
+
+# CBC
+
+
+def cifrar_cbc(contexto, vector_inicial, datos, relleno="pkcs7"):
+    validar_bloque_inicial(contexto, vector_inicial, "vector inicial")
+    tamanio_bloque = contexto.TAMANIO_BLOQUE
+    datos = aplicar_relleno(vista_bytes(datos), tamanio_bloque, relleno)
+
+    # El encadenamiento es secuencial: cada bloque depende del cifrado anterior
+    previo = int.from_bytes(vector_inicial, "big")
+    texto_cifrado = bytearray()
+    for i in range(0, len(datos), tamanio_bloque):
+        bloque = (int.from_bytes(datos[i: i + tamanio_bloque], "big") ^ previo).to_bytes(tamanio_bloque, "big")
+        bloque_cifrado = contexto.cifrar_bloque(bloque)
+        texto_cifrado.extend(bloque_cifrado)
+        previo = int.from_bytes(bloque_cifrado, "big")
+
+    return bytes(texto_cifrado)
+
+
+def descifrar_cbc(contexto, vector_inicial, datos, relleno="pkcs7"):
+    validar_bloque_inicial(contexto, vector_inicial, "vector inicial")
+    validar_texto_cifrado(contexto, datos)
+    datos = bytes(datos)
+
+    # Descifrar sí es paralelo: todos los bloques en una pasada y un XOR masivo
+    anteriores = bytes(vector_inicial) + datos[: -contexto.TAMANIO_BLOQUE]
+    texto_plano = xor_bytes(contexto.descifrar(datos), anteriores)
+    return quitar_relleno(texto_plano, contexto.TAMANIO_BLOQUE, relleno)
+
+
+# CTR
+
+
+def generar_flujo_clave(contexto, contador, numero_bloques):
+    tamanio_bloque = contexto.TAMANIO_BLOQUE
+    modulo = 1 << (8 * tamanio_bloque)
+    bloques_contador = b"".join(
+        ((contador + i) % modulo).to_bytes(tamanio_bloque, "big") for i in range(numero_bloques)
+    )
+    # Todos los bloques de contador se cifran en una sola llamada (motores por lotes)
+    return contexto.cifrar(bloques_contador)
+
+
+class CifradorCTR:
+    """CTR keystream that carries its position across calls and can be precomputed ahead of the data.
+
+    The counter block is the full initial block (nonce || counter) incremented as
+    one big-endian integer. The same object encrypts and decrypts.
+    """
+
+    __slots__ = ("contexto", "contador", "flujo_pendiente", "posicion")
+
+    def __init__(self, contexto, contador_inicial):
+        validar_bloque_inicial(contexto, contador_inicial, "contador inicial")
+        self.contexto = contexto
+        self.contador = int.from_bytes(contador_inicial, "big")
+        # El flujo ya consumido queda antes de `posicion` hasta la siguiente compactación
+        self.flujo_pendiente = bytearray()
+        self.posicion = 0
+
+    def compactar(self):
+        del self.flujo_pendiente[: self.posicion]
+        self.posicion = 0
+
+    def precalcular(self, numero_bytes):
+        faltantes = numero_bytes - (len(self.flujo_pendiente) - self.posicion)
+        if faltantes <= 0:
+            return
+        self.compactar()
+        tamanio_bloque = self.contexto.TAMANIO_BLOQUE
+        numero_bloques = -(-faltantes // tamanio_bloque)
+        self.flujo_pendiente += generar_flujo_clave(self.contexto, self.contador, numero_bloques)
+        self.contador = (self.contador + numero_bloques) % (1 << (8 * tamanio_bloque))
+
+    def procesar(self, datos):
+        datos = vista_bytes(datos)
+        self.precalcular(len(datos))
+        inicio = self.posicion
+        self.posicion += len(datos)
+        resultado = xor_bytes(datos, self.flujo_pendiente[inicio: self.posicion])
+        # Compactar solo cuando lo consumido supera a lo pendiente mantiene el coste amortizado lineal
+        if 2 * self.posicion > len(self.flujo_pendiente):
+            self.compactar()
+        return resultado
+
+
+def cifrar_ctr(contexto, contador_inicial, datos):
+    return CifradorCTR(contexto, contador_inicial).procesar(datos)
+
+
+def descifrar_ctr(contexto, contador_inicial, datos):
+    return CifradorCTR(contexto, contador_inicial).procesar(datos)
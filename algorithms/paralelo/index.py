@@ -0,0 +1,116 @@
+# Cifrado masivo en varios núcleos con un grupo persistente de procesos.
+# Cada proceso recibe el contexto (claves de ronda ya expandidas) una sola vez al
+# arrancar; después solo viajan trozos de datos y el resultado se reensambla en orden.
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from algorithms.modos.index import aplicar_relleno, quitar_relleno, cifrar_ctr, validar_bloque_inicial
+from algorithms.utils.index import a_bytes, vista_bytes
+
+TAMANIO_TROZO = 64 * 1024
+CANDIDATOS_TROZO = (4 * 1024, 16 * 1024, 64 * 1024, 256 * 1024)
+
+CONTEXTO_TRABAJADOR = None
+
+
+# Funciones ejecutadas dentro de cada proceso trabajador
+
+
+def inicializar_trabajador(contexto):
+    global CONTEXTO_TRABAJADOR
+    CONTEXTO_TRABAJADOR = contexto
+
+
+def trabajador_cifrar(trozo):
+    return CONTEXTO_TRABAJADOR.cifrar(trozo)
+
+
+def trabajador_descifrar(trozo):
+    return CONTEXTO_TRABAJADOR.descifrar(trozo)
+
+
+def trabajador_ctr(argumentos):
+    contador, trozo = argumentos
+    return cifrar_ctr(CONTEXTO_TRABAJADOR, contador, trozo)
+
+
+def trabajador_mensajes(mensajes):
+    return [CONTEXTO_TRABAJADOR.cifrar(mensaje) for mensaje in mensajes]
+
+
+class GrupoParalelo:
+    """Persistent worker pool bound to one cipher context (AES128, DES or PRESENT80).
+
+    Use as a context manager or call cerrar() to stop the workers.
+    """
+
+    def __init__(self, contexto, numero_procesos=None, tamanio_trozo=TAMANIO_TROZO):
+        self.contexto = contexto
+        self.numero_procesos = numero_procesos or os.cpu_count() or 1
+        self.tamanio_trozo = tamanio_trozo
+        self.ejecutor = ProcessPoolExecutor(
+            max_workers=self.numero_procesos,
+            initializer=inicializar_trabajador,
+            initargs=(contexto,),
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    def cerrar(self):
+        self.ejecutor.shutdown()
+
+    def dividir(self, datos):
+        # Los trozos son múltiplos del tamaño de bloque para que cada proceso trabaje solo
+        tamanio_bloque = self.contexto.TAMANIO_BLOQUE
+        tamanio_trozo = max(self.tamanio_trozo - self.tamanio_trozo % tamanio_bloque, tamanio_bloque)
+        return [datos[i: i + tamanio_trozo] for i in range(0, len(datos), tamanio_trozo)]
+
+    def cifrar_ecb(self, datos, relleno="pkcs7"):
+        datos = aplicar_relleno(vista_bytes(datos), self.contexto.TAMANIO_BLOQUE, relleno)
+        return b"".join(self.ejecutor.map(trabajador_cifrar, self.dividir(datos)))
+
+    def descifrar_ecb(self, datos, relleno="pkcs7"):
+        datos = a_bytes(datos)
+        if len(datos) % self.contexto.TAMANIO_BLOQUE:
+            raise ValueError(f"El texto cifrado debe ser múltiplo de {self.contexto.TAMANIO_BLOQUE} bytes")
+        texto_plano = b"".join(self.ejecutor.map(trabajador_descifrar, self.dividir(datos)))
+        return quitar_relleno(texto_plano, self.contexto.TAMANIO_BLOQUE, relleno)
+
+    def cifrar_ctr(self, contador_inicial, datos):
+        validar_bloque_inicial(self.contexto, contador_inicial, "contador inicial")
+        tamanio_bloque = self.contexto.TAMANIO_BLOQUE
+        contador = int.from_bytes(contador_inicial, "big")
+        modulo = 1 << (8 * tamanio_bloque)
+
+        # Cada trozo arranca en el contador que le corresponde por su posición
+        trabajos = []
+        desplazamiento = 0
+        for trozo in self.dividir(a_bytes(datos)):
+            inicio = ((contador + desplazamiento // tamanio_bloque) % modulo).to_bytes(tamanio_bloque, "big")
+            trabajos.append((inicio, trozo))
+            desplazamiento += len(trozo)
+        return b"".join(self.ejecutor.map(trabajador_ctr, trabajos))
+
+    def descifrar_ctr(self, contador_inicial, datos):
+        return self.cifrar_ctr(contador_inicial, datos)
+
+    def cifrar_mensajes(self, mensajes, mensajes_por_tarea=64):
+        mensajes = [bytes(vista_bytes(mensaje)) for mensaje in mensajes]
+        lotes = [mensajes[i: i + mensajes_por_tarea] for i in range(0, len(mensajes), mensajes_por_tarea)]
+        return [cifrado for lote in self.ejecutor.map(trabajador_mensajes, lotes) for cifrado in lote]
+
+    def calibrar(self, datos_muestra, candidatos=CANDIDATOS_TROZO):
+        """Time cifrar_ecb for each candidate chunk size, keep the fastest and return the timings"""
+        tiempos = {}
+        for candidato in candidatos:
+            self.tamanio_trozo = candidato
+            inicio = time.perf_counter()
+            self.cifrar_ecb(datos_muestra)
+            tiempos[candidato] = time.perf_counter() - inicio
+        self.tamanio_trozo = min(tiempos, key=tiempos.get)
+        return tiempos
@@ -0,0 +1,171 @@
+# Despachador de microlotes para tráfico de mensajes cortos (1-4 bloques). Los mensajes
+# que llegan desde cualquier hilo se agrupan por (dirección, clave); cada grupo se
+# procesa con una sola llamada multibloque al contexto de su clave y los resultados se
+# devuelven a cada llamador. Un grupo sale cuando junta tamanio_lote mensajes o cuando
+# su mensaje más antiguo lleva espera_maxima segundos esperando: subir la espera da
+# lotes más grandes a cambio de latencia.
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, InvalidStateError
+
+from algorithms.servicio.index import procesar_lote
+from algorithms.utils.index import a_bytes, vista_bytes
+
+ESPERA_MAXIMA_SEGUNDOS = 0.001
+TAMANIO_LOTE = 64
+
+
+def entregar(futuro, resultado=None, error=None):
+    # Un futuro ya resuelto no debe terminar el hilo despachador ni dejar sin respuesta al resto del lote
+    if futuro.done():
+        return
+    try:
+        if error is not None:
+            futuro.set_exception(error)
+        else:
+            futuro.set_result(resultado)
+    except InvalidStateError:
+        # El cliente lo canceló entre done() y la entrega
+        pass
+
+
+class DespachadorLotes:
+    """Thread-safe micro-batching front end for many keys.
+
+    obtener_contexto(clave) returns the cipher context of a key, for example
+    AES obtener_contexto or partial(PRESENT obtener_contexto, motor="bitslice"),
+    which reuse expanded keys through CACHE_CLAVES. Use as a context manager or
+    call cerrar() to flush pending messages and stop the dispatcher thread.
+    """
+
+    def __init__(self, obtener_contexto, espera_maxima=ESPERA_MAXIMA_SEGUNDOS, tamanio_lote=TAMANIO_LOTE):
+        if tamanio_lote < 1:
+            raise ValueError("El tamaño de lote debe ser al menos 1")
+        self.obtener_contexto = obtener_contexto
+        self.espera_maxima = espera_maxima
+        self.tamanio_lote = tamanio_lote
+        # (dirección, clave) -> [instante del primer mensaje, [(datos, futuro), ...]]
+        self.pendientes = {}
+        self.condicion = threading.Condition()
+        self.cerrado = False
+        self.tamanios_lote = Counter()
+        self.motivos = Counter()
+        self.espera_acumulada = 0.0
+        self.hilo = threading.Thread(target=self.ejecutar, name="despachador-lotes", daemon=True)
+        self.hilo.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    def cerrar(self):
+        with self.condicion:
+            self.cerrado = True
+            self.condicion.notify()
+        self.hilo.join()
+
+    def enviar(self, direccion, datos, clave):
+        """Queue one message and return a concurrent.futures.Future with its result"""
+        if direccion not in ("cifrar", "descifrar"):
+            raise ValueError(f"Dirección desconocida: {direccion!r} (opciones: cifrar, descifrar)")
+        futuro = Future()
+        grupo = (direccion, a_bytes(clave))
+        with self.condicion:
+            if self.cerrado:
+                raise RuntimeError("El despachador está cerrado")
+            pendiente = self.pendientes.setdefault(grupo, [time.monotonic(), []])
+            pendiente[1].append((bytes(vista_bytes(datos)), futuro))
+            # El hilo despachador solo se despierta por grupos nuevos o llenos
+            if len(pendiente[1]) in (1, self.tamanio_lote):
+                self.condicion.notify()
+        return futuro
+
+    def cifrar(self, datos, clave):
+        return self.enviar("cifrar", datos, clave).result()
+
+    def descifrar(self, datos, clave):
+        return self.enviar("descifrar", datos, clave).result()
+
+    def extraer_listos(self):
+        # Se llama con la condición adquirida; devuelve los grupos que deben salir ya
+        ahora = time.monotonic()
+        listos = []
+        for grupo, (inicio, mensajes) in list(self.pendientes.items()):
+            if len(mensajes) >= self.tamanio_lote:
+                motivo = "lleno"
+            elif self.cerrado or ahora - inicio >= self.espera_maxima:
+                motivo = "tiempo"
+            else:
+                continue
+            del self.pendientes[grupo]
+            for desde in range(0, len(mensajes), self.tamanio_lote):
+                listos.append((grupo, inicio, mensajes[desde: desde + self.tamanio_lote], motivo))
+        return listos
+
+    def ejecutar(self):
+        while True:
+            with self.condicion:
+                listos = self.extraer_listos()
+                while not listos:
+                    if self.cerrado and not self.pendientes:
+                        return
+                    if self.pendientes:
+                        mas_antiguo = min(inicio for inicio, _ in self.pendientes.values())
+                        self.condicion.wait(max(mas_antiguo + self.espera_maxima - time.monotonic(), 0))
+                    else:
+                        self.condicion.wait()
+                    listos = self.extraer_listos()
+
+                ahora = time.monotonic()
+                for _, inicio, mensajes, motivo in listos:
+                    self.tamanios_lote[len(mensajes)] += 1
+                    self.motivos[motivo] += 1
+                    self.espera_acumulada += (ahora - inicio) * len(mensajes)
+
+            for (direccion, clave), _, mensajes, _ in listos:
+                self.procesar(direccion, clave, mensajes)
+
+    def procesar(self, direccion, clave, mensajes):
+        # Los futuros que quien llamó ya canceló salen del lote
+        mensajes = [(datos, futuro) for datos, futuro in mensajes if not futuro.done()]
+        if not mensajes:
+            return
+        try:
+            contexto = self.obtener_contexto(clave)
+            if direccion == "descifrar":
+                # Un texto cifrado mal formado no debe hacer fallar al resto del lote
+                validos = []
+                for datos, futuro in mensajes:
+                    if len(datos) % contexto.TAMANIO_BLOQUE:
+                        entregar(futuro, error=ValueError(
+                            f"El texto cifrado debe ser múltiplo de {contexto.TAMANIO_BLOQUE} bytes"
+                        ))
+                    else:
+                        validos.append((datos, futuro))
+                mensajes = validos
+            funcion = contexto.cifrar if direccion == "cifrar" else contexto.descifrar
+            resultados = procesar_lote(funcion, [datos for datos, _ in mensajes], contexto.TAMANIO_BLOQUE)
+        except Exception as error:
+            for _, futuro in mensajes:
+                entregar(futuro, error=error)
+            return
+        for (_, futuro), resultado in zip(mensajes, resultados):
+            entregar(futuro, resultado)
+
+    def estadisticas(self):
+        with self.condicion:
+            numero_lotes = sum(self.tamanios_lote.values())
+            numero_mensajes = sum(tamanio * veces for tamanio, veces in self.tamanios_lote.items())
+            return {
+                "mensajes": numero_mensajes,
+                "lotes": numero_lotes,
+                "tamanio_medio_lote": numero_mensajes / numero_lotes if numero_lotes else 0.0,
+                "histograma_tamanios": dict(sorted(self.tamanios_lote.items())),
+                "lotes_llenos": self.motivos["lleno"],
+                "lotes_por_tiempo": self.motivos["tiempo"],
+                "espera_media_ms": self.espera_acumulada / numero_mensajes * 1000 if numero_mensajes else 0.0,
+                "pendientes": sum(len(mensajes) for _, mensajes in self.pendientes.values()),
+            }
@@ -0,0 +1,166 @@
+# Fachada asyncio para cifrar sin bloquear el bucle de eventos. Los mensajes pequeños
+# que llegan a la vez se juntan en un lote y se cifran con una sola llamada al contexto
+# (un solo paso multibloque si el contexto es AES128Lotes o PRESENT80 con motor
+# bitslice); los grandes van uno a uno al ejecutor. Las colas son acotadas y los grandes
+# en vuelo también (máximo_grandes): al llegar al límite, cifrar_async espera
+# (contrapresión) en lugar de acumular memoria.
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from algorithms.utils.index import vista_bytes
+
+TAMANIO_COLA = 1024
+TAMANIO_LOTE = 64
+ESPERA_LOTE_SEGUNDOS = 0.0005
+UMBRAL_MENSAJE_PEQUENIO = 256
+MAXIMO_GRANDES_EN_VUELO = 4
+MUESTRAS_LATENCIA = 10000
+
+
+def procesar_lote(funcion, mensajes, tamanio_bloque):
+    """Run `funcion` once over the block-padded concatenation of `mensajes` and split the output back"""
+    longitudes = [len(mensaje) + (-len(mensaje) % tamanio_bloque) for mensaje in mensajes]
+    salida = funcion(b"".join(mensaje.ljust(longitud, b"\x00") for mensaje, longitud in zip(mensajes, longitudes)))
+
+    resultados = []
+    desplazamiento = 0
+    for longitud in longitudes:
+        resultados.append(salida[desplazamiento: desplazamiento + longitud])
+        desplazamiento += longitud
+    return resultados
+
+
+def percentil_simple(valores_ordenados, fraccion):
+    if not valores_ordenados:
+        return 0.0
+    return valores_ordenados[min(int(fraccion * len(valores_ordenados)), len(valores_ordenados) - 1)]
+
+
+class ServicioCifrado:
+    """Async facade over a cipher context (AES128, AES128Lotes, DES or PRESENT80).
+
+    Same zero-padded, block-independent semantics as contexto.cifrar/descifrar.
+    Use inside a running loop as `async with ServicioCifrado(contexto) as servicio`.
+    At most tamanio_cola small messages per direction and maximo_grandes messages
+    above umbral_pequenio are held at once; further callers wait.
+    """
+
+    def __init__(self, contexto, ejecutor=None, tamanio_cola=TAMANIO_COLA, tamanio_lote=TAMANIO_LOTE,
+                 espera_lote=ESPERA_LOTE_SEGUNDOS, umbral_pequenio=UMBRAL_MENSAJE_PEQUENIO,
+                 maximo_grandes=MAXIMO_GRANDES_EN_VUELO):
+        if maximo_grandes < 1:
+            raise ValueError("maximo_grandes debe ser al menos 1")
+        self.contexto = contexto
+        self.ejecutor_propio = ejecutor is None
+        self.ejecutor = ejecutor or ThreadPoolExecutor(max_workers=1)
+        self.tamanio_cola = tamanio_cola
+        self.tamanio_lote = tamanio_lote
+        self.espera_lote = espera_lote
+        self.umbral_pequenio = umbral_pequenio
+        self.maximo_grandes = maximo_grandes
+        self.grandes = None
+        self.grandes_en_vuelo = 0
+        self.colas = {}
+        self.consumidores = []
+        self.latencias = deque(maxlen=MUESTRAS_LATENCIA)
+        self.solicitudes = 0
+        self.lotes = 0
+        self.mensajes_en_lotes = 0
+
+    async def __aenter__(self):
+        self.iniciar()
+        return self
+
+    async def __aexit__(self, *excepcion):
+        await self.cerrar()
+
+    def iniciar(self):
+        self.grandes = asyncio.Semaphore(self.maximo_grandes)
+        for direccion, funcion in (("cifrar", self.contexto.cifrar), ("descifrar", self.contexto.descifrar)):
+            self.colas[direccion] = asyncio.Queue(maxsize=self.tamanio_cola)
+            self.consumidores.append(asyncio.create_task(self.consumir(self.colas[direccion], funcion)))
+
+    async def cerrar(self):
+        # Atiende lo que ya está en cola antes de parar los consumidores
+        for cola in self.colas.values():
+            await cola.join()
+        for consumidor in self.consumidores:
+            consumidor.cancel()
+        await asyncio.gather(*self.consumidores, return_exceptions=True)
+        self.consumidores.clear()
+        if self.ejecutor_propio:
+            self.ejecutor.shutdown()
+
+    async def cifrar_async(self, datos):
+        return await self.enviar("cifrar", self.contexto.cifrar, bytes(vista_bytes(datos)))
+
+    async def descifrar_async(self, datos):
+        datos = bytes(vista_bytes(datos))
+        if len(datos) % self.contexto.TAMANIO_BLOQUE:
+            raise ValueError(f"El texto cifrado debe ser múltiplo de {self.contexto.TAMANIO_BLOQUE} bytes")
+        return await self.enviar("descifrar", self.contexto.descifrar, datos)
+
+    async def enviar(self, direccion, funcion, datos):
+        inicio = time.perf_counter()
+        self.solicitudes += 1
+        bucle = asyncio.get_running_loop()
+
+        if len(datos) > self.umbral_pequenio:
+            # La cola interna del ejecutor no tiene límite: el semáforo es la contrapresión
+            async with self.grandes:
+                self.grandes_en_vuelo += 1
+                try:
+                    resultado = await bucle.run_in_executor(self.ejecutor, funcion, datos)
+                finally:
+                    self.grandes_en_vuelo -= 1
+        else:
+            futuro = bucle.create_future()
+            # Con la cola llena esta espera es la contrapresión hacia quien llama
+            await self.colas[direccion].put((datos, futuro))
+            resultado = await futuro
+
+        self.latencias.append(time.perf_counter() - inicio)
+        return resultado
+
+    async def consumir(self, cola, funcion):
+        bucle = asyncio.get_running_loop()
+        while True:
+            lote = [await cola.get()]
+            if cola.qsize() < self.tamanio_lote - 1 and self.espera_lote > 0:
+                await asyncio.sleep(self.espera_lote)
+            while len(lote) < self.tamanio_lote and not cola.empty():
+                lote.append(cola.get_nowait())
+
+            mensajes = [datos for datos, _ in lote]
+            try:
+                resultados = await bucle.run_in_executor(
+                    self.ejecutor, procesar_lote, funcion, mensajes, self.contexto.TAMANIO_BLOQUE
+                )
+            except Exception as error:
+                resultados = [error] * len(lote)
+
+            self.lotes += 1
+            self.mensajes_en_lotes += len(lote)
+            for (_, futuro), resultado in zip(lote, resultados):
+                # Quien llamó puede haber cancelado mientras esperaba
+                if not futuro.done():
+                    if isinstance(resultado, Exception):
+                        futuro.set_exception(resultado)
+                    else:
+                        futuro.set_result(resultado)
+                cola.task_done()
+
+    def metricas(self):
+        latencias = sorted(self.latencias)
+        return {
+            "solicitudes": self.solicitudes,
+            "lotes": self.lotes,
+            "tamanio_medio_lote": self.mensajes_en_lotes / self.lotes if self.lotes else 0.0,
+            "en_cola": {direccion: cola.qsize() for direccion, cola in self.colas.items()},
+            "grandes_en_vuelo": self.grandes_en_vuelo,
+            "latencia_p50_ms": percentil_simple(latencias, 0.50) * 1000,
+            "latencia_p95_ms": percentil_simple(latencias, 0.95) * 1000,
+            "latencia_p99_ms": percentil_simple(latencias, 0.99) * 1000,
+        }
@@ -0,0 +1,98 @@
+# Caché LRU de claves de ronda (o contextos de cifrado) compartida por AES, DES y PRESENT
+import threading
+from array import array
+from collections import OrderedDict
+
+CAPACIDAD_POR_DEFECTO = 256
+
+
+def borrar_material_clave(valor):
+    """Overwrite round keys in place with zeros (contexts, nested lists, bytearray, array)"""
+    if hasattr(valor, "borrar"):
+        valor.borrar()
+    elif isinstance(valor, (bytearray, array)):
+        for i in range(len(valor)):
+            valor[i] = 0
+    elif isinstance(valor, list):
+        for i, elemento in enumerate(valor):
+            if isinstance(elemento, (list, bytearray, array)):
+                borrar_material_clave(elemento)
+            else:
+                valor[i] = 0
+
+
+class CacheClaves:
+    """Bounded, thread-safe LRU cache of expanded keys keyed by (algorithm, key bytes).
+
+    With borrar_al_expulsar=True evicted round keys are zeroed in place, so a
+    caller must not keep using a schedule after it can have been evicted (keep
+    the capacity above the number of keys in use concurrently).
+    """
+
+    def __init__(self, capacidad=CAPACIDAD_POR_DEFECTO, borrar_al_expulsar=False):
+        if capacidad < 1:
+            raise ValueError("La capacidad de la caché debe ser al menos 1")
+        self.capacidad = capacidad
+        self.borrar_al_expulsar = borrar_al_expulsar
+        self.entradas = OrderedDict()
+        self.cerrojo = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.expulsiones = 0
+
+    def obtener(self, algoritmo, clave, expandir):
+        identificador = (algoritmo, bytes(clave))
+        with self.cerrojo:
+            valor = self.entradas.get(identificador)
+            if valor is not None:
+                self.entradas.move_to_end(identificador)
+                self.aciertos += 1
+                return valor
+            self.fallos += 1
+
+        # La expansión se hace fuera del cerrojo para no serializar a los demás hilos
+        valor = expandir()
+
+        with self.cerrojo:
+            existente = self.entradas.get(identificador)
+            if existente is not None:
+                self.entradas.move_to_end(identificador)
+                return existente
+            self.entradas[identificador] = valor
+            self.recortar(self.capacidad)
+        return valor
+
+    def recortar(self, capacidad):
+        while len(self.entradas) > capacidad:
+            _, expulsado = self.entradas.popitem(last=False)
+            self.expulsiones += 1
+            if self.borrar_al_expulsar:
+                borrar_material_clave(expulsado)
+
+    def configurar(self, capacidad=None, borrar_al_expulsar=None):
+        with self.cerrojo:
+            if borrar_al_expulsar is not None:
+                self.borrar_al_expulsar = borrar_al_expulsar
+            if capacidad is not None:
+                if capacidad < 1:
+                    raise ValueError("La capacidad de la caché debe ser al menos 1")
+                self.capacidad = capacidad
+                self.recortar(capacidad)
+
+    def limpiar(self):
+        with self.cerrojo:
+            self.recortar(0)
+            self.aciertos = self.fallos = self.expulsiones = 0
+
+    def estadisticas(self):
+        with self.cerrojo:
+            return {
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "expulsiones": self.expulsiones,
+                "entradas": len(self.entradas),
+                "capacidad": self.capacidad,
+            }
+
+
+CACHE_CLAVES = CacheClaves()
@@ -53,3 +53,70 @@ def bits_a_entero(bits):
 def entero_a_bits(valor, longitud):
     """Convert integer to list of bits (MSB first)"""
     return [(valor >> i) & 1 for i in range(longitud - 1, -1, -1)]
+
+
+# Funciones para la API nativa de bytes
+
+
+# Ejemplo: a_bytes("AB") -> b"AB"; a_bytes(bytearray([1, 2])) -> b"\x01\x02"
+def a_bytes(datos):
+    """Normalize str (one byte per character, as string_a_bytes) or bytes-like to bytes"""
+    if isinstance(datos, str):
+        return datos.encode("latin-1")
+    return bytes(datos)
+
+
+# Ejemplo: vista_bytes("AB") -> memoryview(b"AB"), sin copiar bytes/bytearray/memoryview
+def vista_bytes(datos):
+    if isinstance(datos, str):
+        datos = datos.encode("latin-1")
+    return memoryview(datos).cast("B")
+
+
+# Ejemplo: dividir_bloques(b"ABC", 2) -> [b"AB", b"C\x00"] (relleno con ceros)
+def dividir_bloques(datos, tamanio_bloque):
+    vista = vista_bytes(datos)
+    completos = len(vista) - len(vista) % tamanio_bloque
+    for i in range(0, completos, tamanio_bloque):
+        yield vista[i: i + tamanio_bloque]
+    if completos < len(vista):
+        yield bytes(vista[completos:]).ljust(tamanio_bloque, b"\x00")
+
+
+# Ejemplo: enteros_a_bytes([1, 2], 2) -> b"\x00\x01\x00\x02"
+def enteros_a_bytes(enteros, tamanio_bloque):
+    return b"".join(entero.to_bytes(tamanio_bloque, "big") for entero in enteros)
+
+
+# Ejemplo: bits_a_bytes([0,1,0,0,0,0,0,1]) -> b"A"
+def bits_a_bytes(bits):
+    if not bits:
+        return b""
+    return int("".join(map(str, bits)), 2).to_bytes(len(bits) // 8, "big")
+
+
+# Ejemplo: bytes_a_bits(b"A") -> [0,1,0,0,0,0,0,1]
+def bytes_a_bits(datos):
+    if not datos:
+        return []
+    return [int(c) for c in format(int.from_bytes(datos, "big"), f"0{len(datos) * 8}b")]
+
+
+# Ejemplo: xor_bytes(b"\x0f\xf0", b"\xff\xff") -> b"\xf0\x0f"
+def xor_bytes(datos1, datos2):
+    longitud = len(datos1)
+    return (int.from_bytes(datos1, "big") ^ int.from_bytes(datos2[:longitud], "big")).to_bytes(longitud, "big")
+
+
+# Ejemplo: rellenar_pkcs7(b"ABC", 4) -> b"ABC\x01"
+def rellenar_pkcs7(datos, tamanio_bloque):
+    relleno = tamanio_bloque - len(datos) % tamanio_bloque
+    return bytes(datos) + bytes([relleno]) * relleno
+
+
+# Ejemplo: quitar_relleno_pkcs7(b"ABC\x01", 4) -> b"ABC"
+def quitar_relleno_pkcs7(datos, tamanio_bloque):
+    relleno = datos[-1] if datos else 0
+    if not 1 <= relleno <= tamanio_bloque or datos[-relleno:] != bytes([relleno]) * relleno:
+        raise ValueError("Relleno PKCS#7 inválido")
+    return datos[:-relleno]
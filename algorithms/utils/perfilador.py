@@ -0,0 +1,144 @@
+# Instrumentación opcional de primitivas: dentro de `with perfilar(...)` las funciones
+# de los módulos indicados se sustituyen por envolturas que miden tiempo y llamadas;
+# al salir se restauran las originales, así que desactivado no añade ningún costo.
+import inspect
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from types import FunctionType
+
+from algorithms.utils.cache import CACHE_CLAVES
+
+
+def nombre_primitiva(funcion, clase=None):
+    # Ejemplo: algorithms.AES.index.sub_bytes -> AES.sub_bytes
+    modulo = funcion.__module__.removeprefix("algorithms.").removesuffix(".index")
+    if clase is not None:
+        return f"{modulo}.{clase.__name__}.{funcion.__name__}"
+    return f"{modulo}.{funcion.__name__}"
+
+
+class Perfilador:
+    """Call counts, inclusive time and self time per call stack of instrumented functions.
+
+    Not thread-safe: profile one thread at a time.
+    """
+
+    def __init__(self):
+        self.pila = []
+        self.tiempo_hijos = []
+        self.tiempo_propio_por_pila = defaultdict(int)
+        self.llamadas = defaultdict(int)
+        self.tiempo_total = defaultdict(int)
+        self.tiempo_propio = defaultdict(int)
+        self.envolturas = {}
+
+    def envolver(self, funcion, nombre):
+        if funcion in self.envolturas:
+            return self.envolturas[funcion]
+
+        pila, tiempo_hijos = self.pila, self.tiempo_hijos
+        reloj = time.perf_counter_ns
+
+        @wraps(funcion)
+        def envoltura(*argumentos, **opciones):
+            pila.append(nombre)
+            tiempo_hijos.append(0)
+            inicio = reloj()
+            try:
+                return funcion(*argumentos, **opciones)
+            finally:
+                transcurrido = reloj() - inicio
+                propio = transcurrido - tiempo_hijos.pop()
+                self.tiempo_propio_por_pila[tuple(pila)] += propio
+                pila.pop()
+                if tiempo_hijos:
+                    tiempo_hijos[-1] += transcurrido
+                self.llamadas[nombre] += 1
+                self.tiempo_propio[nombre] += propio
+                # En llamadas recursivas solo cuenta la más externa
+                if nombre not in pila:
+                    self.tiempo_total[nombre] += transcurrido
+
+        self.envolturas[funcion] = envoltura
+        return envoltura
+
+    def pilas_colapsadas(self):
+        # Formato "a;b;c valor" de flamegraph.pl / speedscope, en nanosegundos de tiempo propio
+        return [f"{';'.join(pila)} {tiempo}" for pila, tiempo in sorted(self.tiempo_propio_por_pila.items())]
+
+    def escribir_pilas_colapsadas(self, ruta_archivo):
+        with open(ruta_archivo, "w", encoding="utf-8") as archivo:
+            archivo.write("\n".join(self.pilas_colapsadas()) + "\n")
+
+    def resumen(self):
+        tiempo_propio_total = sum(self.tiempo_propio.values()) or 1
+        filas = [
+            {
+                "primitiva": nombre,
+                "llamadas": self.llamadas[nombre],
+                "tiempo_total_ms": self.tiempo_total[nombre] / 1e6,
+                "tiempo_propio_ms": self.tiempo_propio[nombre] / 1e6,
+                "porcentaje_propio": 100 * self.tiempo_propio[nombre] / tiempo_propio_total,
+            }
+            for nombre in self.llamadas
+        ]
+        return sorted(filas, key=lambda fila: fila["tiempo_propio_ms"], reverse=True)
+
+    def tabla_resumen(self):
+        lineas = [f"{'primitiva':<48}{'llamadas':>12}{'total ms':>12}{'propio ms':>12}{'% propio':>10}"]
+        for fila in self.resumen():
+            lineas.append(
+                f"{fila['primitiva']:<48}{fila['llamadas']:>12}{fila['tiempo_total_ms']:>12.2f}"
+                f"{fila['tiempo_propio_ms']:>12.2f}{fila['porcentaje_propio']:>10.1f}"
+            )
+        return "\n".join(lineas)
+
+
+def es_instrumentable(funcion):
+    # Los generadores solo medirían su creación: su tiempo queda en quien los consume
+    return isinstance(funcion, FunctionType) and not inspect.isgeneratorfunction(funcion)
+
+
+def instrumentar_modulo(perfilador, modulo, restauraciones):
+    for nombre_atributo, valor in list(vars(modulo).items()):
+        if es_instrumentable(valor) and valor.__module__.startswith("algorithms."):
+            restauraciones.append((modulo, nombre_atributo, valor))
+            setattr(modulo, nombre_atributo, perfilador.envolver(valor, nombre_primitiva(valor)))
+
+        elif isinstance(valor, type) and valor.__module__ == modulo.__name__:
+            for nombre_metodo, metodo in list(vars(valor).items()):
+                if es_instrumentable(metodo) and not nombre_metodo.startswith("__"):
+                    restauraciones.append((valor, nombre_metodo, metodo))
+                    setattr(valor, nombre_metodo, perfilador.envolver(metodo, nombre_primitiva(metodo, valor)))
+
+        # Tablas de motores como MOTORES guardan referencias directas a las funciones
+        elif isinstance(valor, dict) and any(isinstance(v, tuple) for v in valor.values()):
+            restauraciones.append((modulo, nombre_atributo, valor))
+            setattr(modulo, nombre_atributo, {
+                clave: tuple(
+                    perfilador.envolver(f, nombre_primitiva(f)) if es_instrumentable(f) else f for f in entrada
+                ) if isinstance(entrada, tuple) else entrada
+                for clave, entrada in valor.items()
+            })
+
+
+@contextmanager
+def perfilar(*modulos):
+    """Instrument every function of `modulos` for the duration of the block and yield the Perfilador.
+
+    The key cache is cleared on entry and exit so cached contexts never hold
+    references to instrumented functions outside the block.
+    """
+    perfilador = Perfilador()
+    restauraciones = []
+    CACHE_CLAVES.limpiar()
+    try:
+        for modulo in modulos:
+            instrumentar_modulo(perfilador, modulo, restauraciones)
+        yield perfilador
+    finally:
+        for objetivo, nombre_atributo, original in reversed(restauraciones):
+            setattr(objetivo, nombre_atributo, original)
+        CACHE_CLAVES.limpiar()
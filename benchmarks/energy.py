@@ -0,0 +1,82 @@
+"""
+Medición de Energía con los Contadores RAPL de Linux (powercap)
+Lee /sys/class/powercap/intel-rapl*/energy_uj de cada dominio (paquete, núcleos,
+DRAM...) antes y después de cada sección medida y corrige el desbordamiento del
+contador con max_energy_range_uj. Si RAPL no está disponible o no es legible, los
+benchmarks vuelven al modelo de potencia y etiquetan el resultado como modelado.
+
+Los contadores se actualizan cada ~1 ms: las secciones medidas deben durar bastante
+más para que la energía por byte sea significativa.
+"""
+
+import re
+from pathlib import Path
+
+RUTA_POWERCAP = Path("/sys/class/powercap")
+FUENTES_ENERGIA = ("auto", "rapl", "modelo")
+FUENTE_MEDIDA = "medida (RAPL)"
+FUENTE_MODELADA = "modelada"
+
+
+def leer_entero(ruta):
+    return int(ruta.read_text().strip())
+
+
+def nombre_dominio(ruta_dominio):
+    # Ejemplo: intel-rapl:0:0 con name "core" -> core-0; intel-rapl:1 con name "package-1" -> package-1
+    nombre = (ruta_dominio / "name").read_text().strip()
+    if re.search(r"-\d+$", nombre):
+        return nombre
+    zocalo = ruta_dominio.name.split(":")[1]
+    return f"{nombre}-{zocalo}"
+
+
+class MedidorRAPL:
+    """Reads the RAPL energy counters of every powercap domain (microjoules)"""
+
+    def __init__(self, ruta_powercap=RUTA_POWERCAP):
+        self.dominios = {}
+        for ruta_dominio in sorted(Path(ruta_powercap).glob("intel-rapl*:*")):
+            if (ruta_dominio / "energy_uj").exists():
+                self.dominios[nombre_dominio(ruta_dominio)] = (
+                    ruta_dominio / "energy_uj",
+                    leer_entero(ruta_dominio / "max_energy_range_uj"),
+                )
+        if not self.dominios:
+            raise OSError(f"No hay dominios RAPL en {ruta_powercap}")
+        # Desde Linux 5.10 energy_uj solo es legible por root
+        self.leer()
+
+    def leer(self):
+        return {dominio: leer_entero(ruta_energia) for dominio, (ruta_energia, _) in self.dominios.items()}
+
+    def diferencia(self, inicio, fin):
+        energia = {}
+        for dominio, (_, rango_maximo) in self.dominios.items():
+            delta = fin[dominio] - inicio[dominio]
+            # El contador volvió a cero durante la sección
+            if delta < 0:
+                delta += rango_maximo
+            energia[dominio] = delta
+        return energia
+
+
+def sumar_dominios(energia, prefijo):
+    return sum(valor for dominio, valor in energia.items() if dominio.startswith(prefijo))
+
+
+def crear_medidor_energia(fuente="auto", ruta_powercap=RUTA_POWERCAP):
+    """Return a MedidorRAPL, or None when the modelled fallback must be used.
+
+    fuente="rapl" raises instead of falling back; fuente="modelo" never reads RAPL.
+    """
+    if fuente not in FUENTES_ENERGIA:
+        raise ValueError(f"Fuente de energía desconocida: {fuente!r} (opciones: {', '.join(FUENTES_ENERGIA)})")
+    if fuente == "modelo":
+        return None
+    try:
+        return MedidorRAPL(ruta_powercap)
+    except OSError as error:
+        if fuente == "rapl":
+            raise RuntimeError(f"RAPL no disponible: {error}") from error
+        return None
@@ -0,0 +1,425 @@
+"""
+Arnés Unificado de Benchmarks para Algoritmos de Criptografía Ligera
+Basado en la metodología de Soto-Cruz et al. (2024)
+
+Una sola pasada de tiempo por cifrador y carga útil alimenta latencia, rendimiento
+y potencia, y una sola pasada de asignaciones alimenta memoria y RAM. Los
+resultados se escriben en JSON y CSV antes de generar cualquier gráfico.
+
+Uso:
+    python benchmarks/harness.py
+    python benchmarks/harness.py --algoritmos AES-128/tablas DES/enteros \\
+        --archivos short_message.txt --tamanios 4096 65536 --iteraciones 200 --metricas latencia memoria
+"""
+
+import argparse
+import csv
+import gc
+import json
+import sys
+import tracemalloc
+from functools import partial
+from pathlib import Path
+
+RUTA_RAIZ_PROYECTO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RUTA_RAIZ_PROYECTO))
+
+from algorithms.AES import constants as constantes_aes  # noqa: E402
+from algorithms.AES import index as modulo_aes  # noqa: E402
+from algorithms.AES import lotes as modulo_aes_lotes  # noqa: E402
+from algorithms.AES.index import AES128, AES_cifrar, AES_descifrar  # noqa: E402
+from algorithms.AES.lotes import AES128Lotes, AES_cifrar_lotes, AES_descifrar_lotes  # noqa: E402
+from algorithms.DES import constants as constantes_des  # noqa: E402
+from algorithms.DES import index as modulo_des  # noqa: E402
+from algorithms.DES.index import DES, DES_cifrar, DES_descifrar  # noqa: E402
+from algorithms.PRESENT import bitslice as modulo_present_bitslice  # noqa: E402
+from algorithms.PRESENT import constants as constantes_present  # noqa: E402
+from algorithms.PRESENT import index as modulo_present  # noqa: E402
+from algorithms.PRESENT.index import PRESENT80, PRESENT_cifrar, PRESENT_descifrar  # noqa: E402
+from algorithms.utils import index as modulo_utils  # noqa: E402
+from benchmarks.energy import (  # noqa: E402
+    FUENTE_MEDIDA,
+    FUENTE_MODELADA,
+    FUENTES_ENERGIA,
+    crear_medidor_energia,
+    sumar_dominios,
+)
+from benchmarks.history import RUTA_HISTORIAL, registrar_ejecucion  # noqa: E402
+from benchmarks.memory import tamanio_profundo, tamanio_tablas_modulos  # noqa: E402
+from benchmarks.plots import GRAFICOS  # noqa: E402
+from benchmarks.timing import NUMERO_ENSAYOS, medir_ensayos, resumir_muestras  # noqa: E402
+
+POTENCIA_BASE_REPOSO_VATIOS = 5.0
+POTENCIA_CPU_ACTIVO_VATIOS = 15.0
+
+METRICAS = ("latencia", "rendimiento", "potencia", "memoria")
+ARCHIVO_POR_DEFECTO = "medium_message.txt"
+# Texto ASCII usado para generar cargas útiles de tamaño arbitrario
+ARCHIVO_BASE_GENERADO = "extreme_iot_message.txt"
+
+REGISTRO_CIFRADORES = {}
+
+
+def registrar_cifrador(nombre, funcion_cifrado, funcion_descifrado, clave, modulo_constantes, crear_contexto, modulos,
+                       tablas):
+    REGISTRO_CIFRADORES[nombre] = {
+        "cifrar": funcion_cifrado,
+        "descifrar": funcion_descifrado,
+        "clave": clave,
+        "constantes": modulo_constantes,
+        # Construye el contexto (expansión de clave incluida) a partir de la clave
+        "contexto": crear_contexto,
+        # Módulos con el código del cifrador, los que instrumenta profile_benchmark
+        "modulos": modulos,
+        # (módulo, nombres) de las tablas que usa este motor, las que mide memory_profile_benchmark
+        "tablas": tablas,
+    }
+
+
+def tablas_motor(modulo, motor="referencia"):
+    return modulo, modulo.TABLAS_MOTORES[motor]
+
+
+def registrar_motor(nombre, funcion_cifrado, funcion_descifrado, clave, modulo_constantes, clase_contexto, modulos,
+                    motor):
+    registrar_cifrador(
+        f"{nombre}/{motor}",
+        partial(funcion_cifrado, motor=motor),
+        partial(funcion_descifrado, motor=motor),
+        clave,
+        modulo_constantes,
+        partial(clase_contexto, motor=motor),
+        modulos,
+        # El primer módulo es el que define MOTORES y TABLAS_MOTORES
+        tablas_motor(modulos[0], motor),
+    )
+
+
+MODULOS_AES = (modulo_aes, modulo_utils)
+MODULOS_DES = (modulo_des, modulo_utils)
+MODULOS_PRESENT = (modulo_present, modulo_present_bitslice, modulo_utils)
+
+registrar_cifrador(
+    "AES-128", AES_cifrar, AES_descifrar, "ClaveSecreta1234", constantes_aes, AES128, MODULOS_AES,
+    tablas_motor(modulo_aes),
+)
+registrar_cifrador(
+    "DES", DES_cifrar, DES_descifrar, "Clave123", constantes_des, DES, MODULOS_DES, tablas_motor(modulo_des)
+)
+registrar_cifrador(
+    "PRESENT-80", PRESENT_cifrar, PRESENT_descifrar, "ClavePresent", constantes_present, PRESENT80, MODULOS_PRESENT,
+    tablas_motor(modulo_present),
+)
+registrar_motor("AES-128", AES_cifrar, AES_descifrar, "ClaveSecreta1234", constantes_aes, AES128, MODULOS_AES, "tablas")
+registrar_motor("DES", DES_cifrar, DES_descifrar, "Clave123", constantes_des, DES, MODULOS_DES, "enteros")
+registrar_motor(
+    "PRESENT-80", PRESENT_cifrar, PRESENT_descifrar, "ClavePresent", constantes_present, PRESENT80, MODULOS_PRESENT,
+    "bitslice",
+)
+registrar_motor(
+    "PRESENT-80", PRESENT_cifrar, PRESENT_descifrar, "ClavePresent", constantes_present, PRESENT80, MODULOS_PRESENT,
+    "tablas",
+)
+registrar_motor(
+    "AES-128", AES_cifrar, AES_descifrar, "ClaveSecreta1234", constantes_aes, AES128, MODULOS_AES, "al_vuelo"
+)
+registrar_motor("DES", DES_cifrar, DES_descifrar, "Clave123", constantes_des, DES, MODULOS_DES, "al_vuelo")
+registrar_motor(
+    "PRESENT-80", PRESENT_cifrar, PRESENT_descifrar, "ClavePresent", constantes_present, PRESENT80, MODULOS_PRESENT,
+    "al_vuelo",
+)
+registrar_cifrador(
+    "AES-128/lotes", AES_cifrar_lotes, AES_descifrar_lotes, "ClaveSecreta1234", constantes_aes, AES128Lotes,
+    (modulo_aes_lotes, *MODULOS_AES), (modulo_aes_lotes, modulo_aes_lotes.TABLAS_LOTES),
+)
+
+ALGORITMOS_POR_DEFECTO = ("AES-128", "DES", "PRESENT-80")
+
+
+# Cargas útiles
+
+
+def cargar_datos_prueba(nombre_archivo=ARCHIVO_POR_DEFECTO):
+    with open(RUTA_RAIZ_PROYECTO / "data" / nombre_archivo, "r", encoding="utf-8") as archivo:
+        return archivo.read()
+
+
+def generar_carga_util(tamanio_bytes):
+    base = cargar_datos_prueba(ARCHIVO_BASE_GENERADO)
+    return (base * (tamanio_bytes // len(base) + 1))[:tamanio_bytes]
+
+
+def cargar_cargas_utiles(archivos, tamanios):
+    cargas = [(nombre_archivo, cargar_datos_prueba(nombre_archivo)) for nombre_archivo in archivos]
+    cargas += [(f"generado_{tamanio}B", generar_carga_util(tamanio)) for tamanio in tamanios]
+    return cargas
+
+
+# Mediciones
+
+
+def medir_tiempos(cifrador, texto_plano, numero_iteraciones, numero_ensayos=NUMERO_ENSAYOS, desactivar_gc=False,
+                  medidor_energia=None, muestras_por_llamada=True):
+    funcion_cifrado, funcion_descifrado, clave = cifrador["cifrar"], cifrador["descifrar"], cifrador["clave"]
+    texto_cifrado = funcion_cifrado(texto_plano, clave)
+
+    return {
+        direccion: medir_ensayos(
+            funcion, (entrada, clave), numero_iteraciones, numero_ensayos, desactivar_gc,
+            medidor_energia=medidor_energia, muestras_por_llamada=muestras_por_llamada,
+        )
+        for direccion, funcion, entrada in (
+            ("cifrado", funcion_cifrado, texto_plano),
+            ("descifrado", funcion_descifrado, texto_cifrado),
+        )
+    }
+
+
+def medir_pico_memoria(cifrador, texto_plano, numero_iteraciones):
+    funcion_cifrado, funcion_descifrado, clave = cifrador["cifrar"], cifrador["descifrar"], cifrador["clave"]
+
+    gc.collect()
+    texto_cifrado = funcion_cifrado(texto_plano, clave)
+
+    picos = {}
+    for direccion, funcion, entrada in (
+        ("cifrado", funcion_cifrado, texto_plano),
+        ("descifrado", funcion_descifrado, texto_cifrado),
+    ):
+        gc.collect()
+        tracemalloc.start()
+        for _ in range(numero_iteraciones):
+            funcion(entrada, clave)
+        _, picos[direccion] = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return picos
+
+
+def medir_memoria_estatica(modulo_constantes):
+    # Tamaño profundo de las tablas: cada lista, tupla y entero referenciado, sin duplicados
+    return tamanio_tablas_modulos([modulo_constantes])
+
+
+def medir_memoria_claves(cifrador):
+    # Lo que ocupa en reposo el contexto de una clave (claves de ronda en el formato del motor)
+    return tamanio_profundo(cifrador["contexto"](cifrador["clave"]))
+
+
+# Métricas derivadas de las mediciones
+
+
+def calcular_metricas_tiempo(tiempos, tamanio_datos_bytes, metricas):
+    resultado = {}
+    for direccion in ("cifrado", "descifrado"):
+        tiempo_real = tiempos[direccion]["tiempo_real_segundos"]
+        tiempo_cpu = tiempos[direccion]["tiempo_cpu_segundos"]
+        total_bytes_procesados = tiempos[direccion]["iteraciones"] * tamanio_datos_bytes
+        latencia_por_byte = tiempo_real / total_bytes_procesados
+
+        if "latencia" in metricas:
+            resultado[f"latencia_{direccion}_microsegundos_por_byte"] = latencia_por_byte * 1_000_000
+            # Dispersión entre ensayos y cola por llamada, también en µs/byte
+            muestras, muestras_llamadas = (
+                [muestra / tamanio_datos_bytes * 1_000_000 for muestra in tiempos[direccion][clave_muestras]]
+                for clave_muestras in ("muestras_segundos", "muestras_llamadas_segundos")
+            )
+            for estadistico, valor in resumir_muestras(muestras, muestras_llamadas).items():
+                resultado[f"latencia_{direccion}_{estadistico}_microsegundos_por_byte"] = valor
+            resultado[f"latencia_{direccion}_lotes_calentamiento"] = tiempos[direccion]["lotes_calentamiento"]
+        if "rendimiento" in metricas:
+            resultado[f"rendimiento_{direccion}_kb_por_segundo"] = (total_bytes_procesados / tiempo_real) / 1024
+        if "potencia" in metricas and tiempos[direccion]["energia_microjulios"] is not None:
+            # Energía del paquete (todos los zócalos) durante los ensayos, incluido el consumo en reposo
+            energia = tiempos[direccion]["energia_microjulios"]
+            energia_paquete = sumar_dominios(energia, "package")
+            resultado[f"potencia_{direccion}_miliwatios"] = energia_paquete / tiempo_real / 1000
+            resultado[f"energia_{direccion}_microjulios_por_byte"] = energia_paquete / total_bytes_procesados
+            for dominio, valor in energia.items():
+                resultado[f"energia_{direccion}_{dominio}_microjulios_por_byte"] = valor / total_bytes_procesados
+            resultado["fuente_energia"] = FUENTE_MEDIDA
+        elif "potencia" in metricas:
+            utilizacion_cpu = min(tiempo_cpu / tiempo_real, 1.0) if tiempo_real > 0 else 0
+            potencia = POTENCIA_BASE_REPOSO_VATIOS + (POTENCIA_CPU_ACTIVO_VATIOS * utilizacion_cpu)
+            resultado[f"potencia_{direccion}_miliwatios"] = potencia * 1000
+            resultado[f"energia_{direccion}_microjulios_por_byte"] = potencia * latencia_por_byte * 1_000_000
+            resultado["fuente_energia"] = FUENTE_MODELADA
+    return resultado
+
+
+def calcular_metricas_memoria(picos, memoria_estatica, memoria_claves):
+    return {
+        "memoria_estatica_bytes": memoria_estatica,
+        "claves_ronda_bytes": memoria_claves,
+        "ram_cifrado_bytes": picos["cifrado"],
+        "ram_descifrado_bytes": picos["descifrado"],
+        "ram_cifrado_kilobytes": picos["cifrado"] / 1024,
+        "ram_descifrado_kilobytes": picos["descifrado"] / 1024,
+    }
+
+
+def medir_cifrador(cifrador, texto_plano, numero_iteraciones, iteraciones_memoria, metricas,
+                   numero_ensayos=NUMERO_ENSAYOS, desactivar_gc=False, medidor_energia=None):
+    tamanio_datos_bytes = len(texto_plano.encode("utf-8"))
+    resultado = {}
+    muestras = {}
+    if set(metricas) & {"latencia", "rendimiento", "potencia"}:
+        tiempos = medir_tiempos(
+            cifrador, texto_plano, numero_iteraciones, numero_ensayos, desactivar_gc, medidor_energia,
+            "latencia" in metricas,
+        )
+        resultado.update(calcular_metricas_tiempo(tiempos, tamanio_datos_bytes, metricas))
+        # Latencia de cada ensayo en µs/byte, para comparar ejecuciones en el historial
+        muestras = {
+            direccion: [muestra / tamanio_datos_bytes * 1_000_000 for muestra in tiempos[direccion]["muestras_segundos"]]
+            for direccion in tiempos
+        }
+    if "memoria" in metricas:
+        picos = medir_pico_memoria(cifrador, texto_plano, iteraciones_memoria)
+        resultado.update(
+            calcular_metricas_memoria(picos, medir_memoria_estatica(cifrador["constantes"]), medir_memoria_claves(cifrador))
+        )
+    return tamanio_datos_bytes, resultado, muestras
+
+
+# Salida
+
+
+def escribir_resultados(informe, directorio_salida):
+    directorio_salida.mkdir(parents=True, exist_ok=True)
+    ruta_json = directorio_salida / "benchmark_results.json"
+    ruta_csv = directorio_salida / "benchmark_results.csv"
+
+    with open(ruta_json, "w", encoding="utf-8") as archivo:
+        json.dump(informe, archivo, indent=2, ensure_ascii=False)
+
+    with open(ruta_csv, "w", encoding="utf-8", newline="") as archivo:
+        escritor = csv.writer(archivo)
+        escritor.writerow(["algoritmo", "carga", "tamanio_bytes", "metrica", "valor"])
+        for fila in informe["resultados"]:
+            for metrica, valor in fila["metricas"].items():
+                escritor.writerow([fila["algoritmo"], fila["carga"], fila["tamanio_bytes"], metrica, valor])
+
+    return ruta_json, ruta_csv
+
+
+def generar_graficos(informe, nombres_graficos, directorio_salida):
+    cargas = list(dict.fromkeys(fila["carga"] for fila in informe["resultados"]))
+    for carga in cargas:
+        resultados_carga = {
+            fila["algoritmo"]: fila["metricas"] for fila in informe["resultados"] if fila["carga"] == carga
+        }
+        for nombre_grafico in nombres_graficos:
+            metrica_requerida, funcion_grafico, nombre_archivo = GRAFICOS[nombre_grafico]
+            if metrica_requerida not in informe["parametros"]["metricas"]:
+                continue
+            # Con varias cargas útiles cada gráfico lleva el nombre de la carga
+            if len(cargas) > 1:
+                nombre_archivo = f"{Path(nombre_archivo).stem}_{Path(carga).stem}.png"
+            funcion_grafico(resultados_carga, directorio_salida / nombre_archivo)
+
+
+def ejecutar_harness(
+    algoritmos=ALGORITMOS_POR_DEFECTO,
+    archivos=(ARCHIVO_POR_DEFECTO,),
+    tamanios=(),
+    numero_iteraciones=5000,
+    iteraciones_memoria=100,
+    numero_ensayos=NUMERO_ENSAYOS,
+    desactivar_gc=False,
+    fuente_energia="auto",
+    metricas=METRICAS,
+    graficos=tuple(GRAFICOS),
+    directorio_salida=RUTA_RAIZ_PROYECTO / "results",
+    ruta_historial=RUTA_HISTORIAL,
+):
+    for algoritmo in algoritmos:
+        if algoritmo not in REGISTRO_CIFRADORES:
+            raise ValueError(f"Algoritmo no registrado: {algoritmo!r} (opciones: {', '.join(REGISTRO_CIFRADORES)})")
+    medidor_energia = crear_medidor_energia(fuente_energia) if "potencia" in metricas else None
+
+    filas = []
+    for nombre_carga, texto_plano in cargar_cargas_utiles(archivos, tamanios):
+        for algoritmo in algoritmos:
+            tamanio_datos_bytes, metricas_algoritmo, muestras = medir_cifrador(
+                REGISTRO_CIFRADORES[algoritmo],
+                texto_plano,
+                numero_iteraciones,
+                iteraciones_memoria,
+                metricas,
+                numero_ensayos,
+                desactivar_gc,
+                medidor_energia,
+            )
+            filas.append(
+                {
+                    "algoritmo": algoritmo,
+                    "carga": nombre_carga,
+                    "tamanio_bytes": tamanio_datos_bytes,
+                    "metricas": metricas_algoritmo,
+                    "muestras": muestras,
+                }
+            )
+
+    informe = {
+        "parametros": {
+            "algoritmos": list(algoritmos),
+            "archivos": list(archivos),
+            "tamanios": list(tamanios),
+            "iteraciones": numero_iteraciones,
+            "ensayos": numero_ensayos,
+            "gc_desactivado": desactivar_gc,
+            "fuente_energia": FUENTE_MEDIDA if medidor_energia is not None else FUENTE_MODELADA,
+            "iteraciones_memoria": iteraciones_memoria,
+            "metricas": list(metricas),
+        },
+        "resultados": filas,
+    }
+    escribir_resultados(informe, directorio_salida)
+    if ruta_historial is not None:
+        registrar_ejecucion(informe, ruta_historial)
+    generar_graficos(informe, graficos, directorio_salida)
+    return informe
+
+
+def construir_parser():
+    parser = argparse.ArgumentParser(description="Arnés unificado de benchmarks de criptografía ligera")
+    parser.add_argument("--algoritmos", nargs="+", default=list(ALGORITMOS_POR_DEFECTO), choices=list(REGISTRO_CIFRADORES))
+    parser.add_argument("--archivos", nargs="*", default=[ARCHIVO_POR_DEFECTO], help="archivos de data/")
+    parser.add_argument("--tamanios", nargs="*", type=int, default=[], help="cargas generadas, en bytes")
+    parser.add_argument("--iteraciones", type=int, default=5000)
+    parser.add_argument("--iteraciones-memoria", type=int, default=100)
+    parser.add_argument("--ensayos", type=int, default=NUMERO_ENSAYOS, help="ensayos independientes por dirección")
+    parser.add_argument("--sin-gc", action="store_true", help="desactiva el recolector durante los ensayos")
+    parser.add_argument(
+        "--energia", default="auto", choices=FUENTES_ENERGIA,
+        help="rapl exige contadores RAPL; auto vuelve al modelo si no están disponibles",
+    )
+    parser.add_argument("--metricas", nargs="+", default=list(METRICAS), choices=METRICAS)
+    parser.add_argument("--graficos", nargs="*", default=list(GRAFICOS), choices=list(GRAFICOS))
+    parser.add_argument("--salida", type=Path, default=RUTA_RAIZ_PROYECTO / "results")
+    parser.add_argument("--historial", type=Path, default=RUTA_HISTORIAL, help="JSONL donde se añade la ejecución")
+    parser.add_argument("--sin-historial", action="store_true", help="no registra la ejecución en el historial")
+    return parser
+
+
+def main(argumentos=None):
+    opciones = construir_parser().parse_args(argumentos)
+    ejecutar_harness(
+        algoritmos=opciones.algoritmos,
+        archivos=opciones.archivos,
+        tamanios=opciones.tamanios,
+        numero_iteraciones=opciones.iteraciones,
+        iteraciones_memoria=opciones.iteraciones_memoria,
+        numero_ensayos=opciones.ensayos,
+        desactivar_gc=opciones.sin_gc,
+        fuente_energia=opciones.energia,
+        metricas=opciones.metricas,
+        graficos=opciones.graficos,
+        directorio_salida=opciones.salida,
+        ruta_historial=None if opciones.sin_historial else opciones.historial,
+    )
+    print("SUCCESS")
+
+
+if __name__ == "__main__":
+    main()
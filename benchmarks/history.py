@@ -0,0 +1,238 @@
+"""
+Historial de Resultados de los Benchmarks de Criptografía Ligera
+Cada ejecución del arnés se añade como una línea de results/history.jsonl junto con
+la revisión de git, la versión de Python, el modelo de CPU y los parámetros. El
+comando `comparar` contrasta las muestras de latencia de una ejecución con otra (o
+con las últimas N ejecuciones con la misma CPU, Python y parámetros) mediante una prueba de permutación
+y termina con código 1 si encuentra una regresión significativa.
+
+Uso:
+    python benchmarks/history.py listar
+    python benchmarks/history.py comparar                  # última vs. las 5 anteriores
+    python benchmarks/history.py comparar --base -2 --actual -1 --umbral 0.05 --alfa 0.01
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+RUTA_RAIZ_PROYECTO = Path(__file__).resolve().parent.parent
+RUTA_HISTORIAL = RUTA_RAIZ_PROYECTO / "results" / "history.jsonl"
+
+VENTANA_BASE = 5
+UMBRAL_REGRESION = 0.05
+ALFA = 0.01
+NUMERO_PERMUTACIONES = 10000
+# Metadatos que deben coincidir para que una ejecución entre en la base móvil
+CAMPOS_COMPARABLES = ("cpu", "python", "implementacion", "parametros")
+
+
+# Metadatos de la ejecución
+
+
+def revision_git():
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=RUTA_RAIZ_PROYECTO, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        cambios = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=RUTA_RAIZ_PROYECTO, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return {"revision": revision, "con_cambios": bool(cambios)}
+
+
+def modelo_cpu():
+    try:
+        with open("/proc/cpuinfo", "r", encoding="utf-8") as archivo:
+            for linea in archivo:
+                if linea.startswith("model name"):
+                    return linea.partition(":")[2].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def metadatos_ejecucion():
+    ahora = datetime.now(timezone.utc)
+    return {
+        "id": ahora.strftime("%Y%m%dT%H%M%S%fZ"),
+        "fecha": ahora.isoformat(),
+        "git": revision_git(),
+        "python": platform.python_version(),
+        "implementacion": platform.python_implementation(),
+        "cpu": modelo_cpu(),
+        "plataforma": platform.platform(),
+    }
+
+
+# Almacén
+
+
+def registrar_ejecucion(informe, ruta_historial=RUTA_HISTORIAL):
+    """Append the harness report with run metadata to the JSONL history and return the record"""
+    registro = {**metadatos_ejecucion(), "parametros": informe["parametros"], "resultados": informe["resultados"]}
+    ruta_historial.parent.mkdir(parents=True, exist_ok=True)
+    with open(ruta_historial, "a", encoding="utf-8") as archivo:
+        archivo.write(json.dumps(registro, ensure_ascii=False) + "\n")
+    return registro
+
+
+def cargar_historial(ruta_historial=RUTA_HISTORIAL):
+    if not ruta_historial.exists():
+        return []
+    with open(ruta_historial, "r", encoding="utf-8") as archivo:
+        return [json.loads(linea) for linea in archivo if linea.strip()]
+
+
+def buscar_ejecucion(historial, referencia):
+    # Acepta un id o un índice de Python (-1 es la última ejecución)
+    for posicion, registro in enumerate(historial):
+        if registro["id"] == referencia:
+            return posicion
+    try:
+        return range(len(historial))[int(referencia)]
+    except (ValueError, IndexError):
+        raise ValueError(f"Ejecución no encontrada en el historial: {referencia!r}") from None
+
+
+def muestras_por_serie(registro):
+    # (algoritmo, carga, dirección) -> muestras de latencia en µs/byte
+    return {
+        (fila["algoritmo"], fila["carga"], direccion): muestras
+        for fila in registro["resultados"]
+        for direccion, muestras in fila.get("muestras", {}).items()
+    }
+
+
+# Comparación
+
+
+def prueba_permutacion(base, actual, numero_permutaciones=NUMERO_PERMUTACIONES, semilla=0):
+    """One-sided permutation test p-value for median(actual) > median(base)"""
+    observada = statistics.median(actual) - statistics.median(base)
+    combinadas = list(base) + list(actual)
+    generador = random.Random(semilla)
+    extremas = 0
+    for _ in range(numero_permutaciones):
+        generador.shuffle(combinadas)
+        diferencia = statistics.median(combinadas[len(base):]) - statistics.median(combinadas[:len(base)])
+        if diferencia >= observada:
+            extremas += 1
+    return (extremas + 1) / (numero_permutaciones + 1)
+
+
+def comparar_ejecuciones(registros_base, registro_actual, umbral=UMBRAL_REGRESION, alfa=ALFA):
+    """Compare latency samples series by series.
+
+    A series regresses when its median slowed down by more than `umbral` and the
+    permutation test rejects "no slowdown" at level `alfa`.
+    """
+    muestras_base = {}
+    for registro in registros_base:
+        for serie, muestras in muestras_por_serie(registro).items():
+            muestras_base.setdefault(serie, []).extend(muestras)
+
+    comparaciones = []
+    for serie, muestras_actuales in sorted(muestras_por_serie(registro_actual).items()):
+        if serie not in muestras_base:
+            continue
+        mediana_base = statistics.median(muestras_base[serie])
+        mediana_actual = statistics.median(muestras_actuales)
+        cambio_relativo = (mediana_actual - mediana_base) / mediana_base
+        valor_p = prueba_permutacion(muestras_base[serie], muestras_actuales)
+        comparaciones.append(
+            {
+                "algoritmo": serie[0],
+                "carga": serie[1],
+                "direccion": serie[2],
+                "mediana_base": mediana_base,
+                "mediana_actual": mediana_actual,
+                "cambio_relativo": cambio_relativo,
+                "valor_p": valor_p,
+                "regresion": cambio_relativo > umbral and valor_p < alfa,
+            }
+        )
+    return comparaciones
+
+
+def seleccionar_base(historial, posicion_actual, referencia_base=None, ventana=VENTANA_BASE):
+    if referencia_base is not None:
+        return [historial[buscar_ejecucion(historial, referencia_base)]]
+    # Base móvil: las últimas ejecuciones anteriores en la misma CPU, con el mismo
+    # intérprete y los mismos parámetros de medición
+    actual = historial[posicion_actual]
+    anteriores = [
+        registro for registro in historial[:posicion_actual]
+        if all(registro.get(campo) == actual.get(campo) for campo in CAMPOS_COMPARABLES)
+    ]
+    return anteriores[-ventana:]
+
+
+def describir(registro):
+    git = registro["git"] or {}
+    revision = git.get("revision", "?")[:10] + ("+" if git.get("con_cambios") else "")
+    return f"{registro['id']}  {revision:<12} Python {registro['python']:<8} {registro['cpu']}"
+
+
+def comando_listar(opciones):
+    for posicion, registro in enumerate(cargar_historial(opciones.historial)):
+        print(f"{posicion:>4}  {describir(registro)}")
+    return 0
+
+
+def comando_comparar(opciones):
+    historial = cargar_historial(opciones.historial)
+    if not historial:
+        print(f"Historial vacío: {opciones.historial}")
+        return 2
+    posicion_actual = buscar_ejecucion(historial, opciones.actual)
+    registros_base = seleccionar_base(historial, posicion_actual, opciones.base, opciones.ventana)
+    if not registros_base:
+        print("No hay ejecuciones base con las que comparar")
+        return 2
+
+    print(f"actual: {describir(historial[posicion_actual])}")
+    for registro in registros_base:
+        print(f"base:   {describir(registro)}")
+
+    comparaciones = comparar_ejecuciones(registros_base, historial[posicion_actual], opciones.umbral, opciones.alfa)
+    for comparacion in comparaciones:
+        marca = "REGRESIÓN" if comparacion["regresion"] else ""
+        print(
+            f"{comparacion['algoritmo']:<22}{comparacion['carga']:<26}{comparacion['direccion']:<12}"
+            f"{comparacion['mediana_base']:>10.4f}{comparacion['mediana_actual']:>10.4f} µs/B"
+            f"{comparacion['cambio_relativo']:>+9.1%}  p={comparacion['valor_p']:.4f}  {marca}"
+        )
+    return 1 if any(comparacion["regresion"] for comparacion in comparaciones) else 0
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Historial de resultados y detección de regresiones")
+    parser.add_argument("--historial", type=Path, default=RUTA_HISTORIAL)
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    subcomandos.add_parser("listar", help="lista las ejecuciones registradas").set_defaults(funcion=comando_listar)
+
+    comparar = subcomandos.add_parser("comparar", help="busca regresiones de latencia")
+    comparar.add_argument("--actual", default="-1", help="id o índice de la ejecución a evaluar")
+    comparar.add_argument("--base", help="id o índice de la ejecución base (por defecto, base móvil)")
+    comparar.add_argument("--ventana", type=int, default=VENTANA_BASE, help="ejecuciones de la base móvil")
+    comparar.add_argument("--umbral", type=float, default=UMBRAL_REGRESION, help="empeoramiento relativo mínimo")
+    comparar.add_argument("--alfa", type=float, default=ALFA, help="nivel de significación")
+    comparar.set_defaults(funcion=comando_comparar)
+
+    opciones = parser.parse_args(argumentos)
+    return opciones.funcion(opciones)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
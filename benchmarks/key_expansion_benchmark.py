@@ -0,0 +1,119 @@
+"""
+Expansión Masiva de Claves para Aprovisionamiento de Dispositivos
+Compara, en claves por segundo, la expansión clave a clave de cada algoritmo con la
+expansión en bloque de NumPy (expandir_claves_lote de los módulos lotes), que deriva
+las claves de ronda de N claves a la vez con la misma disposición de salida:
+
+- AES-128: matrices (N, 11, 16) de claves_ronda_a_matriz(expansion_clave(clave))
+- DES: fragmentos (N, 128) de claves_ronda_a_fragmentos (motor "enteros")
+- PRESENT-80: claves de ronda (N, 32) de expandir_registro_clave
+
+Que ambas expansiones coinciden lo comprueba tests/test_expansion_lote.py.
+
+Uso:
+    python benchmarks/key_expansion_benchmark.py
+    python benchmarks/key_expansion_benchmark.py --algoritmos PRESENT-80 --claves 100000 --ensayos 3
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+from pathlib import Path
+
+import numpy as np
+
+RUTA_RAIZ_PROYECTO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RUTA_RAIZ_PROYECTO))
+
+from algorithms.AES.index import expansion_clave  # noqa: E402
+from algorithms.AES.lotes import claves_ronda_a_matriz, expandir_claves_lote as aes_expandir_claves_lote  # noqa: E402
+from algorithms.DES.index import claves_ronda_a_fragmentos, generar_claves_ronda as des_generar_claves_ronda  # noqa: E402
+from algorithms.DES.lotes import expandir_claves_lote as des_expandir_claves_lote  # noqa: E402
+from algorithms.PRESENT.index import expandir_registro_clave  # noqa: E402
+from algorithms.PRESENT.lotes import expandir_claves_lote as present_expandir_claves_lote  # noqa: E402
+from algorithms.utils.index import bytes_a_bits  # noqa: E402
+from benchmarks.timing import medir_ensayos  # noqa: E402
+
+
+def expandir_aes(claves):
+    return np.array([claves_ronda_a_matriz(expansion_clave(bytes(clave))) for clave in claves], dtype=np.uint8)
+
+
+def expandir_des(claves):
+    return np.array(
+        [claves_ronda_a_fragmentos(des_generar_claves_ronda(bytes_a_bits(bytes(clave)))) for clave in claves],
+        dtype=np.uint8,
+    )
+
+
+def expandir_present(claves):
+    return np.array([expandir_registro_clave(int.from_bytes(bytes(clave), "big")) for clave in claves], dtype=np.uint64)
+
+
+# Algoritmo -> (bytes de clave, expansión clave a clave, expansión en bloque)
+EXPANSIONES = {
+    "AES-128": (16, expandir_aes, aes_expandir_claves_lote),
+    "DES": (8, expandir_des, des_expandir_claves_lote),
+    "PRESENT-80": (10, expandir_present, present_expandir_claves_lote),
+}
+NUMERO_CLAVES = 20000
+NUMERO_ENSAYOS = 3
+
+
+def claves_por_segundo(funcion, claves, numero_ensayos):
+    # Una expansión completa por ensayo; el calentamiento se limita a un lote
+    tiempos = medir_ensayos(funcion, (claves,), numero_ensayos, numero_ensayos, maximo_lotes_calentamiento=1)
+    return len(claves) / statistics.median(tiempos["muestras_segundos"])
+
+
+def medir_algoritmo(algoritmo, numero_claves, numero_ensayos):
+    longitud_clave, expandir_una_a_una, expandir_en_bloque = EXPANSIONES[algoritmo]
+    claves = np.frombuffer(os.urandom(numero_claves * longitud_clave), dtype=np.uint8).reshape(-1, longitud_clave)
+
+    una_a_una = claves_por_segundo(expandir_una_a_una, claves, numero_ensayos)
+    en_bloque = claves_por_segundo(expandir_en_bloque, claves, numero_ensayos)
+    return {
+        "algoritmo": algoritmo,
+        "claves": numero_claves,
+        "claves_por_segundo_una_a_una": una_a_una,
+        "claves_por_segundo_en_bloque": en_bloque,
+        "aceleracion": en_bloque / una_a_una,
+    }
+
+
+def imprimir_resumen(mediciones):
+    print(f"{'algoritmo':<12}{'claves':>10}{'una a una/s':>16}{'en bloque/s':>16}{'aceleración':>13}")
+    for medicion in mediciones:
+        print(
+            f"{medicion['algoritmo']:<12}{medicion['claves']:>10}{medicion['claves_por_segundo_una_a_una']:>16,.0f}"
+            f"{medicion['claves_por_segundo_en_bloque']:>16,.0f}{medicion['aceleracion']:>12.1f}x"
+        )
+
+
+def ejecutar_benchmark(algoritmos=tuple(EXPANSIONES), numero_claves=NUMERO_CLAVES, numero_ensayos=NUMERO_ENSAYOS,
+                       directorio_salida=RUTA_RAIZ_PROYECTO / "results"):
+    mediciones = [medir_algoritmo(algoritmo, numero_claves, numero_ensayos) for algoritmo in algoritmos]
+
+    directorio_salida.mkdir(parents=True, exist_ok=True)
+    with open(directorio_salida / "key_expansion_results.json", "w", encoding="utf-8") as archivo:
+        json.dump(mediciones, archivo, indent=2, ensure_ascii=False)
+    imprimir_resumen(mediciones)
+    return mediciones
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Expansión de claves clave a clave frente a expansión en bloque")
+    parser.add_argument("--algoritmos", nargs="+", default=list(EXPANSIONES), choices=list(EXPANSIONES))
+    parser.add_argument("--claves", type=int, default=NUMERO_CLAVES, help="número de claves a expandir")
+    parser.add_argument("--ensayos", type=int, default=NUMERO_ENSAYOS)
+    parser.add_argument("--salida", type=Path, default=RUTA_RAIZ_PROYECTO / "results")
+    opciones = parser.parse_args(argumentos)
+
+    ejecutar_benchmark(opciones.algoritmos, opciones.claves, opciones.ensayos, opciones.salida)
+    print("SUCCESS")
+
+
+if __name__ == "__main__":
+    main()
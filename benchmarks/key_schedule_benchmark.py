@@ -0,0 +1,132 @@
+"""
+Claves Pre-expandidas frente a Claves al Vuelo para Algoritmos de Criptografía Ligera
+Para cada algoritmo compara el motor rápido con claves de ronda pre-expandidas con el
+motor "al_vuelo", que solo guarda la clave (o el registro) y deriva cada clave de ronda
+durante el bloque:
+
+- bytes que ocupa en reposo el contexto de una clave (tamaño profundo)
+- tiempo de preparación de la clave
+- latencia de cifrado y descifrado en µs/byte (mediana de los ensayos)
+- pico transitorio de memoria de una llamada de cifrado y de descifrado, y de descifrar
+  un solo bloque: un motor al vuelo que no puede recorrer su programación de claves
+  hacia atrás (PRESENT) la deriva en cada descifrado, y ese pico es lo que ocupa
+
+Sirve para elegir, por clase de dispositivo, entre memoria en reposo y latencia.
+
+Uso:
+    python benchmarks/key_schedule_benchmark.py
+    python benchmarks/key_schedule_benchmark.py --algoritmos PRESENT-80 --archivo short_message.txt --ensayos 5
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tracemalloc
+from pathlib import Path
+
+RUTA_RAIZ_PROYECTO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RUTA_RAIZ_PROYECTO))
+
+from benchmarks.harness import REGISTRO_CIFRADORES, cargar_datos_prueba  # noqa: E402
+from benchmarks.memory import medir_llamada, tamanio_profundo  # noqa: E402
+from benchmarks.timing import medir_ensayos  # noqa: E402
+
+# Algoritmo -> (motor con claves pre-expandidas, motor con claves al vuelo)
+PARES_MOTORES = {
+    "AES-128": ("AES-128/tablas", "AES-128/al_vuelo"),
+    "DES": ("DES/enteros", "DES/al_vuelo"),
+    "PRESENT-80": ("PRESENT-80/tablas", "PRESENT-80/al_vuelo"),
+}
+ITERACIONES_PREPARACION_CLAVE = 200
+NUMERO_ENSAYOS = 5
+
+
+def pico_llamada(funcion, argumentos):
+    tracemalloc.start()
+    try:
+        return medir_llamada(funcion, argumentos)[1]["pico_bytes"]
+    finally:
+        tracemalloc.stop()
+
+
+def medir_motor(nombre_motor, datos, numero_iteraciones, numero_ensayos):
+    cifrador = REGISTRO_CIFRADORES[nombre_motor]
+    crear_contexto, clave = cifrador["contexto"], cifrador["clave"]
+    contexto = crear_contexto(clave)
+    texto_cifrado = contexto.cifrar(datos)
+
+    preparacion = medir_ensayos(crear_contexto, (clave,), ITERACIONES_PREPARACION_CLAVE, numero_ensayos)
+    resultado = {
+        "motor": nombre_motor,
+        "claves_ronda_bytes": tamanio_profundo(contexto),
+        "preparacion_clave_microsegundos": statistics.median(preparacion["muestras_segundos"]) * 1_000_000,
+    }
+    for direccion, funcion, entrada in (
+        ("cifrado", contexto.cifrar, datos),
+        ("descifrado", contexto.descifrar, texto_cifrado),
+    ):
+        tiempos = medir_ensayos(funcion, (entrada,), numero_iteraciones, numero_ensayos)
+        resultado[f"latencia_{direccion}_microsegundos_por_byte"] = (
+            statistics.median(tiempos["muestras_segundos"]) / len(datos) * 1_000_000
+        )
+        resultado[f"pico_{direccion}_bytes"] = pico_llamada(funcion, (entrada,))
+    resultado["pico_descifrado_bloque_bytes"] = pico_llamada(
+        contexto.descifrar_bloque, (texto_cifrado[: contexto.TAMANIO_BLOQUE],)
+    )
+    return resultado
+
+
+def imprimir_resumen(comparaciones):
+    print(f"{'motor':<22}{'claves B':>10}{'prep µs':>10}{'cif µs/B':>10}{'desc µs/B':>11}"
+          f"{'pico cif B':>12}{'pico desc B':>13}{'pico bloque B':>15}")
+    for comparacion in comparaciones:
+        for medicion in comparacion["motores"]:
+            print(
+                f"{medicion['motor']:<22}{medicion['claves_ronda_bytes']:>10}"
+                f"{medicion['preparacion_clave_microsegundos']:>10.1f}"
+                f"{medicion['latencia_cifrado_microsegundos_por_byte']:>10.3f}"
+                f"{medicion['latencia_descifrado_microsegundos_por_byte']:>11.3f}"
+                f"{medicion['pico_cifrado_bytes']:>12}{medicion['pico_descifrado_bytes']:>13}"
+                f"{medicion['pico_descifrado_bloque_bytes']:>15}"
+            )
+
+
+def ejecutar_benchmark(algoritmos=tuple(PARES_MOTORES), nombre_archivo="medium_message.txt", numero_iteraciones=10,
+                       numero_ensayos=NUMERO_ENSAYOS, directorio_salida=RUTA_RAIZ_PROYECTO / "results"):
+    datos = cargar_datos_prueba(nombre_archivo).encode("utf-8")
+    comparaciones = [
+        {
+            "algoritmo": algoritmo,
+            "carga": nombre_archivo,
+            "tamanio_bytes": len(datos),
+            "motores": [
+                medir_motor(nombre_motor, datos, numero_iteraciones, numero_ensayos)
+                for nombre_motor in PARES_MOTORES[algoritmo]
+            ],
+        }
+        for algoritmo in algoritmos
+    ]
+
+    directorio_salida.mkdir(parents=True, exist_ok=True)
+    with open(directorio_salida / "key_schedule_results.json", "w", encoding="utf-8") as archivo:
+        json.dump(comparaciones, archivo, indent=2, ensure_ascii=False)
+    imprimir_resumen(comparaciones)
+    return comparaciones
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Claves de ronda pre-expandidas frente a derivadas al vuelo")
+    parser.add_argument("--algoritmos", nargs="+", default=list(PARES_MOTORES), choices=list(PARES_MOTORES))
+    parser.add_argument("--archivo", default="medium_message.txt", help="archivo de data/")
+    parser.add_argument("--iteraciones", type=int, default=10)
+    parser.add_argument("--ensayos", type=int, default=NUMERO_ENSAYOS)
+    parser.add_argument("--salida", type=Path, default=RUTA_RAIZ_PROYECTO / "results")
+    opciones = parser.parse_args(argumentos)
+
+    ejecutar_benchmark(opciones.algoritmos, opciones.archivo, opciones.iteraciones, opciones.ensayos, opciones.salida)
+    print("SUCCESS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+"""
+Benchmark de Carga Concurrente para Algoritmos de Criptografía Ligera
+Simula miles de dispositivos IoT, cada uno con su propia clave, que envían mensajes
+con tamaños tomados del corpus de data/. Las solicitudes llegan a una tasa objetivo
+(carga abierta: la latencia se mide desde el instante programado de llegada, así que
+incluye la espera en cola) y se atienden con un grupo de hilos, de procesos o desde
+un bucle asyncio. Para cada tasa ofrecida se reporta el rendimiento logrado, los
+percentiles de latencia y los fallos de la caché de claves.
+
+Uso:
+    python benchmarks/load_benchmark.py
+    python benchmarks/load_benchmark.py --algoritmos AES-128/tablas --frente procesos \\
+        --dispositivos 5000 --tasas 200 400 800 1600 --duracion 3
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import string
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+
+RUTA_RAIZ_PROYECTO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RUTA_RAIZ_PROYECTO))
+
+from algorithms.utils.cache import CACHE_CLAVES  # noqa: E402
+from benchmarks.harness import ALGORITMOS_POR_DEFECTO, REGISTRO_CIFRADORES, cargar_datos_prueba  # noqa: E402
+from benchmarks.timing import percentil  # noqa: E402
+
+FRENTES = ("hilos", "procesos", "asyncio")
+LONGITUD_CLAVE = {"AES-128": 16, "DES": 8, "PRESENT-80": 10}
+# Tráfico dominado por telemetría pequeña con algunas cargas grandes
+DISTRIBUCION_POR_DEFECTO = {
+    "short_message.txt": 0.6,
+    "medium_message.txt": 0.25,
+    "long_message.txt": 0.1,
+    "very_long_message.txt": 0.04,
+    "extreme_iot_message.txt": 0.01,
+}
+NUMERO_DISPOSITIVOS = 2000
+TASAS_POR_DEFECTO = (50, 100, 200, 400)
+DURACION_SEGUNDOS = 2.0
+
+
+# Carga de trabajo
+
+
+def generar_claves_dispositivos(nombre_algoritmo, numero_dispositivos, semilla=0):
+    generador = random.Random(semilla)
+    longitud = LONGITUD_CLAVE[nombre_algoritmo.split("/")[0]]
+    alfabeto = string.ascii_letters + string.digits
+    return ["".join(generador.choices(alfabeto, k=longitud)) for _ in range(numero_dispositivos)]
+
+
+def generar_solicitudes(claves, distribucion, numero_solicitudes, semilla=0):
+    generador = random.Random(semilla)
+    mensajes = {nombre_archivo: cargar_datos_prueba(nombre_archivo) for nombre_archivo in distribucion}
+    archivos = generador.choices(list(distribucion), weights=list(distribucion.values()), k=numero_solicitudes)
+    return [(mensajes[nombre_archivo], generador.choice(claves)) for nombre_archivo in archivos]
+
+
+def interpretar_distribucion(texto):
+    # Ejemplo: "short_message.txt:0.7,long_message.txt:0.3"
+    distribucion = {}
+    for entrada in texto.split(","):
+        nombre_archivo, _, peso = entrada.partition(":")
+        distribucion[nombre_archivo.strip()] = float(peso or 1)
+    return distribucion
+
+
+# Funciones ejecutadas por los trabajadores
+
+
+def inicializar_trabajador(capacidad_cache):
+    if capacidad_cache is not None:
+        CACHE_CLAVES.configurar(capacidad=capacidad_cache)
+
+
+def atender_solicitud(nombre_algoritmo, mensaje, clave):
+    # Devuelve cuántas expansiones de clave hizo; solo es exacto en procesos de un solo
+    # hilo, con hilos se usa el contador global de la caché
+    fallos_previos = CACHE_CLAVES.fallos
+    REGISTRO_CIFRADORES[nombre_algoritmo]["cifrar"](mensaje, clave)
+    return CACHE_CLAVES.fallos - fallos_previos
+
+
+# Frentes de generación de carga
+
+
+def esperar_hasta(instante):
+    restante = instante - time.perf_counter()
+    if restante > 0:
+        time.sleep(restante)
+
+
+def generar_carga_ejecutor(ejecutor, nombre_algoritmo, solicitudes, tasa):
+    latencias = [None] * len(solicitudes)
+    fallos_cache = [0]
+    futuros = []
+    inicio = time.perf_counter()
+
+    for indice, (mensaje, clave) in enumerate(solicitudes):
+        llegada = inicio + indice / tasa
+        esperar_hasta(llegada)
+        futuro = ejecutor.submit(atender_solicitud, nombre_algoritmo, mensaje, clave)
+
+        def completar(futuro, indice=indice, llegada=llegada):
+            latencias[indice] = time.perf_counter() - llegada
+            fallos_cache[0] += futuro.result()
+
+        futuro.add_done_callback(completar)
+        futuros.append(futuro)
+
+    for futuro in futuros:
+        futuro.result()
+    return latencias, time.perf_counter() - inicio, fallos_cache[0]
+
+
+def generar_carga_asyncio(ejecutor, nombre_algoritmo, solicitudes, tasa):
+    async def atender(indice, llegada, mensaje, clave, latencias, fallos_cache):
+        bucle = asyncio.get_running_loop()
+        fallos_cache[0] += await bucle.run_in_executor(ejecutor, atender_solicitud, nombre_algoritmo, mensaje, clave)
+        latencias[indice] = time.perf_counter() - llegada
+
+    async def generar():
+        latencias = [None] * len(solicitudes)
+        fallos_cache = [0]
+        tareas = []
+        inicio = time.perf_counter()
+        for indice, (mensaje, clave) in enumerate(solicitudes):
+            llegada = inicio + indice / tasa
+            await asyncio.sleep(max(llegada - time.perf_counter(), 0))
+            tareas.append(asyncio.create_task(atender(indice, llegada, mensaje, clave, latencias, fallos_cache)))
+        await asyncio.gather(*tareas)
+        return latencias, time.perf_counter() - inicio, fallos_cache[0]
+
+    return asyncio.run(generar())
+
+
+def crear_ejecutor(frente, numero_trabajadores, capacidad_cache):
+    if frente == "procesos":
+        return ProcessPoolExecutor(numero_trabajadores, initializer=inicializar_trabajador, initargs=(capacidad_cache,))
+    inicializar_trabajador(capacidad_cache)
+    return ThreadPoolExecutor(numero_trabajadores)
+
+
+def medir_tasa(frente, ejecutor, nombre_algoritmo, solicitudes, tasa):
+    fallos_previos = CACHE_CLAVES.fallos
+    if frente == "asyncio":
+        latencias, duracion, fallos_cache = generar_carga_asyncio(ejecutor, nombre_algoritmo, solicitudes, tasa)
+    else:
+        latencias, duracion, fallos_cache = generar_carga_ejecutor(ejecutor, nombre_algoritmo, solicitudes, tasa)
+    if frente != "procesos":
+        fallos_cache = CACHE_CLAVES.fallos - fallos_previos
+
+    ordenadas = sorted(latencias)
+    return {
+        "tasa_ofrecida": tasa,
+        "tasa_lograda": len(solicitudes) / duracion,
+        "solicitudes": len(solicitudes),
+        "latencia_p50_ms": percentil(ordenadas, 0.50) * 1000,
+        "latencia_p95_ms": percentil(ordenadas, 0.95) * 1000,
+        "latencia_p99_ms": percentil(ordenadas, 0.99) * 1000,
+        "latencia_maxima_ms": ordenadas[-1] * 1000,
+        "fallos_cache_claves": fallos_cache,
+    }
+
+
+def ejecutar_carga(nombre_algoritmo, frente, numero_dispositivos, distribucion, tasas, duracion,
+                   numero_trabajadores, capacidad_cache):
+    claves = generar_claves_dispositivos(nombre_algoritmo, numero_dispositivos)
+    resultados = []
+    # Cada serie empieza con la caché fría aunque otra serie haya corrido en este proceso
+    CACHE_CLAVES.limpiar()
+    with crear_ejecutor(frente, numero_trabajadores, capacidad_cache) as ejecutor:
+        # Calentamiento: arranca los trabajadores e importa los módulos en cada proceso
+        for futuro in [ejecutor.submit(atender_solicitud, nombre_algoritmo, "calentamiento", claves[0])
+                       for _ in range(numero_trabajadores)]:
+            futuro.result()
+
+        for tasa in tasas:
+            solicitudes = generar_solicitudes(claves, distribucion, max(int(tasa * duracion), 1), semilla=tasa)
+            resultados.append(medir_tasa(frente, ejecutor, nombre_algoritmo, solicitudes, tasa))
+            fila = resultados[-1]
+            print(
+                f"{nombre_algoritmo} [{frente}] {tasa:>7.0f} sol/s ofrecidas -> {fila['tasa_lograda']:>7.1f} logradas, "
+                f"p50 {fila['latencia_p50_ms']:.2f} ms, p99 {fila['latencia_p99_ms']:.2f} ms, "
+                f"{fila['fallos_cache_claves']} fallos de caché"
+            )
+    return resultados
+
+
+# Salida
+
+
+def generar_grafico(resultados_benchmark, ruta_archivo_salida):
+    figura, ejes_subgraficos = plt.subplots(1, 2, figsize=(14, 6))
+    ejes_latencia, ejes_rendimiento = ejes_subgraficos
+
+    for nombre_serie, filas in resultados_benchmark.items():
+        tasas = [fila["tasa_ofrecida"] for fila in filas]
+        linea = ejes_latencia.plot(tasas, [fila["latencia_p99_ms"] for fila in filas], marker="o", label=f"{nombre_serie} p99")[0]
+        ejes_latencia.plot(tasas, [fila["latencia_p50_ms"] for fila in filas], marker=".", linestyle="--",
+                           color=linea.get_color(), label=f"{nombre_serie} p50")
+        ejes_rendimiento.plot(tasas, [fila["tasa_lograda"] for fila in filas], marker="o", label=nombre_serie)
+
+    tasas_maximas = max(fila["tasa_ofrecida"] for filas in resultados_benchmark.values() for fila in filas)
+    ejes_rendimiento.plot([0, tasas_maximas], [0, tasas_maximas], linestyle="--", color="#7f8c8d", label="Ideal")
+
+    ejes_latencia.set_yscale("log")
+    ejes_latencia.set_xlabel("Carga ofrecida (solicitudes/s)", fontsize=12)
+    ejes_latencia.set_ylabel("Latencia (ms)", fontsize=12)
+    ejes_latencia.set_title("Latencia bajo Carga - Menor es Mejor", fontsize=14)
+    ejes_latencia.legend(loc="upper left", fontsize=8)
+
+    ejes_rendimiento.set_xlabel("Carga ofrecida (solicitudes/s)", fontsize=12)
+    ejes_rendimiento.set_ylabel("Rendimiento logrado (solicitudes/s)", fontsize=12)
+    ejes_rendimiento.set_title("Rendimiento Logrado - Mayor es Mejor", fontsize=14)
+    ejes_rendimiento.legend(loc="upper left", fontsize=8)
+
+    plt.tight_layout()
+    ruta_archivo_salida.parent.mkdir(parents=True, exist_ok=True)
+    plt.savefig(ruta_archivo_salida, dpi=150)
+    plt.close()
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Carga concurrente de muchos dispositivos con claves propias")
+    parser.add_argument("--algoritmos", nargs="+", default=list(ALGORITMOS_POR_DEFECTO), choices=list(REGISTRO_CIFRADORES))
+    parser.add_argument("--frente", nargs="+", default=["hilos"], choices=FRENTES)
+    parser.add_argument("--dispositivos", type=int, default=NUMERO_DISPOSITIVOS)
+    parser.add_argument("--distribucion", type=interpretar_distribucion, default=DISTRIBUCION_POR_DEFECTO,
+                        help='pesos por archivo de data/, p. ej. "short_message.txt:0.9,long_message.txt:0.1"')
+    parser.add_argument("--tasas", nargs="+", type=float, default=list(TASAS_POR_DEFECTO), help="solicitudes/s ofrecidas")
+    parser.add_argument("--duracion", type=float, default=DURACION_SEGUNDOS, help="segundos por tasa")
+    parser.add_argument("--trabajadores", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--capacidad-cache", type=int, default=None, help="entradas de la caché de claves")
+    parser.add_argument("--salida", type=Path, default=RUTA_RAIZ_PROYECTO / "results")
+    opciones = parser.parse_args(argumentos)
+
+    resultados_benchmark = {}
+    for nombre_algoritmo in opciones.algoritmos:
+        for frente in opciones.frente:
+            resultados_benchmark[f"{nombre_algoritmo} [{frente}]"] = ejecutar_carga(
+                nombre_algoritmo,
+                frente,
+                opciones.dispositivos,
+                opciones.distribucion,
+                opciones.tasas,
+                opciones.duracion,
+                opciones.trabajadores,
+                opciones.capacidad_cache,
+            )
+
+    opciones.salida.mkdir(parents=True, exist_ok=True)
+    with open(opciones.salida / "load_results.json", "w", encoding="utf-8") as archivo:
+        json.dump({"parametros": {**vars(opciones), "salida": str(opciones.salida)}, "resultados": resultados_benchmark},
+                  archivo, indent=2, ensure_ascii=False)
+    generar_grafico(resultados_benchmark, opciones.salida / "load_benchmark.png")
+    print("SUCCESS")
+
+
+if __name__ == "__main__":
+    main()
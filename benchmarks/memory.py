@@ -0,0 +1,147 @@
+"""
+Perfilado de Memoria para los Benchmarks de Criptografía Ligera
+Tamaño profundo de tablas y claves de ronda, asignaciones por byte cifrado, pico
+transitorio frente a memoria retenida, y lectura de VmRSS/VmHWM de /proc/self/status.
+"""
+
+import gc
+import sys
+import tracemalloc
+from array import array
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+
+# Objetos que no son datos del cifrador (código y módulos)
+TIPOS_EXCLUIDOS = (FunctionType, BuiltinFunctionType, MethodType, ModuleType, type)
+# Tipos de las tablas a nivel de módulo; deja fuera objetos como CACHE_CLAVES
+TIPOS_TABLAS = (list, tuple, dict, set, frozenset, array, bytes, bytearray, str, int)
+
+
+def tamanio_profundo(objeto, vistos=None):
+    """sys.getsizeof of `objeto` plus everything it references, each object counted once.
+
+    Pass the same `vistos` set across calls to avoid counting shared tables twice.
+    """
+    if vistos is None:
+        vistos = set()
+    pendientes = [objeto]
+    total = 0
+    while pendientes:
+        actual = pendientes.pop()
+        if id(actual) in vistos or isinstance(actual, TIPOS_EXCLUIDOS):
+            continue
+        vistos.add(id(actual))
+        total += sys.getsizeof(actual)
+
+        if isinstance(actual, dict):
+            pendientes.extend(actual.keys())
+            pendientes.extend(actual.values())
+        elif isinstance(actual, (list, tuple, set, frozenset)):
+            pendientes.extend(actual)
+        elif isinstance(actual, (str, bytes, bytearray, array, int, float, memoryview)):
+            continue
+        else:
+            if hasattr(actual, "__dict__"):
+                pendientes.append(vars(actual))
+            for nombre_slot in getattr(type(actual), "__slots__", ()):
+                if hasattr(actual, nombre_slot):
+                    pendientes.append(getattr(actual, nombre_slot))
+    return total
+
+
+def tamanio_tablas_modulos(modulos, vistos=None):
+    # Atributos públicos de datos (tablas, cajas S, permutaciones) de los módulos
+    vistos = set() if vistos is None else vistos
+    return sum(
+        tamanio_profundo(valor, vistos)
+        for modulo in modulos
+        for nombre, valor in vars(modulo).items()
+        if not nombre.startswith("_") and isinstance(valor, TIPOS_TABLAS)
+    )
+
+
+def tamanio_tablas_nombradas(modulo, nombres, vistos=None):
+    # Solo las tablas indicadas (las que usa un motor), sin el resto del módulo
+    vistos = set() if vistos is None else vistos
+    return sum(tamanio_profundo(getattr(modulo, nombre), vistos) for nombre in nombres)
+
+
+def leer_estado_proceso(ruta="/proc/self/status"):
+    """VmRSS and VmHWM (peak RSS) of the current process in bytes, or None off Linux"""
+    try:
+        with open(ruta, "r", encoding="ascii") as archivo:
+            lineas = archivo.read().splitlines()
+    except OSError:
+        return None
+    estado = {}
+    for linea in lineas:
+        clave, _, valor = linea.partition(":")
+        if clave in ("VmRSS", "VmHWM"):
+            estado[clave] = int(valor.split()[0]) * 1024
+    return estado
+
+
+def contar_asignaciones(funcion, argumentos):
+    """Approximate allocation count and bytes of one call.
+
+    Samples sys.getallocatedblocks() and the traced memory on every call and
+    return event (Python and C functions) and adds up the increases, so blocks
+    allocated and freed between two events are missed: the result is a lower
+    bound. Must be called with tracemalloc running.
+    """
+    estado = {"bloques": sys.getallocatedblocks(), "memoria": tracemalloc.get_traced_memory()[0]}
+    totales = {"asignaciones": 0, "bytes": 0}
+
+    def gancho(marco, evento, argumento):
+        bloques = sys.getallocatedblocks()
+        memoria = tracemalloc.get_traced_memory()[0]
+        if bloques > estado["bloques"]:
+            totales["asignaciones"] += bloques - estado["bloques"]
+        if memoria > estado["memoria"]:
+            totales["bytes"] += memoria - estado["memoria"]
+        # Se vuelve a leer al final para no contar lo que asigna el propio gancho
+        estado["bloques"] = sys.getallocatedblocks()
+        estado["memoria"] = tracemalloc.get_traced_memory()[0]
+
+    sys.setprofile(gancho)
+    try:
+        resultado = funcion(*argumentos)
+    finally:
+        sys.setprofile(None)
+    return resultado, totales
+
+
+def medir_llamada(funcion, argumentos):
+    """Transient peak and retained bytes of one call, relative to the memory traced before it"""
+    gc.collect()
+    memoria_base = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    resultado = funcion(*argumentos)
+    memoria_actual, memoria_pico = tracemalloc.get_traced_memory()
+    return resultado, {
+        "pico_bytes": memoria_pico - memoria_base,
+        "retenido_bytes": memoria_actual - memoria_base,
+    }
+
+
+def perfilar_memoria_funcion(funcion, argumentos, tamanio_datos_bytes):
+    """Memory profile of `funcion(*argumentos)`: first call (cold caches) vs steady state"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        # La primera llamada incluye la expansión de clave que queda en caché
+        _, primera = medir_llamada(funcion, argumentos)
+        resultado, estable = medir_llamada(funcion, argumentos)
+        del resultado
+        _, asignaciones = contar_asignaciones(funcion, argumentos)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "pico_primera_llamada_bytes": primera["pico_bytes"],
+        "retenido_primera_llamada_bytes": primera["retenido_bytes"],
+        "pico_estable_bytes": estable["pico_bytes"],
+        "retenido_estable_bytes": estable["retenido_bytes"],
+        "asignaciones": asignaciones["asignaciones"],
+        "asignaciones_por_byte": asignaciones["asignaciones"] / tamanio_datos_bytes,
+        "bytes_asignados_por_byte": asignaciones["bytes"] / tamanio_datos_bytes,
+    }
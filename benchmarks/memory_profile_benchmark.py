@@ -0,0 +1,200 @@
+"""
+Perfil de Memoria por Cifrador para Algoritmos de Criptografía Ligera
+Cada cifrador se mide en un subproceso nuevo para que las cachés, las tablas ya
+cargadas y el propio tracemalloc de otro cifrador no contaminen las cifras. El
+subproceso no importa el arnés (que carga los tres cifradores, NumPy y matplotlib):
+recibe los nombres de las funciones del cifrador e importa solo su módulo.
+
+- VmRSS/VmHWM de /proc/self/status antes y después de importar el cifrador, tras
+  expandir la clave y tras cifrar y descifrar (sin tracemalloc activo)
+- tamaño profundo de las tablas que usa el motor (TABLAS_MOTORES) y de la estructura de claves de ronda
+- pico transitorio y memoria retenida en la primera llamada y en régimen estable
+- asignaciones y bytes asignados por byte cifrado (cota inferior)
+
+Uso:
+    python benchmarks/memory_profile_benchmark.py
+    python benchmarks/memory_profile_benchmark.py --algoritmos AES-128 AES-128/tablas --archivo long_message.txt
+"""
+
+import argparse
+import importlib
+import json
+import subprocess
+import sys
+from functools import partial
+from pathlib import Path
+
+RUTA_RAIZ_PROYECTO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RUTA_RAIZ_PROYECTO))
+
+# Solo módulos sin cifradores: el subproceso también ejecuta estas importaciones
+from algorithms.utils.cache import CACHE_CLAVES  # noqa: E402
+from benchmarks.memory import (  # noqa: E402
+    leer_estado_proceso,
+    perfilar_memoria_funcion,
+    tamanio_profundo,
+    tamanio_tablas_nombradas,
+)
+
+# Los mismos que benchmarks.harness, sin importarlo
+ALGORITMOS_POR_DEFECTO = ("AES-128", "DES", "PRESENT-80")
+ITERACIONES_RSS = 100
+
+
+def diferencia_estado(estado_final, estado_inicial):
+    if estado_final is None or estado_inicial is None:
+        return None
+    return {clave: estado_final[clave] - estado_inicial[clave] for clave in estado_final}
+
+
+def referencia_funcion(funcion):
+    # Los motores se registran como partial(funcion, motor=...)
+    funcion_base = getattr(funcion, "func", funcion)
+    return {
+        "referencia": f"{funcion_base.__module__}:{funcion_base.__qualname__}",
+        "argumentos": dict(getattr(funcion, "keywords", None) or {}),
+    }
+
+
+def describir_cifrador(nombre_algoritmo):
+    """JSON description of a registered cipher that the child can import by name"""
+    # El arnés se importa aquí para que el subproceso no lo cargue
+    from benchmarks.harness import REGISTRO_CIFRADORES
+
+    cifrador = REGISTRO_CIFRADORES[nombre_algoritmo]
+    modulo_tablas, nombres_tablas = cifrador["tablas"]
+    return {
+        "algoritmo": nombre_algoritmo,
+        "clave": cifrador["clave"],
+        "cifrar": referencia_funcion(cifrador["cifrar"]),
+        "descifrar": referencia_funcion(cifrador["descifrar"]),
+        "contexto": referencia_funcion(cifrador["contexto"]),
+        # Solo las tablas del motor elegido, no todo lo que definen sus módulos
+        "tablas": {"modulo": modulo_tablas.__name__, "nombres": list(nombres_tablas)},
+    }
+
+
+def resolver_funcion(descripcion):
+    nombre_modulo, _, nombre = descripcion["referencia"].partition(":")
+    funcion = importlib.import_module(nombre_modulo)
+    for parte in nombre.split("."):
+        funcion = getattr(funcion, parte)
+    argumentos = descripcion["argumentos"]
+    return partial(funcion, **argumentos)
+
+
+def cargar_datos_prueba(nombre_archivo):
+    with open(RUTA_RAIZ_PROYECTO / "data" / nombre_archivo, "r", encoding="utf-8") as archivo:
+        return archivo.read()
+
+
+def perfilar_en_proceso(descripcion, nombre_archivo, numero_iteraciones=ITERACIONES_RSS):
+    texto_plano = cargar_datos_prueba(nombre_archivo)
+    tamanio_datos_bytes = len(texto_plano.encode("utf-8"))
+    clave = descripcion["clave"]
+
+    # RSS sin tracemalloc, que añade su propia memoria
+    estado_inicial = leer_estado_proceso()
+    funcion_cifrado, funcion_descifrado, crear_contexto = (
+        resolver_funcion(descripcion[nombre]) for nombre in ("cifrar", "descifrar", "contexto")
+    )
+    modulo_tablas = importlib.import_module(descripcion["tablas"]["modulo"])
+    estado_tras_importacion = leer_estado_proceso()
+    contexto = crear_contexto(clave)
+    estado_tras_clave = leer_estado_proceso()
+    for _ in range(numero_iteraciones):
+        texto_cifrado = funcion_cifrado(texto_plano, clave)
+        funcion_descifrado(texto_cifrado, clave)
+    estado_final = leer_estado_proceso()
+
+    perfiles_direccion = {}
+    for direccion, funcion, entrada in (
+        ("cifrado", funcion_cifrado, texto_plano),
+        ("descifrado", funcion_descifrado, texto_cifrado),
+    ):
+        # La primera llamada de cada dirección vuelve a expandir la clave
+        CACHE_CLAVES.limpiar()
+        perfiles_direccion[direccion] = perfilar_memoria_funcion(funcion, (entrada, clave), tamanio_datos_bytes)
+
+    return {
+        "algoritmo": descripcion["algoritmo"],
+        "carga": nombre_archivo,
+        "tamanio_bytes": tamanio_datos_bytes,
+        "tablas_bytes": tamanio_tablas_nombradas(modulo_tablas, descripcion["tablas"]["nombres"]),
+        "claves_ronda_bytes": tamanio_profundo(contexto),
+        "rss": {
+            "inicial": estado_inicial,
+            "delta_importacion": diferencia_estado(estado_tras_importacion, estado_inicial),
+            # Los deltas siguientes parten del cifrador ya importado
+            "delta_expansion_clave": diferencia_estado(estado_tras_clave, estado_tras_importacion),
+            "delta_final": diferencia_estado(estado_final, estado_tras_importacion),
+        },
+        **perfiles_direccion,
+    }
+
+
+def perfilar_en_subproceso(nombre_algoritmo, nombre_archivo):
+    proceso = subprocess.run(
+        [
+            sys.executable, __file__, "--subproceso", json.dumps(describir_cifrador(nombre_algoritmo)),
+            "--archivo", nombre_archivo,
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proceso.stdout)
+
+
+def imprimir_resumen(perfiles):
+    print(f"{'algoritmo':<22}{'tablas B':>10}{'claves B':>10}{'ΔImport KB':>12}{'ΔRSS KB':>10}{'ΔHWM KB':>10}"
+          f"{'pico B':>10}{'retenido B':>12}{'asig/B':>8}{'B asig/B':>10}")
+    for perfil in perfiles:
+        sin_datos = {"VmRSS": float("nan"), "VmHWM": float("nan")}
+        importacion = perfil["rss"]["delta_importacion"] or sin_datos
+        delta = perfil["rss"]["delta_final"] or sin_datos
+        cifrado = perfil["cifrado"]
+        print(
+            f"{perfil['algoritmo']:<22}{perfil['tablas_bytes']:>10}{perfil['claves_ronda_bytes']:>10}"
+            f"{importacion['VmRSS'] / 1024:>12.0f}"
+            f"{delta['VmRSS'] / 1024:>10.0f}{delta['VmHWM'] / 1024:>10.0f}"
+            f"{cifrado['pico_estable_bytes']:>10}{cifrado['retenido_estable_bytes']:>12}"
+            f"{cifrado['asignaciones_por_byte']:>8.1f}{cifrado['bytes_asignados_por_byte']:>10.1f}"
+        )
+
+
+def ejecutar_benchmark(algoritmos=ALGORITMOS_POR_DEFECTO, nombre_archivo="medium_message.txt",
+                       directorio_salida=RUTA_RAIZ_PROYECTO / "results"):
+    perfiles = [perfilar_en_subproceso(nombre_algoritmo, nombre_archivo) for nombre_algoritmo in algoritmos]
+
+    directorio_salida.mkdir(parents=True, exist_ok=True)
+    with open(directorio_salida / "memory_profile.json", "w", encoding="utf-8") as archivo:
+        json.dump(perfiles, archivo, indent=2, ensure_ascii=False)
+    imprimir_resumen(perfiles)
+    return perfiles
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Perfil de memoria por cifrador, un subproceso por cifrador")
+    parser.add_argument("--algoritmos", nargs="+", default=list(ALGORITMOS_POR_DEFECTO))
+    parser.add_argument("--archivo", default="medium_message.txt", help="archivo de data/")
+    parser.add_argument("--salida", type=Path, default=RUTA_RAIZ_PROYECTO / "results")
+    parser.add_argument("--subproceso", help=argparse.SUPPRESS)
+    opciones = parser.parse_args(argumentos)
+
+    # Dentro del subproceso solo se mide el cifrador descrito y se devuelve el JSON por stdout
+    if opciones.subproceso:
+        json.dump(perfilar_en_proceso(json.loads(opciones.subproceso), opciones.archivo), sys.stdout)
+        return
+
+    from benchmarks.harness import REGISTRO_CIFRADORES
+
+    for nombre_algoritmo in opciones.algoritmos:
+        if nombre_algoritmo not in REGISTRO_CIFRADORES:
+            parser.error(f"Algoritmo no registrado: {nombre_algoritmo!r} (opciones: {', '.join(REGISTRO_CIFRADORES)})")
+    ejecutar_benchmark(opciones.algoritmos, opciones.archivo, opciones.salida)
+    print("SUCCESS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+Gráficos de los benchmarks de Algoritmos de Criptografía Ligera
+Cada función recibe las métricas de una carga útil indexadas por algoritmo
+(tal como las produce benchmarks/harness.py) y guarda un PNG.
+"""
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+
+def dibujar_barras(ejes, lista_algoritmos, series, etiqueta_y, titulo, formato_anotacion):
+    posiciones_eje_x = np.arange(len(lista_algoritmos))
+    ancho_barra = 0.8 / len(series)
+
+    for indice, (etiqueta, valores, color, *errores) in enumerate(series):
+        desplazamiento = (indice - (len(series) - 1) / 2) * ancho_barra
+        barras = ejes.bar(
+            posiciones_eje_x + desplazamiento, valores, ancho_barra, label=etiqueta, color=color,
+            yerr=errores[0] if errores else None, capsize=4,
+        )
+        for barra in barras:
+            altura_barra = barra.get_height()
+            ejes.annotate(
+                formato_anotacion.format(altura_barra),
+                xy=(barra.get_x() + barra.get_width() / 2, altura_barra),
+                xytext=(0, 3),
+                textcoords="offset points",
+                ha="center",
+                va="bottom",
+                fontsize=9,
+            )
+
+    ejes.set_xlabel("Algoritmo", fontsize=12)
+    ejes.set_ylabel(etiqueta_y, fontsize=12)
+    ejes.set_title(titulo, fontsize=14)
+    ejes.set_xticks(posiciones_eje_x)
+    ejes.set_xticklabels(lista_algoritmos, fontsize=11)
+    ejes.legend(loc="upper right")
+
+
+def serie(resultados_benchmark, clave_metrica, escala=1):
+    return [resultados_benchmark[algoritmo][clave_metrica] * escala for algoritmo in resultados_benchmark]
+
+
+def barras_error(resultados_benchmark, direccion):
+    # Intervalo de confianza de la media expresado como distancia a la barra
+    if not all(f"latencia_{direccion}_ic_inferior_microsegundos_por_byte" in resultados_benchmark[algoritmo]
+               for algoritmo in resultados_benchmark):
+        return None
+    media = serie(resultados_benchmark, f"latencia_{direccion}_microsegundos_por_byte")
+    inferior = serie(resultados_benchmark, f"latencia_{direccion}_ic_inferior_microsegundos_por_byte")
+    superior = serie(resultados_benchmark, f"latencia_{direccion}_ic_superior_microsegundos_por_byte")
+    return [[max(m - i, 0) for m, i in zip(media, inferior)], [max(s - m, 0) for m, s in zip(media, superior)]]
+
+
+def guardar_figura(ruta_archivo_salida):
+    plt.tight_layout()
+    ruta_archivo_salida.parent.mkdir(parents=True, exist_ok=True)
+    plt.savefig(ruta_archivo_salida, dpi=150)
+    plt.close()
+
+
+def generar_grafico_latencia(resultados_benchmark, ruta_archivo_salida):
+    figura, ejes = plt.subplots(figsize=(10, 6))
+    dibujar_barras(
+        ejes,
+        list(resultados_benchmark),
+        [
+            (
+                "Cifrado",
+                serie(resultados_benchmark, "latencia_cifrado_microsegundos_por_byte"),
+                "#3498db",
+                barras_error(resultados_benchmark, "cifrado"),
+            ),
+            (
+                "Descifrado",
+                serie(resultados_benchmark, "latencia_descifrado_microsegundos_por_byte"),
+                "#e74c3c",
+                barras_error(resultados_benchmark, "descifrado"),
+            ),
+        ],
+        "Latencia (µs/byte)",
+        "Latencia por Byte (µs/byte) - Menor es Mejor",
+        "{:.4f}",
+    )
+    guardar_figura(ruta_archivo_salida)
+
+
+def generar_grafico_rendimiento(resultados_benchmark, ruta_archivo_salida):
+    figura, ejes = plt.subplots(figsize=(10, 6))
+    dibujar_barras(
+        ejes,
+        list(resultados_benchmark),
+        [
+            ("Cifrado", serie(resultados_benchmark, "rendimiento_cifrado_kb_por_segundo"), "#3498db"),
+            ("Descifrado", serie(resultados_benchmark, "rendimiento_descifrado_kb_por_segundo"), "#e74c3c"),
+        ],
+        "Rendimiento (KB/s)",
+        "Rendimiento (KB/s) - Mayor es Mejor",
+        "{:.2f}",
+    )
+    guardar_figura(ruta_archivo_salida)
+
+
+def generar_grafico_potencia(resultados_benchmark, ruta_archivo_salida):
+    figura, ejes_subgraficos = plt.subplots(2, 1, figsize=(10, 10))
+    lista_algoritmos = list(resultados_benchmark)
+    fuentes = sorted({resultados_benchmark[algoritmo]["fuente_energia"] for algoritmo in lista_algoritmos})
+    figura.suptitle(f"Energía {', '.join(fuentes)}", fontsize=12)
+
+    dibujar_barras(
+        ejes_subgraficos[0],
+        lista_algoritmos,
+        [
+            ("Cifrado", serie(resultados_benchmark, "potencia_cifrado_miliwatios"), "#3498db"),
+            ("Descifrado", serie(resultados_benchmark, "potencia_descifrado_miliwatios"), "#e74c3c"),
+        ],
+        "Potencia (mW)",
+        "Consumo de Potencia (mW)",
+        "{:.1f}",
+    )
+    ejes_subgraficos[0].set_ylim(bottom=0)
+
+    dibujar_barras(
+        ejes_subgraficos[1],
+        lista_algoritmos,
+        [
+            ("Cifrado", serie(resultados_benchmark, "energia_cifrado_microjulios_por_byte"), "#27ae60"),
+            ("Descifrado", serie(resultados_benchmark, "energia_descifrado_microjulios_por_byte"), "#f39c12"),
+        ],
+        "Energía (µJ/byte)",
+        "Energía por Byte (µJ/byte) - Menor es Mejor",
+        "{:.2f}",
+    )
+    guardar_figura(ruta_archivo_salida)
+
+
+def generar_grafico_memoria(resultados_benchmark, ruta_archivo_salida):
+    figura, ejes = plt.subplots(figsize=(10, 6))
+    dibujar_barras(
+        ejes,
+        list(resultados_benchmark),
+        [
+            ("Memoria Estática (Constantes)", serie(resultados_benchmark, "memoria_estatica_bytes", 1 / 1024), "#2ecc71"),
+            ("Claves de Ronda", serie(resultados_benchmark, "claves_ronda_bytes", 1 / 1024), "#9b59b6"),
+            ("Pico Cifrado", serie(resultados_benchmark, "ram_cifrado_bytes", 1 / 1024), "#3498db"),
+            ("Pico Descifrado", serie(resultados_benchmark, "ram_descifrado_bytes", 1 / 1024), "#e74c3c"),
+        ],
+        "Memoria (KB)",
+        "Comparación de Uso de Memoria - Algoritmos de Criptografía Ligera",
+        "{:.2f}",
+    )
+    guardar_figura(ruta_archivo_salida)
+
+
+def generar_grafico_ram(resultados_benchmark, ruta_archivo_salida):
+    figura, ejes_subgraficos = plt.subplots(2, 1, figsize=(10, 10))
+    lista_algoritmos = list(resultados_benchmark)
+
+    dibujar_barras(
+        ejes_subgraficos[0],
+        lista_algoritmos,
+        [
+            ("Cifrado", serie(resultados_benchmark, "ram_cifrado_bytes"), "#3498db"),
+            ("Descifrado", serie(resultados_benchmark, "ram_descifrado_bytes"), "#e74c3c"),
+        ],
+        "RAM (bytes)",
+        "Uso de RAM (bytes) - Menor es Mejor",
+        "{:.0f}",
+    )
+    ejes_subgraficos[0].set_ylim(bottom=0)
+
+    dibujar_barras(
+        ejes_subgraficos[1],
+        lista_algoritmos,
+        [
+            ("Cifrado", serie(resultados_benchmark, "ram_cifrado_kilobytes"), "#27ae60"),
+            ("Descifrado", serie(resultados_benchmark, "ram_descifrado_kilobytes"), "#f39c12"),
+        ],
+        "RAM (KB)",
+        "Uso de RAM (KB) - Menor es Mejor para IoT",
+        "{:.2f}",
+    )
+    ejes_subgraficos[1].set_ylim(bottom=0)
+    guardar_figura(ruta_archivo_salida)
+
+
+# nombre del gráfico -> (métrica requerida, función, archivo PNG)
+GRAFICOS = {
+    "latencia": ("latencia", generar_grafico_latencia, "latency_benchmark.png"),
+    "rendimiento": ("rendimiento", generar_grafico_rendimiento, "throughput_benchmark.png"),
+    "potencia": ("potencia", generar_grafico_potencia, "power_benchmark.png"),
+    "memoria": ("memoria", generar_grafico_memoria, "memory_benchmark.png"),
+    "ram": ("memoria", generar_grafico_ram, "ram_benchmark.png"),
+}
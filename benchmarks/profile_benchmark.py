@@ -0,0 +1,61 @@
+"""
+Perfil por Primitiva para Algoritmos de Criptografía Ligera
+Cifra y descifra una carga útil con la instrumentación de algorithms/utils/perfilador.py
+activa, imprime una tabla por primitiva (llamadas, tiempo total y propio) y escribe
+las pilas colapsadas en results/profile_<algoritmo>.folded, listas para
+flamegraph.pl o speedscope.
+
+La envoltura de cada llamada cuesta del orden de un microsegundo, así que los
+tiempos absolutos quedan inflados; las proporciones entre primitivas son lo útil.
+
+Uso:
+    python benchmarks/profile_benchmark.py
+    python benchmarks/profile_benchmark.py --algoritmos PRESENT-80/bitslice --archivo long_message.txt
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+RUTA_RAIZ_PROYECTO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RUTA_RAIZ_PROYECTO))
+
+from algorithms.utils.perfilador import perfilar  # noqa: E402
+from benchmarks.harness import ALGORITMOS_POR_DEFECTO, REGISTRO_CIFRADORES, cargar_datos_prueba  # noqa: E402
+
+def perfilar_cifrador(nombre_algoritmo, texto_plano, numero_iteraciones):
+    cifrador = REGISTRO_CIFRADORES[nombre_algoritmo]
+    with perfilar(*cifrador["modulos"]) as perfilador:
+        for _ in range(numero_iteraciones):
+            texto_cifrado = cifrador["cifrar"](texto_plano, cifrador["clave"])
+            cifrador["descifrar"](texto_cifrado, cifrador["clave"])
+    return perfilador
+
+
+def ejecutar_benchmark(algoritmos=ALGORITMOS_POR_DEFECTO, nombre_archivo="medium_message.txt", numero_iteraciones=5,
+                       directorio_salida=RUTA_RAIZ_PROYECTO / "results"):
+    texto_plano = cargar_datos_prueba(nombre_archivo)
+    directorio_salida.mkdir(parents=True, exist_ok=True)
+
+    for nombre_algoritmo in algoritmos:
+        perfilador = perfilar_cifrador(nombre_algoritmo, texto_plano, numero_iteraciones)
+        ruta_archivo_salida = directorio_salida / f"profile_{nombre_algoritmo.replace('/', '_')}.folded"
+        perfilador.escribir_pilas_colapsadas(ruta_archivo_salida)
+        print(f"\n{nombre_algoritmo} ({nombre_archivo}, {numero_iteraciones} iteraciones) -> {ruta_archivo_salida.name}")
+        print(perfilador.tabla_resumen())
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Perfil por primitiva de los cifradores")
+    parser.add_argument("--algoritmos", nargs="+", default=list(ALGORITMOS_POR_DEFECTO), choices=list(REGISTRO_CIFRADORES))
+    parser.add_argument("--archivo", default="medium_message.txt", help="archivo de data/")
+    parser.add_argument("--iteraciones", type=int, default=5)
+    parser.add_argument("--salida", type=Path, default=RUTA_RAIZ_PROYECTO / "results")
+    opciones = parser.parse_args(argumentos)
+
+    ejecutar_benchmark(opciones.algoritmos, opciones.archivo, opciones.iteraciones, opciones.salida)
+    print("SUCCESS")
+
+
+if __name__ == "__main__":
+    main()
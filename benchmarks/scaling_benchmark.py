@@ -0,0 +1,112 @@
+"""
+Benchmark de Escalabilidad Multinúcleo para Algoritmos de Criptografía Ligera
+Compara el cifrado en un solo hilo (AES_cifrar, DES_cifrar, PRESENT_cifrar)
+con GrupoParalelo al variar el número de procesos trabajadores
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+RUTA_RAIZ_PROYECTO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RUTA_RAIZ_PROYECTO))
+
+from algorithms.AES.index import AES128, AES_cifrar  # noqa: E402
+from algorithms.DES.index import DES, DES_cifrar  # noqa: E402
+from algorithms.PRESENT.index import PRESENT80, PRESENT_cifrar  # noqa: E402
+from algorithms.paralelo.index import GrupoParalelo  # noqa: E402
+from algorithms.utils.index import bits_a_bytes  # noqa: E402
+
+
+def cargar_datos_prueba(nombre_archivo="extreme_iot_message.txt", repeticiones=4):
+    with open(RUTA_RAIZ_PROYECTO / "data" / nombre_archivo, "r", encoding="utf-8") as archivo:
+        return archivo.read() * repeticiones
+
+
+def numeros_procesos_a_probar():
+    maximo = os.cpu_count() or 1
+    numeros = [1]
+    while numeros[-1] * 2 <= maximo:
+        numeros.append(numeros[-1] * 2)
+    if numeros[-1] != maximo:
+        numeros.append(maximo)
+    return numeros
+
+
+def medir_escalabilidad(funcion_cifrado, convertir_salida, clase_contexto, texto_plano, clave, numeros_procesos):
+    tiempo_inicio = time.perf_counter()
+    salida_un_hilo = funcion_cifrado(texto_plano, clave)
+    tiempo_un_hilo = time.perf_counter() - tiempo_inicio
+    texto_cifrado_referencia = convertir_salida(salida_un_hilo)
+
+    resultados = {"tiempo_un_hilo_segundos": tiempo_un_hilo, "aceleracion": {}}
+    for numero_procesos in numeros_procesos:
+        with GrupoParalelo(clase_contexto(clave), numero_procesos) as grupo:
+            # Calentamiento: arranca los procesos y les entrega el contexto
+            grupo.cifrar_ecb(texto_plano[:1024])
+
+            # Relleno con ceros, como el cifrado de un solo hilo con el que se compara
+            tiempo_inicio = time.perf_counter()
+            texto_cifrado = grupo.cifrar_ecb(texto_plano, relleno="ceros")
+            tiempo_paralelo = time.perf_counter() - tiempo_inicio
+
+        if texto_cifrado != texto_cifrado_referencia:
+            raise RuntimeError("El cifrado paralelo no coincide con el de un solo hilo")
+        resultados["aceleracion"][numero_procesos] = tiempo_un_hilo / tiempo_paralelo
+
+    return resultados
+
+
+def generar_grafico(resultados_benchmark, numeros_procesos):
+    lista_algoritmos = ["AES-128", "DES", "PRESENT-80"]
+    colores = {"AES-128": "#3498db", "DES": "#e74c3c", "PRESENT-80": "#27ae60"}
+
+    figura, ejes = plt.subplots(figsize=(10, 6))
+    for algoritmo in lista_algoritmos:
+        aceleracion = [resultados_benchmark[algoritmo]["aceleracion"][n] for n in numeros_procesos]
+        ejes.plot(numeros_procesos, aceleracion, marker="o", label=algoritmo, color=colores[algoritmo])
+        for numero_procesos, valor in zip(numeros_procesos, aceleracion):
+            ejes.annotate(f"{valor:.2f}x", xy=(numero_procesos, valor), xytext=(0, 5),
+                          textcoords="offset points", ha="center", va="bottom", fontsize=9)
+
+    ejes.plot(numeros_procesos, numeros_procesos, linestyle="--", color="#7f8c8d", label="Ideal")
+    ejes.set_xlabel("Procesos trabajadores", fontsize=12)
+    ejes.set_ylabel("Aceleración vs. un solo hilo", fontsize=12)
+    ejes.set_title("Escalabilidad Multinúcleo - Mayor es Mejor", fontsize=14)
+    ejes.set_xticks(np.array(numeros_procesos))
+    ejes.legend(loc="upper left")
+
+    plt.tight_layout()
+    ruta_archivo_salida = RUTA_RAIZ_PROYECTO / "results" / "scaling_benchmark.png"
+    ruta_archivo_salida.parent.mkdir(parents=True, exist_ok=True)
+    plt.savefig(ruta_archivo_salida, dpi=150)
+    plt.close()
+
+
+def ejecutar_benchmark():
+    texto_plano = cargar_datos_prueba()
+    numeros_procesos = numeros_procesos_a_probar()
+    configuracion_algoritmos = [
+        ("AES-128", AES_cifrar, bytes, AES128, "ClaveSecreta1234"),
+        ("DES", DES_cifrar, bits_a_bytes, DES, "Clave123"),
+        ("PRESENT-80", PRESENT_cifrar, bits_a_bytes, PRESENT80, "ClavePresent"),
+    ]
+
+    resultados_benchmark = {}
+    for nombre_algoritmo, funcion_cifrado, convertir_salida, clase_contexto, clave in configuracion_algoritmos:
+        resultados_benchmark[nombre_algoritmo] = medir_escalabilidad(
+            funcion_cifrado, convertir_salida, clase_contexto, texto_plano, clave, numeros_procesos
+        )
+        for numero_procesos, valor in resultados_benchmark[nombre_algoritmo]["aceleracion"].items():
+            print(f"{nombre_algoritmo}: {numero_procesos} procesos -> {valor:.2f}x")
+
+    generar_grafico(resultados_benchmark, numeros_procesos)
+    print("SUCCESS")
+
+
+if __name__ == "__main__":
+    ejecutar_benchmark()
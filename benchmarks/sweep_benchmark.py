@@ -0,0 +1,276 @@
+"""
+Barrido de Tamaños de Carga Útil para Algoritmos de Criptografía Ligera
+Mide cada cifrador con todos los archivos de data/ y con cargas generadas de
+tamaño potencia de dos, ajusta un modelo lineal t(n) = costo_fijo + costo_por_byte * n
+por cifrador y dirección, y calcula los tamaños donde un algoritmo pasa a ser más
+rápido que otro.
+
+Uso:
+    python benchmarks/sweep_benchmark.py
+    python benchmarks/sweep_benchmark.py --algoritmos AES-128/tablas DES/enteros PRESENT-80/bitslice \\
+        --tamanio-maximo 4194304 --clave-en-frio
+"""
+
+import argparse
+import csv
+import json
+import statistics
+import sys
+from itertools import combinations
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+RUTA_RAIZ_PROYECTO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RUTA_RAIZ_PROYECTO))
+
+from algorithms.utils.cache import CACHE_CLAVES  # noqa: E402
+from benchmarks.harness import (  # noqa: E402
+    ALGORITMOS_POR_DEFECTO,
+    REGISTRO_CIFRADORES,
+    cargar_datos_prueba,
+    generar_carga_util,
+)
+from benchmarks.timing import VENTANA_CALENTAMIENTO, medir_ensayos  # noqa: E402
+
+ARCHIVOS_DATOS = sorted(ruta.name for ruta in (RUTA_RAIZ_PROYECTO / "data").glob("*.txt"))
+TAMANIO_MINIMO = 16
+TAMANIO_MAXIMO = 1024 * 1024
+# Bytes procesados por ensayo; las cargas grandes se miden con una sola llamada por ensayo
+PRESUPUESTO_BYTES_ENSAYO = 64 * 1024
+NUMERO_ENSAYOS_BARRIDO = 3
+ITERACIONES_PREPARACION_CLAVE = 200
+DIRECCIONES = ("cifrado", "descifrado")
+
+
+def tamanios_potencia_dos(tamanio_minimo=TAMANIO_MINIMO, tamanio_maximo=TAMANIO_MAXIMO):
+    tamanios = []
+    tamanio = tamanio_minimo
+    while tamanio <= tamanio_maximo:
+        tamanios.append(tamanio)
+        tamanio *= 2
+    return tamanios
+
+
+def cargar_cargas_barrido(tamanio_maximo):
+    cargas = [(nombre_archivo, cargar_datos_prueba(nombre_archivo)) for nombre_archivo in ARCHIVOS_DATOS]
+    cargas += [(f"generado_{tamanio}B", generar_carga_util(tamanio)) for tamanio in tamanios_potencia_dos(
+        tamanio_maximo=tamanio_maximo)]
+    return sorted(cargas, key=lambda carga: len(carga[1].encode("utf-8")))
+
+
+def sin_cache(funcion):
+    # Vacía la caché de claves antes de cada llamada para incluir la expansión en el costo fijo
+    def envoltura(*argumentos):
+        CACHE_CLAVES.limpiar()
+        return funcion(*argumentos)
+    return envoltura
+
+
+def medir_preparacion_clave(cifrador):
+    ensayos = medir_ensayos(cifrador["contexto"], (cifrador["clave"],), ITERACIONES_PREPARACION_CLAVE, 5)
+    return statistics.median(ensayos["muestras_segundos"])
+
+
+def medir_punto(cifrador, texto_plano, tamanio_datos_bytes, clave_en_frio, numero_ensayos):
+    funcion_cifrado, funcion_descifrado, clave = cifrador["cifrar"], cifrador["descifrar"], cifrador["clave"]
+    texto_cifrado = funcion_cifrado(texto_plano, clave)
+    iteraciones_por_ensayo = max(PRESUPUESTO_BYTES_ENSAYO // tamanio_datos_bytes, 1)
+    # El barrido tiene muchos puntos: el calentamiento se limita a una ventana, y con
+    # cargas de varios MB a una sola llamada
+    maximo_lotes_calentamiento = VENTANA_CALENTAMIENTO if iteraciones_por_ensayo > 1 else 1
+
+    tiempos = {}
+    for direccion, funcion, entrada in (
+        ("cifrado", funcion_cifrado, texto_plano),
+        ("descifrado", funcion_descifrado, texto_cifrado),
+    ):
+        if clave_en_frio:
+            funcion = sin_cache(funcion)
+        ensayos = medir_ensayos(
+            funcion,
+            (entrada, clave),
+            iteraciones_por_ensayo * numero_ensayos,
+            numero_ensayos,
+            maximo_lotes_calentamiento=maximo_lotes_calentamiento,
+        )
+        tiempos[direccion] = statistics.median(ensayos["muestras_segundos"])
+    return tiempos
+
+
+# Modelo de costos
+
+
+def ajustar_modelo(tamanios, tiempos):
+    # Mínimos cuadrados ponderados por 1/t: minimiza el error relativo, así las cargas
+    # pequeñas (que fijan el costo fijo) pesan lo mismo que las grandes
+    tamanios = np.array(tamanios, dtype=float)
+    tiempos = np.array(tiempos, dtype=float)
+    costo_por_byte, costo_fijo = np.polyfit(tamanios, tiempos, 1, w=1 / tiempos)
+    prediccion = costo_fijo + costo_por_byte * tamanios
+    return {
+        "costo_fijo_segundos": float(costo_fijo),
+        "costo_por_byte_segundos": float(costo_por_byte),
+        "error_relativo_maximo": float(np.max(np.abs(prediccion - tiempos) / tiempos)),
+    }
+
+
+def puntos_cruce(modelos, direccion, tamanio_maximo_medido):
+    cruces = []
+    for algoritmo_a, algoritmo_b in combinations(modelos, 2):
+        modelo_a, modelo_b = modelos[algoritmo_a][direccion], modelos[algoritmo_b][direccion]
+        diferencia_pendiente = modelo_a["costo_por_byte_segundos"] - modelo_b["costo_por_byte_segundos"]
+        if diferencia_pendiente == 0:
+            continue
+        tamanio_cruce = (modelo_b["costo_fijo_segundos"] - modelo_a["costo_fijo_segundos"]) / diferencia_pendiente
+        if tamanio_cruce <= 0:
+            continue
+        # Por encima del cruce gana el de menor costo por byte
+        mas_rapido_encima, mas_rapido_debajo = (
+            (algoritmo_b, algoritmo_a) if diferencia_pendiente > 0 else (algoritmo_a, algoritmo_b)
+        )
+        cruces.append(
+            {
+                "direccion": direccion,
+                "algoritmos": [algoritmo_a, algoritmo_b],
+                "tamanio_bytes": tamanio_cruce,
+                "mas_rapido_debajo": mas_rapido_debajo,
+                "mas_rapido_encima": mas_rapido_encima,
+                "dentro_del_rango_medido": tamanio_cruce <= tamanio_maximo_medido,
+            }
+        )
+    return cruces
+
+
+# Salida
+
+
+def escribir_resultados(informe, directorio_salida):
+    directorio_salida.mkdir(parents=True, exist_ok=True)
+    with open(directorio_salida / "sweep_results.json", "w", encoding="utf-8") as archivo:
+        json.dump(informe, archivo, indent=2, ensure_ascii=False)
+
+    with open(directorio_salida / "sweep_results.csv", "w", encoding="utf-8", newline="") as archivo:
+        escritor = csv.writer(archivo)
+        escritor.writerow(["algoritmo", "direccion", "carga", "tamanio_bytes", "segundos_por_mensaje"])
+        for fila in informe["mediciones"]:
+            for direccion in DIRECCIONES:
+                escritor.writerow(
+                    [fila["algoritmo"], direccion, fila["carga"], fila["tamanio_bytes"], fila["segundos"][direccion]]
+                )
+
+
+def generar_grafico(informe, directorio_salida):
+    figura, ejes_subgraficos = plt.subplots(1, 2, figsize=(14, 6))
+
+    for ejes, direccion in zip(ejes_subgraficos, DIRECCIONES):
+        for algoritmo, modelos in informe["modelos"].items():
+            puntos = [fila for fila in informe["mediciones"] if fila["algoritmo"] == algoritmo]
+            tamanios = np.array([fila["tamanio_bytes"] for fila in puntos], dtype=float)
+            tiempos = np.array([fila["segundos"][direccion] for fila in puntos]) * 1_000_000
+            linea = ejes.plot(tamanios, tiempos, marker="o", linestyle="none", label=algoritmo)[0]
+
+            modelo = modelos[direccion]
+            ajuste = (modelo["costo_fijo_segundos"] + modelo["costo_por_byte_segundos"] * tamanios) * 1_000_000
+            ejes.plot(tamanios, ajuste, linestyle="--", color=linea.get_color())
+
+        ejes.set_xscale("log", base=2)
+        ejes.set_yscale("log")
+        ejes.set_xlabel("Tamaño del mensaje (bytes)", fontsize=12)
+        ejes.set_ylabel("Tiempo por mensaje (µs)", fontsize=12)
+        ejes.set_title(f"Barrido de Tamaños - {direccion.capitalize()}", fontsize=14)
+        ejes.legend(loc="upper left")
+
+    plt.tight_layout()
+    ruta_archivo_salida = directorio_salida / "sweep_benchmark.png"
+    plt.savefig(ruta_archivo_salida, dpi=150)
+    plt.close()
+
+
+def ejecutar_barrido(
+    algoritmos=ALGORITMOS_POR_DEFECTO,
+    tamanio_maximo=TAMANIO_MAXIMO,
+    clave_en_frio=False,
+    numero_ensayos=NUMERO_ENSAYOS_BARRIDO,
+    directorio_salida=RUTA_RAIZ_PROYECTO / "results",
+):
+    cargas = cargar_cargas_barrido(tamanio_maximo)
+    mediciones = []
+    modelos = {}
+    for algoritmo in algoritmos:
+        cifrador = REGISTRO_CIFRADORES[algoritmo]
+        puntos = []
+        for nombre_carga, texto_plano in cargas:
+            tamanio_datos_bytes = len(texto_plano.encode("utf-8"))
+            segundos = medir_punto(cifrador, texto_plano, tamanio_datos_bytes, clave_en_frio, numero_ensayos)
+            puntos.append((tamanio_datos_bytes, segundos))
+            mediciones.append(
+                {"algoritmo": algoritmo, "carga": nombre_carga, "tamanio_bytes": tamanio_datos_bytes, "segundos": segundos}
+            )
+
+        tamanio_bloque = cifrador["contexto"](cifrador["clave"]).TAMANIO_BLOQUE
+        modelos[algoritmo] = {"preparacion_clave_segundos": medir_preparacion_clave(cifrador)}
+        for direccion in DIRECCIONES:
+            modelo = ajustar_modelo([tamanio for tamanio, _ in puntos], [segundos[direccion] for _, segundos in puntos])
+            modelo["costo_por_bloque_segundos"] = modelo["costo_por_byte_segundos"] * tamanio_bloque
+            modelos[algoritmo][direccion] = modelo
+
+    tamanio_maximo_medido = max(fila["tamanio_bytes"] for fila in mediciones)
+    informe = {
+        "parametros": {
+            "algoritmos": list(algoritmos),
+            "tamanio_maximo": tamanio_maximo,
+            "clave_en_frio": clave_en_frio,
+            "ensayos": numero_ensayos,
+        },
+        "mediciones": mediciones,
+        "modelos": modelos,
+        "cruces": [cruce for direccion in DIRECCIONES for cruce in puntos_cruce(modelos, direccion, tamanio_maximo_medido)],
+    }
+    escribir_resultados(informe, directorio_salida)
+    generar_grafico(informe, directorio_salida)
+    return informe
+
+
+def imprimir_resumen(informe):
+    for algoritmo, modelos in informe["modelos"].items():
+        print(f"{algoritmo}: preparación de clave {modelos['preparacion_clave_segundos'] * 1e6:.1f} µs")
+        for direccion in DIRECCIONES:
+            modelo = modelos[direccion]
+            print(
+                f"  {direccion}: fijo {modelo['costo_fijo_segundos'] * 1e6:.1f} µs, "
+                f"{modelo['costo_por_byte_segundos'] * 1e6:.4f} µs/byte, "
+                f"{modelo['costo_por_bloque_segundos'] * 1e6:.3f} µs/bloque "
+                f"(error máx. {modelo['error_relativo_maximo']:.1%})"
+            )
+    for cruce in informe["cruces"]:
+        rango = "" if cruce["dentro_del_rango_medido"] else " (extrapolado)"
+        print(
+            f"{cruce['direccion']}: {cruce['mas_rapido_debajo']} gana hasta {cruce['tamanio_bytes']:.0f} B, "
+            f"después {cruce['mas_rapido_encima']}{rango}"
+        )
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Barrido de tamaños de carga útil con modelo de costos")
+    parser.add_argument("--algoritmos", nargs="+", default=list(ALGORITMOS_POR_DEFECTO), choices=list(REGISTRO_CIFRADORES))
+    parser.add_argument("--tamanio-maximo", type=int, default=TAMANIO_MAXIMO, help="mayor carga generada, en bytes")
+    parser.add_argument("--ensayos", type=int, default=NUMERO_ENSAYOS_BARRIDO)
+    parser.add_argument("--clave-en-frio", action="store_true", help="expande la clave en cada llamada")
+    parser.add_argument("--salida", type=Path, default=RUTA_RAIZ_PROYECTO / "results")
+    opciones = parser.parse_args(argumentos)
+
+    informe = ejecutar_barrido(
+        algoritmos=opciones.algoritmos,
+        tamanio_maximo=opciones.tamanio_maximo,
+        clave_en_frio=opciones.clave_en_frio,
+        numero_ensayos=opciones.ensayos,
+        directorio_salida=opciones.salida,
+    )
+    imprimir_resumen(informe)
+    print("SUCCESS")
+
+
+if __name__ == "__main__":
+    main()
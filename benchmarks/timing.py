@@ -0,0 +1,159 @@
+"""
+Motor de Medición de Tiempos para los Benchmarks de Criptografía Ligera
+Ejecuta ensayos independientes tras un calentamiento que se detiene cuando los
+tiempos se estabilizan o cuando ha costado la mitad de los ensayos, y resume las muestras con mediana, desviación estándar e
+intervalos de confianza bootstrap entre ensayos, y percentiles de cola por llamada.
+"""
+
+import gc
+import random
+import statistics
+import time
+
+NUMERO_ENSAYOS = 10
+MAXIMO_LOTES_CALENTAMIENTO = 20
+# Los lotes de calentamiento tienen el tamaño de un ensayo: como mucho esta fracción de
+# los ensayos, para que calentar no cueste más que medir
+FRACCION_CALENTAMIENTO = 0.5
+# Ventana de lotes de calentamiento cuya dispersión relativa debe quedar bajo la tolerancia
+VENTANA_CALENTAMIENTO = 3
+TOLERANCIA_CALENTAMIENTO = 0.05
+# La pasada de muestras por llamada usa como mucho esta fracción del tiempo de los ensayos
+FRACCION_TIEMPO_LLAMADAS = 0.5
+NIVEL_CONFIANZA = 0.95
+NUMERO_REMUESTREOS = 2000
+
+
+def ejecutar_lote(funcion, argumentos, numero_iteraciones):
+    tiempo_real_inicio = time.perf_counter()
+    tiempo_cpu_inicio = time.process_time()
+    for _ in range(numero_iteraciones):
+        funcion(*argumentos)
+    tiempo_cpu = time.process_time() - tiempo_cpu_inicio
+    return time.perf_counter() - tiempo_real_inicio, tiempo_cpu
+
+
+def calentar(funcion, argumentos, numero_iteraciones, maximo_lotes=MAXIMO_LOTES_CALENTAMIENTO,
+             ventana=VENTANA_CALENTAMIENTO, tolerancia=TOLERANCIA_CALENTAMIENTO):
+    """Run warm-up batches until the last `ventana` batch times agree within `tolerancia`.
+
+    Returns the number of warm-up batches executed.
+    """
+    tiempos = []
+    while len(tiempos) < maximo_lotes:
+        tiempos.append(ejecutar_lote(funcion, argumentos, numero_iteraciones)[0])
+        recientes = tiempos[-ventana:]
+        if len(recientes) == ventana and (max(recientes) - min(recientes)) <= tolerancia * min(recientes):
+            break
+    return len(tiempos)
+
+
+def muestrear_llamadas(funcion, argumentos, maximo_llamadas, presupuesto_segundos):
+    """Wall time of individual calls, until `maximo_llamadas` or `presupuesto_segundos` is reached (at least one)"""
+    tiempos = []
+    fin = time.perf_counter() + presupuesto_segundos
+    while len(tiempos) < maximo_llamadas:
+        inicio = time.perf_counter()
+        funcion(*argumentos)
+        final = time.perf_counter()
+        tiempos.append(final - inicio)
+        if final >= fin:
+            break
+    return tiempos
+
+
+def medir_ensayos(funcion, argumentos, numero_iteraciones, numero_ensayos=NUMERO_ENSAYOS, desactivar_gc=False,
+                  maximo_lotes_calentamiento=MAXIMO_LOTES_CALENTAMIENTO, medidor_energia=None,
+                  muestras_por_llamada=False):
+    """Time `numero_ensayos` independent trials of `numero_iteraciones` calls each.
+
+    Each sample is the mean wall time of one call within its trial. With
+    `muestras_por_llamada`, per-call times for tail percentiles come from a separate
+    pass after the trials, so timing each call does not inflate the trial totals. With a
+    `medidor_energia` (benchmarks/energy.py) the energy of the timed trials is
+    added up per domain, in microjoules.
+    """
+    iteraciones_por_ensayo = max(numero_iteraciones // numero_ensayos, 1)
+    maximo_lotes = min(maximo_lotes_calentamiento, max(int(FRACCION_CALENTAMIENTO * numero_ensayos), 1))
+    lotes_calentamiento = calentar(funcion, argumentos, iteraciones_por_ensayo, maximo_lotes)
+
+    muestras = []
+    tiempo_real_total = tiempo_cpu_total = 0.0
+    energia = {}
+    gc_activo = gc.isenabled()
+    for _ in range(numero_ensayos):
+        if desactivar_gc:
+            gc.collect()
+            gc.disable()
+        try:
+            if medidor_energia is not None:
+                lectura_inicio = medidor_energia.leer()
+            tiempo_real, tiempo_cpu = ejecutar_lote(funcion, argumentos, iteraciones_por_ensayo)
+            if medidor_energia is not None:
+                for dominio, valor in medidor_energia.diferencia(lectura_inicio, medidor_energia.leer()).items():
+                    energia[dominio] = energia.get(dominio, 0) + valor
+        finally:
+            if desactivar_gc and gc_activo:
+                gc.enable()
+        muestras.append(tiempo_real / iteraciones_por_ensayo)
+        tiempo_real_total += tiempo_real
+        tiempo_cpu_total += tiempo_cpu
+
+    muestras_llamadas = None
+    if muestras_por_llamada:
+        muestras_llamadas = muestrear_llamadas(
+            funcion, argumentos, iteraciones_por_ensayo * numero_ensayos, FRACCION_TIEMPO_LLAMADAS * tiempo_real_total
+        )
+    return {
+        "muestras_segundos": muestras,
+        "muestras_llamadas_segundos": muestras_llamadas,
+        "iteraciones": iteraciones_por_ensayo * numero_ensayos,
+        "tiempo_real_segundos": tiempo_real_total,
+        "tiempo_cpu_segundos": tiempo_cpu_total,
+        "lotes_calentamiento": lotes_calentamiento,
+        "energia_microjulios": energia if medidor_energia is not None else None,
+    }
+
+
+# Estadísticos
+
+
+def percentil(muestras_ordenadas, fraccion):
+    # Interpolación lineal entre las dos muestras vecinas
+    posicion = (len(muestras_ordenadas) - 1) * fraccion
+    inferior = int(posicion)
+    superior = min(inferior + 1, len(muestras_ordenadas) - 1)
+    peso = posicion - inferior
+    return muestras_ordenadas[inferior] * (1 - peso) + muestras_ordenadas[superior] * peso
+
+
+def intervalo_bootstrap(muestras, estadistico=statistics.fmean, nivel_confianza=NIVEL_CONFIANZA,
+                        numero_remuestreos=NUMERO_REMUESTREOS, semilla=0):
+    """Percentile bootstrap confidence interval of `estadistico` over `muestras`"""
+    generador = random.Random(semilla)
+    n = len(muestras)
+    estimaciones = sorted(
+        estadistico(generador.choices(muestras, k=n)) for _ in range(numero_remuestreos)
+    )
+    alfa = (1 - nivel_confianza) / 2
+    return percentil(estimaciones, alfa), percentil(estimaciones, 1 - alfa)
+
+
+def resumir_muestras(muestras, muestras_llamadas, nivel_confianza=NIVEL_CONFIANZA):
+    """Summarize per-trial means (`muestras`) and per-call times (`muestras_llamadas`).
+
+    Mean, median, deviation and confidence interval describe the trials; p95 and
+    p99 are tail latencies over the individual calls.
+    """
+    ordenadas = sorted(muestras)
+    llamadas_ordenadas = sorted(muestras_llamadas)
+    ic_inferior, ic_superior = intervalo_bootstrap(ordenadas, nivel_confianza=nivel_confianza)
+    return {
+        "media": statistics.fmean(ordenadas),
+        "mediana": statistics.median(ordenadas),
+        "p95": percentil(llamadas_ordenadas, 0.95),
+        "p99": percentil(llamadas_ordenadas, 0.99),
+        "desviacion": statistics.stdev(ordenadas) if len(ordenadas) > 1 else 0.0,
+        "ic_inferior": ic_inferior,
+        "ic_superior": ic_superior,
+    }
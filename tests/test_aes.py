@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from algorithms.AES.index import AES128, MOTORES
+
+# FIPS-197, apéndice C.1
+CLAVE_FIPS = bytes(range(16))
+TEXTO_PLANO_FIPS = bytes.fromhex("00112233445566778899aabbccddeeff")
+TEXTO_CIFRADO_FIPS = bytes.fromhex("69c4e0d86a7b0430d8cdb78070b4c55a")
+
+
+def casos_aleatorios(numero_casos=50):
+    generador = random.Random(2024)
+    return [(generador.randbytes(16), generador.randbytes(16)) for _ in range(numero_casos)]
+
+
+@pytest.mark.parametrize("motor", MOTORES)
+def test_vector_fips_197(motor):
+    contexto = AES128(CLAVE_FIPS, motor)
+    assert contexto.cifrar_bloque(TEXTO_PLANO_FIPS) == TEXTO_CIFRADO_FIPS
+    assert contexto.descifrar_bloque(TEXTO_CIFRADO_FIPS) == TEXTO_PLANO_FIPS
+
+
+@pytest.mark.parametrize("motor", MOTORES)
+def test_motor_coincide_con_referencia(motor):
+    for clave, bloque in casos_aleatorios():
+        referencia = AES128(clave)
+        contexto = AES128(clave, motor)
+        texto_cifrado = referencia.cifrar_bloque(bloque)
+        assert contexto.cifrar_bloque(bloque) == texto_cifrado
+        assert contexto.descifrar_bloque(texto_cifrado) == bloque
+        assert contexto.descifrar_bloque(bloque) == referencia.descifrar_bloque(bloque)
+
+
+@pytest.mark.parametrize("motor", MOTORES)
+def test_mensajes_con_relleno(motor):
+    clave, _ = casos_aleatorios(1)[0]
+    for longitud in (0, 1, 15, 16, 17, 100):
+        datos = bytes(range(longitud))
+        texto_cifrado = AES128(clave, motor).cifrar(datos)
+        assert texto_cifrado == AES128(clave).cifrar(datos)
+        assert AES128(clave, motor).descifrar(texto_cifrado) == datos.ljust(len(texto_cifrado), b"\x00")
+
+
+# Uno, dos y varios bloques: al_vuelo deriva las claves de ronda dentro de cada bloque
+@pytest.mark.parametrize("numero_bloques", [1, 2, 3, 17])
+def test_al_vuelo_coincide_con_tablas(numero_bloques):
+    generador = random.Random(numero_bloques)
+    for clave, _ in casos_aleatorios(5):
+        datos = generador.randbytes(16 * numero_bloques)
+        tablas = AES128(clave, "tablas")
+        contexto = AES128(clave, "al_vuelo")
+        texto_cifrado = tablas.cifrar(datos)
+        assert contexto.cifrar(datos) == texto_cifrado
+        assert contexto.descifrar(texto_cifrado) == datos
+        assert contexto.descifrar(datos) == tablas.descifrar(datos)
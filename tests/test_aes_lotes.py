@@ -0,0 +1,35 @@
+import random
+
+import pytest
+
+from algorithms.AES.index import AES128, aes_cifrar_bloque, compactar_claves_estado, expansion_clave
+from algorithms.AES.lotes import AES128Lotes, AES_cifrar_lotes, AES_descifrar_lotes
+
+GENERADOR = random.Random(2024)
+CLAVES = [GENERADOR.randbytes(16) for _ in range(5)]
+
+
+@pytest.mark.parametrize("clave", CLAVES)
+def test_bloques_coinciden_con_aes_cifrar_bloque(clave):
+    claves_ronda = compactar_claves_estado(expansion_clave(clave))
+    bloques = [GENERADOR.randbytes(16) for _ in range(32)]
+    texto_cifrado = AES128Lotes(clave).cifrar(b"".join(bloques))
+    assert texto_cifrado == b"".join(bytes(aes_cifrar_bloque(bloque, claves_ronda)) for bloque in bloques)
+    assert AES128Lotes(clave).descifrar(texto_cifrado) == b"".join(bloques)
+
+
+@pytest.mark.parametrize("longitud", [0, 1, 15, 16, 17, 31, 32, 100])
+def test_mensajes_con_relleno_coinciden_con_referencia(longitud):
+    clave = CLAVES[0]
+    datos = GENERADOR.randbytes(longitud)
+    referencia = AES128(clave)
+    texto_cifrado = AES128Lotes(clave).cifrar(datos)
+    assert texto_cifrado == referencia.cifrar(datos)
+    assert AES128Lotes(clave).descifrar(texto_cifrado) == referencia.descifrar(texto_cifrado)
+
+
+def test_funciones_del_arnes():
+    texto_plano = "Mensaje de prueba para el arnés"
+    texto_cifrado = AES_cifrar_lotes(texto_plano, "ClaveSecreta1234")
+    assert bytes(texto_cifrado) == AES128("ClaveSecreta1234").cifrar(texto_plano)
+    assert bytes(AES_descifrar_lotes(texto_cifrado, "ClaveSecreta1234")).rstrip(b"\x00") == texto_plano.encode("latin-1")
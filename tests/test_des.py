@@ -0,0 +1,67 @@
+import random
+
+import pytest
+
+from algorithms.DES.index import DES, des_cifrar_bloque, generar_claves_ronda, preparar_clave
+from algorithms.utils.index import bits_a_bytes, bytes_a_bits
+
+# Vectores de la implementación original (DES_cifrar bit a bit), no los de FIPS 46-3:
+# esta versión de DES no reproduce el ejemplo clásico 85E813540F0AB405
+VECTORES = [
+    ("133457799bbcdff1", "0123456789abcdef", "a438f58d40a0a1f7"),
+    ("0000000000000000", "0000000000000000", "329a949a01605eec"),
+    ("436c617665313233", "4d656e73616a6531", "ba1ae1dc98de000b"),
+]
+
+GENERADOR = random.Random(2024)
+# Claves de 8 bytes y también cortas (se rellenan con ceros) y largas (se truncan)
+CLAVES = [GENERADOR.randbytes(longitud) for longitud in (8, 8, 1, 5, 7, 9, 12)]
+
+
+def cifrar_bloque_base(bloque, clave):
+    claves_ronda = generar_claves_ronda(bytes_a_bits(preparar_clave(clave)))
+    return bits_a_bytes(des_cifrar_bloque(bytes_a_bits(bloque), claves_ronda))
+
+
+@pytest.mark.parametrize("motor", ["referencia", "enteros"])
+@pytest.mark.parametrize("clave, texto_plano, texto_cifrado", VECTORES)
+def test_vectores(motor, clave, texto_plano, texto_cifrado):
+    contexto = DES(bytes.fromhex(clave), motor)
+    assert contexto.cifrar_bloque(bytes.fromhex(texto_plano)) == bytes.fromhex(texto_cifrado)
+    assert contexto.descifrar_bloque(bytes.fromhex(texto_cifrado)) == bytes.fromhex(texto_plano)
+
+
+@pytest.mark.parametrize("clave", CLAVES)
+def test_enteros_coincide_con_des_cifrar_bloque(clave):
+    contexto = DES(clave, "enteros")
+    for _ in range(20):
+        bloque = GENERADOR.randbytes(8)
+        texto_cifrado = cifrar_bloque_base(bloque, clave)
+        assert contexto.cifrar_bloque(bloque) == texto_cifrado
+        assert contexto.descifrar_bloque(texto_cifrado) == bloque
+
+
+@pytest.mark.parametrize("clave", CLAVES)
+@pytest.mark.parametrize("longitud", [0, 1, 8, 15, 64])
+def test_enteros_coincide_con_referencia(clave, longitud):
+    datos = GENERADOR.randbytes(longitud)
+    referencia = DES(clave)
+    contexto = DES(clave, "enteros")
+    texto_cifrado = referencia.cifrar(datos)
+    assert contexto.cifrar(datos) == texto_cifrado
+    assert contexto.descifrar(texto_cifrado) == referencia.descifrar(texto_cifrado)
+
+
+# El descifrado al_vuelo recorre el calendario de claves hacia atrás
+@pytest.mark.parametrize("clave", CLAVES)
+@pytest.mark.parametrize("numero_bloques", [1, 2, 3, 9])
+def test_al_vuelo_coincide_con_enteros(clave, numero_bloques):
+    datos = GENERADOR.randbytes(8 * numero_bloques)
+    enteros = DES(clave, "enteros")
+    contexto = DES(clave, "al_vuelo")
+    texto_cifrado = enteros.cifrar(datos)
+    assert contexto.cifrar(datos) == texto_cifrado
+    assert contexto.descifrar(texto_cifrado) == datos
+    assert contexto.descifrar(datos) == enteros.descifrar(datos)
+    assert contexto.cifrar_bloque(datos[:8]) == enteros.cifrar_bloque(datos[:8])
+    assert contexto.descifrar_bloque(datos[:8]) == enteros.descifrar_bloque(datos[:8])
@@ -0,0 +1,62 @@
+import random
+
+import numpy as np
+import pytest
+
+from algorithms.AES.index import expansion_clave
+from algorithms.AES.lotes import AES128Lotes, claves_ronda_a_matriz, expandir_claves_lote as aes_expandir_claves_lote
+from algorithms.DES.index import DES, claves_ronda_a_fragmentos, generar_claves_ronda
+from algorithms.DES.index import preparar_clave as des_preparar_clave
+from algorithms.DES.lotes import expandir_claves_lote as des_expandir_claves_lote
+from algorithms.PRESENT.index import PRESENT80, expandir_registro_clave, preparar_clave as present_preparar_clave
+from algorithms.PRESENT.lotes import expandir_claves_lote as present_expandir_claves_lote
+from algorithms.utils.index import bytes_a_bits
+
+GENERADOR = random.Random(2024)
+
+
+def lote_claves(numero_claves, longitud):
+    return np.frombuffer(GENERADOR.randbytes(numero_claves * longitud), dtype=np.uint8).reshape(-1, longitud)
+
+
+def test_aes_expandir_claves_lote():
+    claves = lote_claves(50, 16)
+    esperado = np.array([claves_ronda_a_matriz(expansion_clave(bytes(clave))) for clave in claves], dtype=np.uint8)
+    expandidas = aes_expandir_claves_lote(claves)
+    assert np.array_equal(expandidas, esperado)
+    assert np.array_equal(expandidas[0], AES128Lotes(bytes(claves[0])).claves_ronda)
+
+
+# Claves de 8 bytes y también cortas (se rellenan con ceros) y largas (se truncan)
+@pytest.mark.parametrize("longitud", [8, 1, 5, 7, 9, 12])
+def test_des_expandir_claves_lote(longitud):
+    claves = lote_claves(50, longitud)
+    esperado = np.array(
+        [
+            claves_ronda_a_fragmentos(generar_claves_ronda(bytes_a_bits(des_preparar_clave(bytes(clave)))))
+            for clave in claves
+        ],
+        dtype=np.uint8,
+    )
+    expandidas = des_expandir_claves_lote(claves)
+    assert np.array_equal(expandidas, esperado)
+    assert bytearray(expandidas[0]) == DES(bytes(claves[0]), "enteros").claves_ronda
+
+
+@pytest.mark.parametrize("longitud", [10, 1, 4, 9])
+def test_present_expandir_claves_lote(longitud):
+    claves = lote_claves(50, longitud)
+    esperado = np.array(
+        [expandir_registro_clave(int.from_bytes(present_preparar_clave(bytes(clave)), "big")) for clave in claves],
+        dtype=np.uint64,
+    )
+    expandidas = present_expandir_claves_lote(claves)
+    assert np.array_equal(expandidas, esperado)
+    assert list(expandidas[0]) == list(PRESENT80(bytes(claves[0])).claves_ronda)
+
+
+# Las claves de más de 80 bits entran completas al registro y no caben en el lote
+@pytest.mark.parametrize("forma", [(4, 11), (4, 12), (10,)])
+def test_present_expandir_claves_lote_rechaza_formas(forma):
+    with pytest.raises(ValueError):
+        present_expandir_claves_lote(np.zeros(forma, dtype=np.uint8))
@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from algorithms.AES.index import AES128
+from algorithms.AES.lotes import AES128Lotes, aes_cifrar_multiclave, aes_descifrar_multiclave
+from algorithms.PRESENT.bitslice import (
+    present_cifrar_bloques_bitslice_multiclave,
+    present_descifrar_bloques_bitslice_multiclave,
+)
+from algorithms.PRESENT.index import PRESENT80
+from algorithms.PRESENT.lotes import empaquetar_claves_carriles, present_cifrar_multiclave, present_descifrar_multiclave
+
+GENERADOR = random.Random(2024)
+# Mensajes vacíos, de menos de un bloque, de bloques exactos y con relleno, en el mismo lote
+LONGITUDES = [0, 1, 8, 15, 16, 17, 0, 40, 64, 100]
+
+
+def lote_mensajes(longitud_clave):
+    return [(GENERADOR.randbytes(longitud_clave), GENERADOR.randbytes(longitud)) for longitud in LONGITUDES]
+
+
+def test_aes_multiclave_coincide_con_contextos():
+    mensajes = lote_mensajes(16)
+    textos_cifrados = aes_cifrar_multiclave([(AES128Lotes(clave).claves_ronda, datos) for clave, datos in mensajes])
+    assert textos_cifrados == [AES128(clave).cifrar(datos) for clave, datos in mensajes]
+
+    textos_descifrados = aes_descifrar_multiclave(
+        [(AES128Lotes(clave).claves_ronda, texto) for (clave, _), texto in zip(mensajes, textos_cifrados)]
+    )
+    assert textos_descifrados == [
+        AES128(clave).descifrar(texto) for (clave, _), texto in zip(mensajes, textos_cifrados)
+    ]
+
+
+@pytest.mark.parametrize("motor", ["referencia", "bitslice", "tablas"])
+def test_present_multiclave_coincide_con_contextos(motor):
+    mensajes = lote_mensajes(10)
+    textos_cifrados = present_cifrar_multiclave(
+        [(PRESENT80(clave, motor).claves_ronda, datos) for clave, datos in mensajes]
+    )
+    assert textos_cifrados == [PRESENT80(clave).cifrar(datos) for clave, datos in mensajes]
+
+    textos_descifrados = present_descifrar_multiclave(
+        [(PRESENT80(clave, motor).claves_ronda, texto) for (clave, _), texto in zip(mensajes, textos_cifrados)]
+    )
+    assert textos_descifrados == [
+        PRESENT80(clave).descifrar(texto) for (clave, _), texto in zip(mensajes, textos_cifrados)
+    ]
+
+
+def test_multiclave_solo_mensajes_vacios():
+    assert aes_cifrar_multiclave([(AES128Lotes(bytes(16)).claves_ronda, b"")] * 3) == [b""] * 3
+    assert present_cifrar_multiclave([(PRESENT80(bytes(10)).claves_ronda, b"")] * 3) == [b""] * 3
+    assert present_cifrar_multiclave([]) == []
+
+
+def test_present_multiclave_rechaza_claves_al_vuelo():
+    with pytest.raises(ValueError):
+        present_cifrar_multiclave([(PRESENT80(bytes(10), "al_vuelo").claves_ronda, b"mensaje")])
+
+
+# Un carril por bloque, cada uno con su clave; también más de 64 carriles
+@pytest.mark.parametrize("numero_bloques", [1, 2, 9, 64, 70])
+def test_bitslice_multiclave_coincide_por_bloque(numero_bloques):
+    contextos = [PRESENT80(GENERADOR.randbytes(10)) for _ in range(numero_bloques)]
+    bloques = [GENERADOR.getrandbits(64) for _ in range(numero_bloques)]
+    rebanadas_claves = empaquetar_claves_carriles([contexto.claves_ronda for contexto in contextos])
+
+    textos_cifrados = present_cifrar_bloques_bitslice_multiclave(bloques, rebanadas_claves)
+    assert textos_cifrados == [
+        contexto.cifrar_entero(bloque, contexto.claves_ronda) for contexto, bloque in zip(contextos, bloques)
+    ]
+    assert present_descifrar_bloques_bitslice_multiclave(textos_cifrados, rebanadas_claves) == bloques
@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from algorithms.PRESENT.index import MAXIMO_BLOQUES_SIN_TABLAS, MOTORES, PRESENT80
+
+# Vectores de la implementación original (PRESENT_cifrar bloque a bloque), no los del
+# artículo de PRESENT: esta versión no reproduce 5579c1387b228445 para clave y bloque nulos
+VECTORES = [
+    ("00000000000000000000", "0000000000000000", "8f34ea165166ffb8"),
+    ("ffffffffffffffffffff", "0000000000000000", "f6d6c609844edeb1"),
+    ("00000000000000000000", "ffffffffffffffff", "e77d755c66a591c9"),
+    ("ffffffffffffffffffff", "ffffffffffffffff", "5c21ceab226b0de8"),
+    ("0123456789abcdef0123", "0011223344556677", "a9238c8b19b560a8"),
+    # Clave de 9 bytes, rellenada con ceros hasta 80 bits
+    ("436c61766550726573", "4d656e73616a6531", "acc514ce02d0454c"),
+]
+
+GENERADOR = random.Random(2024)
+CLAVES = [GENERADOR.randbytes(10) for _ in range(5)]
+
+
+@pytest.mark.parametrize("motor", list(MOTORES))
+@pytest.mark.parametrize("clave, texto_plano, texto_cifrado", VECTORES)
+def test_vectores(motor, clave, texto_plano, texto_cifrado):
+    contexto = PRESENT80(bytes.fromhex(clave), motor)
+    assert contexto.cifrar_bloque(bytes.fromhex(texto_plano)) == bytes.fromhex(texto_cifrado)
+    assert contexto.descifrar_bloque(bytes.fromhex(texto_cifrado)) == bytes.fromhex(texto_plano)
+
+
+@pytest.mark.parametrize("clave", CLAVES)
+@pytest.mark.parametrize("numero_bloques", [1, 2, 7, 64, 65])
+def test_tablas_coincide_con_referencia(clave, numero_bloques):
+    datos = GENERADOR.randbytes(8 * numero_bloques)
+    referencia = PRESENT80(clave)
+    contexto = PRESENT80(clave, "tablas")
+    texto_cifrado = referencia.cifrar(datos)
+    assert contexto.cifrar(datos) == texto_cifrado
+    assert contexto.descifrar(texto_cifrado) == datos
+    assert contexto.cifrar_bloque(datos[:8]) == referencia.cifrar_bloque(datos[:8])
+    assert contexto.descifrar_bloque(datos[:8]) == referencia.descifrar_bloque(datos[:8])
+
+
+@pytest.mark.parametrize("clave", CLAVES)
+@pytest.mark.parametrize("numero_bloques", [1, 2, 7, 64, 65])
+def test_bitslice_coincide_con_referencia(clave, numero_bloques):
+    datos = GENERADOR.randbytes(8 * numero_bloques)
+    referencia = PRESENT80(clave)
+    contexto = PRESENT80(clave, "bitslice")
+    texto_cifrado = referencia.cifrar(datos)
+    assert contexto.cifrar(datos) == texto_cifrado
+    assert contexto.descifrar(texto_cifrado) == datos
+    assert contexto.descifrar(datos) == referencia.descifrar(datos)
+
+
+@pytest.mark.parametrize("clave", CLAVES)
+def test_bitslice_bloque_suelto(clave):
+    bloque = GENERADOR.randbytes(8)
+    referencia = PRESENT80(clave)
+    contexto = PRESENT80(clave, "bitslice")
+    assert contexto.cifrar_bloque(bloque) == referencia.cifrar_bloque(bloque)
+    assert contexto.descifrar_bloque(bloque) == referencia.descifrar_bloque(bloque)
+
+
+# Claves de menos y de más de 80 bits; el descifrado al_vuelo cambia de camino
+# por encima de MAXIMO_BLOQUES_SIN_TABLAS
+@pytest.mark.parametrize("longitud_clave", [8, 10, 12])
+@pytest.mark.parametrize("numero_bloques", [1, MAXIMO_BLOQUES_SIN_TABLAS, MAXIMO_BLOQUES_SIN_TABLAS + 1, 9])
+def test_al_vuelo_coincide_con_tablas(longitud_clave, numero_bloques):
+    clave = GENERADOR.randbytes(longitud_clave)
+    datos = GENERADOR.randbytes(8 * numero_bloques)
+    tablas = PRESENT80(clave, "tablas")
+    contexto = PRESENT80(clave, "al_vuelo")
+    texto_cifrado = tablas.cifrar(datos)
+    assert contexto.cifrar(datos) == texto_cifrado
+    assert contexto.descifrar(texto_cifrado) == datos
+    assert contexto.descifrar(datos) == tablas.descifrar(datos)
+    assert contexto.cifrar_bloque(datos[:8]) == tablas.cifrar_bloque(datos[:8])
+    assert contexto.descifrar_bloque(datos[:8]) == tablas.descifrar_bloque(datos[:8])